@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru scrierea rapoartelor Excel
+Compară pd.ExcelWriter cu openpyxl (varianta inițială, format aplicat celulă cu celulă)
+cu scrierea streaming prin xlsxwriter (constant_memory, formate pe coloană), pe o foaie
+Detaliat sintetică. Timpul și memoria maximă (peak RSS) se măsoară într-un proces separat.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmark_master_loader import _peak_rss_mb
+
+DIMENSIUNI_IMPLICITE = [100_000, 500_000]
+
+
+def genereaza_detaliat(nr_randuri, seed=42):
+    """DataFrame cu structura foii Detaliat"""
+    rng = np.random.default_rng(seed)
+    rute = np.array([f"Ruta {i}" for i in range(300)], dtype=object)
+    scanare = pd.Timestamp('2025-08-27') + pd.to_timedelta(rng.integers(0, 86_400, nr_randuri), unit='s')
+    return pd.DataFrame({
+        'CodBare': [f"CB{x:012d}" for x in rng.integers(0, 10**11, nr_randuri)],
+        'Ruta Iesire Centru': rute[rng.integers(0, len(rute), nr_randuri)],
+        'DataScanare Iesire Centru': scanare,
+        'Ruta Intrare Hub': rute[rng.integers(0, len(rute), nr_randuri)],
+        'DataScanare Intrare Centru': scanare + pd.Timedelta(hours=6),
+        'Centru exp': 'BRASOV',
+        'Centru dest': 'SIBIU',
+        'Expeditor': [f"Firma {i}" for i in rng.integers(0, 2000, nr_randuri)],
+        'Destinatar': [f"Client {i}" for i in rng.integers(0, 50_000, nr_randuri)],
+        'bucati': rng.integers(1, 5, nr_randuri).astype(float),
+        'Greutate': rng.integers(1, 500_000, nr_randuri) / 1000,
+        'Categorie': 'Colete',
+        'User': [f"user{i}" for i in rng.integers(0, 100, nr_randuri)],
+        'Data': scanare,
+        'Greutate Medie': rng.integers(1, 100_000, nr_randuri) / 100,
+        'has_scan_iesire': True,
+        'has_scan_intrare': rng.random(nr_randuri) < 0.9,
+    })
+
+
+def _ruleaza_varianta(motor, nr_randuri):
+    """Rulează o singură variantă (apelată în subprocess)"""
+    from report_engine import scrie_raport
+
+    df_detaliat = genereaza_detaliat(nr_randuri)
+    df_sumar = pd.DataFrame({
+        'Ruta': ['Ruta 1', 'Total'], 'Nr Colete': [1, 1], 'Greutate': [1.0, 1.0],
+        'Scan iesire Centru': [1, 1], 'Scan intrare Hub': [1, 1],
+        'Procent Iesire Centru': [1.0, 1.0], 'Procent Intrare Hub': [1.0, 1.0], 'User:': ['', '']
+    })
+    with tempfile.TemporaryDirectory() as director:
+        start = time.perf_counter()
+        scrie_raport(os.path.join(director, 'raport.xlsx'), df_detaliat, df_sumar, motor)
+        durata = time.perf_counter() - start
+    print(json.dumps({'motor': motor, 'secunde': durata, 'peak_rss_mb': _peak_rss_mb()}))
+
+
+def _masoara(motor, nr_randuri):
+    rezultat = subprocess.run(
+        [sys.executable, __file__, '--motor', motor, str(nr_randuri)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(rezultat.stdout.strip().splitlines()[-1])
+
+
+def ruleaza_benchmark(dimensiuni=None):
+    dimensiuni = dimensiuni or DIMENSIUNI_IMPLICITE
+    print(f"{'Rânduri':>10} {'Motor':<11} {'Timp (s)':>9} {'Peak RSS (MB)':>14}")
+    for nr_randuri in dimensiuni:
+        for motor in ('openpyxl', 'xlsxwriter'):
+            r = _masoara(motor, nr_randuri)
+            print(f"{nr_randuri:>10,} {motor:<11} {r['secunde']:>9.1f} {r['peak_rss_mb']:>14.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--motor':
+        _ruleaza_varianta(sys.argv[2], int(sys.argv[3]))
+    else:
+        ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
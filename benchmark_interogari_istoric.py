@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru interogările istoricului (rapoarte_istoric)
+Construiește o bază de date cu schema inițială (un tabel, centrul și ruta ca text, index pe
+data_raport), o migrează la schema curentă (dimensiuni centre/rute, index acoperitor pe
+centru + dată, ANALYZE) și compară pentru interogările folosite la email-uri: planul de execuție
+(EXPLAIN QUERY PLAN), timpul mediu și rezultatele. Afișează și durata migrării și mărimea fișierului.
+"""
+
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmark_istoric import creeaza_baza_v1
+
+ZILE_IMPLICITE = [90, 365]
+
+NR_CENTRE = 40
+RUTE_PE_CENTRU = 50
+DATA_START = '2025-01-01'
+REPETARI = 20
+
+# Interogările schemei inițiale (aceleași rezultate ca interogările curente din email_reporting_system)
+INTEROGARE_ISTORIC_CENTRU_V1 = '''
+    SELECT data_raport, centru, ruta, nr_colete, greutate, procent_iesire_centru, procent_intrare_centru
+    FROM rapoarte_istoric
+    WHERE centru = ? AND data_raport >= ? AND data_raport <= ?
+    ORDER BY data_raport DESC, ruta
+'''
+INTEROGARE_CENTRE_ACTIVE_V1 = '''
+    SELECT DISTINCT centru FROM rapoarte_istoric
+    WHERE data_raport >= ? AND centru != 'NECUNOSCUT'
+    ORDER BY centru
+'''
+INTEROGARE_CENTRE_DISPONIBILE_V1 = '''
+    SELECT DISTINCT centru, COUNT(*) as numar_rute FROM rapoarte_istoric
+    WHERE data_raport >= ? AND data_raport <= ? AND centru != 'NECUNOSCUT'
+    GROUP BY centru ORDER BY centru
+'''
+
+
+def populeaza_v1(db_path, nr_zile, seed=42):
+    """Istoric sintetic: NR_CENTRE centre x RUTE_PE_CENTRU rute, câte un rând pe rută și zi"""
+    rng = np.random.default_rng(seed)
+    creeaza_baza_v1(db_path)
+    centre = [f"CENTRU {i:02d}" for i in range(NR_CENTRE)]
+    rute = [(centru, f"R{i:02d}{j:02d}-SBH") for i, centru in enumerate(centre) for j in range(RUTE_PE_CENTRU)]
+    zile = pd.date_range(DATA_START, periods=nr_zile).strftime('%Y-%m-%d')
+
+    conn = sqlite3.connect(db_path)
+    for zi in zile:
+        conn.executemany('''
+            INSERT INTO rapoarte_istoric
+            (data_raport, hub, tip_raport, centru, ruta, nr_colete,
+             greutate, procent_iesire_centru, procent_intrare_centru)
+            VALUES (?, 'Sibiu', 'Statie-Hub', ?, ?, ?, ?, ?, ?)
+        ''', [
+            (zi, centru, ruta, int(rng.integers(1, 500)), float(rng.integers(100, 100_000)) / 100,
+             float(rng.random()) * 100, float(rng.random()) * 100)
+            for centru, ruta in rute
+        ])
+    conn.commit()
+    conn.close()
+    return list(zile)
+
+
+def _zi_in_urma(zile_date, nr_zile):
+    """Prima zi a ultimelor nr_zile + 1 zile (prima zi din istoric dacă acesta este mai scurt)"""
+    return zile_date[max(-len(zile_date), -(nr_zile + 1))]
+
+
+def _plan(conn, query, params):
+    return [rand[-1] for rand in conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()]
+
+
+def _masoara(conn, query, parametri):
+    """Timpul mediu (ms) pe execuție pentru lista de parametri, și rezultatele primei execuții"""
+    rezultat = conn.execute(query, parametri[0]).fetchall()
+    start = time.perf_counter()
+    for _ in range(REPETARI):
+        for params in parametri:
+            conn.execute(query, params).fetchall()
+    return (time.perf_counter() - start) * 1000 / (REPETARI * len(parametri)), rezultat
+
+
+def ruleaza_benchmark(zile=None):
+    from email_reporting_system import (
+        INTEROGARE_CENTRE_ACTIVE,
+        INTEROGARE_CENTRE_DISPONIBILE,
+        INTEROGARE_ISTORIC_CENTRU,
+        EmailReportingSystem,
+    )
+
+    for nr_zile in zile or ZILE_IMPLICITE:
+        with tempfile.TemporaryDirectory() as director:
+            director += os.sep
+            logging.root.handlers.clear()
+            logging.basicConfig(level=logging.INFO, handlers=[logging.FileHandler(os.path.join(director, 'benchmark.log'))])
+            os.makedirs(os.path.join(director, 'Utile'))
+            db_path = os.path.join(director, 'Utile', 'rapoarte_istoric.db')
+            zile_date = populeaza_v1(db_path, nr_zile)
+            db_v1 = os.path.join(director, 'istoric_v1.db')
+            shutil.copy(db_path, db_v1)
+
+            start = time.perf_counter()
+            email_system = EmailReportingSystem(director)
+            durata_migrare = time.perf_counter() - start
+            email_system.close()
+
+            ultima = zile_date[-1]
+            centre = [f"CENTRU {i:02d}" for i in range(0, NR_CENTRE, 4)]
+            interogari = [
+                ('istoric centru 30 zile', INTEROGARE_ISTORIC_CENTRU_V1, INTEROGARE_ISTORIC_CENTRU,
+                 [(centru, _zi_in_urma(zile_date, 30), ultima) for centru in centre]),
+                ('istoric centru 3 zile', INTEROGARE_ISTORIC_CENTRU_V1, INTEROGARE_ISTORIC_CENTRU,
+                 [(centru, _zi_in_urma(zile_date, 2), ultima) for centru in centre]),
+                ('centre active 3 zile', INTEROGARE_CENTRE_ACTIVE_V1, INTEROGARE_CENTRE_ACTIVE,
+                 [(_zi_in_urma(zile_date, 2),)]),
+                ('centre disponibile 30 zile', INTEROGARE_CENTRE_DISPONIBILE_V1, INTEROGARE_CENTRE_DISPONIBILE,
+                 [(_zi_in_urma(zile_date, 30), ultima)]),
+            ]
+
+            print(f"\n{nr_zile} zile, {nr_zile * NR_CENTRE * RUTE_PE_CENTRU:,} rânduri - migrare {durata_migrare:.2f}s, "
+                  f"fișier {os.path.getsize(db_v1) / 1024 / 1024:.1f} MB -> {os.path.getsize(db_path) / 1024 / 1024:.1f} MB")
+            print(f"{'Interogare':<28} {'v1 (ms)':>9} {'v2 (ms)':>9} {'Accelerare':>11} {'Identice':>9}")
+            conn_v1 = sqlite3.connect(db_v1)
+            conn_v2 = sqlite3.connect(db_path)
+            planuri = []
+            for nume, query_v1, query_v2, parametri in interogari:
+                timp_v1, rezultat_v1 = _masoara(conn_v1, query_v1, parametri)
+                timp_v2, rezultat_v2 = _masoara(conn_v2, query_v2, parametri)
+                print(f"{nume:<28} {timp_v1:>9.2f} {timp_v2:>9.2f} {timp_v1 / timp_v2:>10.1f}x "
+                      f"{'da' if rezultat_v1 == rezultat_v2 else 'NU':>9}")
+                planuri.append((nume, _plan(conn_v1, query_v1, parametri[0]), _plan(conn_v2, query_v2, parametri[0])))
+            conn_v1.close()
+            conn_v2.close()
+            logging.root.handlers.clear()
+
+            for nume, plan_v1, plan_v2 in planuri:
+                print(f"\n{nume}:")
+                print("  v1: " + "\n      ".join(plan_v1))
+                print("  v2: " + "\n      ".join(plan_v2))
+
+
+if __name__ == "__main__":
+    ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
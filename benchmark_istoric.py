@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru salvarea în istoric (rapoarte_istoric)
+Compară bucla inițială (iterrows, căutarea rutei echivalente în tot Sumar-ul Hub-Statie,
+un mesaj de log și un INSERT per rută) cu varianta vectorizată din save_report_to_history
+(map pe dicționare + un singur executemany într-o tranzacție), pe Sumar-uri sintetice cu
+mii de rute, și verifică faptul că rândurile salvate sunt identice.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+DIMENSIUNI_IMPLICITE = [1_000, 5_000, 20_000]
+
+DATA_RAPORT = '2025-08-27'
+
+# Schema inițială (versiunea 1) a istoricului: centrul și ruta ca text pe fiecare rând
+SCHEMA_V1 = [
+    '''
+    CREATE TABLE IF NOT EXISTS rapoarte_istoric (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        data_raport DATE NOT NULL,
+        hub VARCHAR(50) NOT NULL,
+        tip_raport VARCHAR(50) NOT NULL,
+        centru VARCHAR(100) NOT NULL,
+        ruta VARCHAR(100) NOT NULL,
+        nr_colete INTEGER NOT NULL,
+        greutate REAL NOT NULL,
+        procent_iesire_centru REAL NOT NULL,
+        procent_intrare_centru REAL NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(data_raport, hub, tip_raport, centru, ruta)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_data_centru ON rapoarte_istoric (data_raport, centru, hub)',
+]
+
+COLOANE_ISTORIC = (
+    'data_raport, hub, tip_raport, centru, ruta, nr_colete, greutate, procent_iesire_centru, procent_intrare_centru'
+)
+
+
+def creeaza_baza_v1(db_path):
+    """Bază de date goală cu schema inițială"""
+    conn = sqlite3.connect(db_path)
+    for instructiune in SCHEMA_V1:
+        conn.execute(instructiune)
+    conn.commit()
+    conn.close()
+
+
+def genereaza_date(director, nr_rute, seed=42):
+    """
+    Fișierele Utile (rute, echivalențe) pentru hub-ul Sibiu și Sumar-urile celor două rapoarte.
+    Câteva rute lipsesc intenționat din fișierul de rute, din echivalențe sau din Hub-Statie.
+    """
+    rng = np.random.default_rng(seed)
+    utile = os.path.join(director, 'Utile')
+    os.makedirs(utile, exist_ok=True)
+
+    rute = [f"R{i:05d}-SBH" for i in range(nr_rute)]
+    rute_hub_statie = [f"SBH-R{i:05d}" for i in range(nr_rute)]
+    centre = [f"CENTRU {i % 200}" for i in range(nr_rute)]
+
+    pd.DataFrame({'Denumire': rute[:int(nr_rute * 0.97)], 'Centru': centre[:int(nr_rute * 0.97)]}).to_csv(
+        os.path.join(utile, 'ruteSIBIU.csv'), index=False)
+    pd.DataFrame({'RutaEchivalenta': rute[:int(nr_rute * 0.95)],
+                  'RutaOriginala': rute_hub_statie[:int(nr_rute * 0.95)]}).to_excel(
+        os.path.join(utile, 'ruteSibiu_echivalenta.xlsx'), index=False)
+
+    sumar_statie_hub = pd.DataFrame({
+        'Ruta': rute,
+        'Nr Colete': rng.integers(1, 500, nr_rute),
+        'Greutate': rng.integers(100, 1_000_000, nr_rute) / 100,
+        'Procent Iesire Centru': rng.random(nr_rute),
+    })
+    # Hub-Statie: o parte din rute lipsesc, câteva apar de două ori (contează prima apariție)
+    indici = rng.permutation(nr_rute)[:int(nr_rute * 0.9)]
+    indici = np.concatenate([indici, indici[:nr_rute // 100]])
+    sumar_hub_statie = pd.DataFrame({
+        'Ruta': np.array(rute_hub_statie, dtype=object)[indici],
+        'Nr Colete': rng.integers(1, 500, len(indici)),
+        'Procent Intrare Centru': rng.random(len(indici)),
+    })
+    return sumar_statie_hub, sumar_hub_statie
+
+
+def salveaza_iterativ(db_path, logger, data_raport, hub_name, tip_raport, raport_data, rute_to_centru,
+                      echivalente_dict, raport_data_hub_statie):
+    """Bucla inițială din save_report_to_history, pe schema inițială (referință pentru comparație)"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    for _, row in raport_data.iterrows():
+        if row['Ruta'] == 'Total':
+            continue
+        centru = rute_to_centru.get(row['Ruta'], 'NECUNOSCUT')
+        procent_iesire = row.get('Procent Iesire Centru', 0) * 100
+        procent_intrare = 0
+        ruta_echivalenta = echivalente_dict.get(row['Ruta'])
+        if ruta_echivalenta:
+            matching_rows = raport_data_hub_statie[raport_data_hub_statie['Ruta'] == ruta_echivalenta]
+            if not matching_rows.empty:
+                procent_intrare = matching_rows.iloc[0].get('Procent Intrare Centru', 0) * 100
+                logger.info(f"Ruta {row['Ruta']} -> {ruta_echivalenta}: Procent intrare {procent_intrare:.2f}%")
+            else:
+                logger.warning(f"Nu s-a găsit ruta echivalentă {ruta_echivalenta} în Hub-Statie pentru {row['Ruta']}")
+        else:
+            logger.warning(f"Nu s-a găsit echivalența pentru ruta {row['Ruta']}")
+        cursor.execute('''
+            INSERT OR REPLACE INTO rapoarte_istoric
+            (data_raport, hub, tip_raport, centru, ruta, nr_colete,
+             greutate, procent_iesire_centru, procent_intrare_centru)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            data_raport, hub_name, tip_raport, centru, row['Ruta'],
+            int(row['Nr Colete']), float(row['Greutate']),
+            float(procent_iesire), float(procent_intrare)
+        ))
+    conn.commit()
+    conn.close()
+
+
+def _randuri_salvate(db_path):
+    # rapoarte_istoric: tabelul schemei inițiale sau vederea echivalentă a schemei curente
+    conn = sqlite3.connect(db_path)
+    randuri = conn.execute(f'SELECT {COLOANE_ISTORIC} FROM rapoarte_istoric ORDER BY ruta').fetchall()
+    conn.close()
+    return randuri
+
+
+def ruleaza_benchmark(dimensiuni=None):
+    from email_reporting_system import EmailReportingSystem
+    from reference_data import mapare
+
+    dimensiuni = dimensiuni or DIMENSIUNI_IMPLICITE
+    print(f"{'Rute':>8} {'iterrows (s)':>13} {'vectorizat (s)':>15} {'Accelerare':>11} {'Identice':>9}")
+    for nr_rute in dimensiuni:
+        with tempfile.TemporaryDirectory() as director:
+            director += os.sep
+            # Log-ul merge doar în fișier (ca în producție), nu pe consolă
+            logging.root.handlers.clear()
+            logging.basicConfig(level=logging.INFO, handlers=[logging.FileHandler(os.path.join(director, 'benchmark.log'))])
+            sumar_statie_hub, sumar_hub_statie = genereaza_date(director, nr_rute)
+            email_system = EmailReportingSystem(director)
+            rute_to_centru = mapare(os.path.join(director, 'Utile/ruteSIBIU.csv'), 'Denumire', 'Centru')
+            echivalente_dict = mapare(os.path.join(director, 'Utile/ruteSibiu_echivalenta.xlsx'),
+                                      'RutaEchivalenta', 'RutaOriginala')
+
+            db_v1 = os.path.join(director, 'istoric_v1.db')
+            creeaza_baza_v1(db_v1)
+            start = time.perf_counter()
+            salveaza_iterativ(db_v1, email_system.logger, DATA_RAPORT, 'Sibiu', 'Statie-Hub', sumar_statie_hub,
+                              rute_to_centru, echivalente_dict, sumar_hub_statie)
+            durata_iterativ = time.perf_counter() - start
+            randuri_iterativ = _randuri_salvate(db_v1)
+
+            start = time.perf_counter()
+            email_system.save_report_to_history(DATA_RAPORT, 'Sibiu', 'Statie-Hub', sumar_statie_hub,
+                                                raport_data_hub_statie=sumar_hub_statie)
+            durata_vectorizat = time.perf_counter() - start
+            identice = _randuri_salvate(email_system.db_path) == randuri_iterativ
+
+            email_system.close()
+            logging.root.handlers.clear()
+            print(f"{nr_rute:>8,} {durata_iterativ:>13.2f} {durata_vectorizat:>15.3f} "
+                  f"{durata_iterativ / durata_vectorizat:>10.0f}x {'da' if identice else 'NU':>9}")
+
+
+if __name__ == "__main__":
+    ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
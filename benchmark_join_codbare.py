@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru merge-ul outer pe CodBare din rapoartele HUB
+Compară merge-ul pe textul codurilor de bare cu merge-ul pe coduri int64
+(factorizare comună a ambelor părți + decodare după join), ca timp și memorie maximă
+alocată (tracemalloc), și verifică faptul că rezultatele sunt identice.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+DIMENSIUNI_IMPLICITE = [500_000, 2_000_000, 4_000_000]
+
+
+def genereaza_parti(nr_randuri, seed=42):
+    """Părțile de ieșire și intrare: ~80% din colete apar pe ambele părți"""
+    rng = np.random.default_rng(seed)
+    coduri = np.array([f"CB{x:012d}" for x in rng.choice(10**11, int(nr_randuri * 1.2), replace=False)], dtype=object)
+    iesire = rng.permutation(coduri[:nr_randuri])
+    intrare = rng.permutation(coduri[int(nr_randuri * 0.2):])
+    return (
+        pd.DataFrame({'CodBare': pd.array(iesire, dtype='str'), 'Ruta Iesire': 'R1', 'bucati_iesire': 1.0}),
+        pd.DataFrame({'CodBare': pd.array(intrare, dtype='str'), 'Ruta Intrare': 'R2', 'bucati_intrare': 1.0}),
+    )
+
+
+def merge_text(df_iesire, df_intrare):
+    return pd.merge(df_iesire, df_intrare, on=['CodBare'], how='outer')
+
+
+def merge_coduri(df_iesire, df_intrare):
+    coduri, coduri_bare = pd.factorize(
+        pd.concat([df_iesire['CodBare'], df_intrare['CodBare']], ignore_index=True),
+        sort=True, use_na_sentinel=False
+    )
+    df_final = pd.merge(
+        df_iesire.assign(CodBare=coduri[:len(df_iesire)]),
+        df_intrare.assign(CodBare=coduri[len(df_iesire):]),
+        on=['CodBare'], how='outer'
+    )
+    df_final['CodBare'] = coduri_bare.take(df_final['CodBare'].to_numpy())
+    return df_final
+
+
+def _masoara(functie, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rezultat = functie(*args)
+    durata = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rezultat, durata, peak / (1024 * 1024)
+
+
+def ruleaza_benchmark(dimensiuni=None):
+    dimensiuni = dimensiuni or DIMENSIUNI_IMPLICITE
+    print(f"{'Rânduri/parte':>14} {'text (s)':>9} {'coduri (s)':>11} {'Accelerare':>11} "
+          f"{'text (MB)':>10} {'coduri (MB)':>12} {'Identice':>9}")
+    for nr_randuri in dimensiuni:
+        df_iesire, df_intrare = genereaza_parti(nr_randuri)
+        rezultat_text, durata_text, peak_text = _masoara(merge_text, df_iesire, df_intrare)
+        del rezultat_text
+        rezultat_coduri, durata_coduri, peak_coduri = _masoara(merge_coduri, df_iesire, df_intrare)
+        identice = rezultat_coduri.equals(merge_text(df_iesire, df_intrare))
+        print(f"{nr_randuri:>14,} {durata_text:>9.2f} {durata_coduri:>11.2f} {durata_text / durata_coduri:>10.1f}x "
+              f"{peak_text:>10.0f} {peak_coduri:>12.0f} {'da' if identice else 'NU':>9}")
+
+
+if __name__ == "__main__":
+    ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru încărcarea fișierului master
+Compară citirea originală (pd.read_csv cu parse_dates) cu încărcarea tipizată
+(motor pandas și pyarrow) și cu cache-ul Parquet, pe fișiere sintetice de dimensiuni
+crescătoare. Timpul și memoria maximă (peak RSS) se măsoară într-un proces separat
+pentru fiecare variantă.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic_master_data import genereaza_master_sintetic
+
+VARIANTE = ['original', 'schema', 'pyarrow', 'cache']
+
+DIMENSIUNI_IMPLICITE = [250_000, 1_000_000, 2_000_000]
+
+
+def _peak_rss_mb():
+    # Pe Linux VmHWM este resetat la exec (ru_maxrss moștenește valoarea procesului părinte)
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as f:
+            for linie in f:
+                if linie.startswith('VmHWM:'):
+                    return int(linie.split()[1]) / 1024
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux raportează în KB, macOS în bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _ruleaza_varianta(varianta, fisier):
+    """Rulează o singură variantă (apelată în subprocess)"""
+    import pandas as pd
+    from master_data_loader import citeste_master_csv, incarca_master
+
+    start = time.perf_counter()
+    if varianta == 'original':
+        df = pd.read_csv(fisier, parse_dates=['Scanare'])
+    elif varianta == 'schema':
+        df = citeste_master_csv(fisier)
+    elif varianta == 'pyarrow':
+        df = citeste_master_csv(fisier, motor='pyarrow')
+    else:
+        df = incarca_master(fisier)
+    durata = time.perf_counter() - start
+
+    print(json.dumps({
+        'varianta': varianta,
+        'secunde': durata,
+        'peak_rss_mb': _peak_rss_mb(),
+        'memorie_df_mb': df.memory_usage(deep=True).sum() / (1024 * 1024)
+    }))
+
+
+def _masoara(varianta, fisier):
+    rezultat = subprocess.run(
+        [sys.executable, __file__, '--varianta', varianta, fisier],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(rezultat.stdout.strip().splitlines()[-1])
+
+
+def ruleaza_benchmark(dimensiuni=None):
+    dimensiuni = dimensiuni or DIMENSIUNI_IMPLICITE
+    rezultate = {}
+    print(f"Nuclee CPU disponibile: {os.cpu_count()}")
+
+    for nr_randuri in dimensiuni:
+        with tempfile.TemporaryDirectory() as director:
+            fisier = os.path.join(director, 'master_data.csv')
+            genereaza_master_sintetic(fisier, nr_randuri)
+            print(f"\n{nr_randuri:,} rânduri ({os.path.getsize(fisier) / (1024 * 1024):.1f} MB)")
+
+            # Construiește cache-ul înainte de măsurarea variantei 'cache'
+            _masoara('cache', fisier)
+
+            print(f"{'Varianta':<10} {'Timp (s)':>10} {'Accelerare':>11} {'Peak RSS (MB)':>15} {'DataFrame (MB)':>16}")
+            rezultate[nr_randuri] = {}
+            for varianta in VARIANTE:
+                r = _masoara(varianta, fisier)
+                rezultate[nr_randuri][varianta] = r
+                accelerare = rezultate[nr_randuri]['original']['secunde'] / r['secunde']
+                print(f"{varianta:<10} {r['secunde']:>10.2f} {accelerare:>10.1f}x "
+                      f"{r['peak_rss_mb']:>15.1f} {r['memorie_df_mb']:>16.1f}")
+
+            economie = rezultate[nr_randuri]['original']['peak_rss_mb'] - rezultate[nr_randuri]['schema']['peak_rss_mb']
+            print(f"Memorie maximă economisită (schema vs original): {economie:.1f} MB")
+
+    return rezultate
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--varianta':
+        _ruleaza_varianta(sys.argv[2], sys.argv[3])
+    else:
+        ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
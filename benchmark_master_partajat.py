@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru master-ul partajat între procese worker
+Pornește simultan 1, 2, 4 ... procese care extrag ferestrele unui raport, fiecare fie cu propria
+copie a master-ului (cache Parquet + index, ca sursa='master'), fie atașat fișierului Arrow
+mapat în memorie (sursa='partajat'). Pentru fiecare proces se măsoară peak RSS și memoria
+privată (USS: paginile care nu sunt partajate cu alte procese, din /proc/self/smaps_rollup).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmark_master_loader import _peak_rss_mb
+from synthetic_master_data import genereaza_master_sintetic
+
+VARIANTE = ['master', 'partajat']
+
+WORKERI_IMPLICITI = [1, 2, 4]
+
+NR_RANDURI_IMPLICIT = 2_000_000
+
+
+def _memorie_privata_mb():
+    """USS (Private_Clean + Private_Dirty); None dacă sistemul nu expune smaps_rollup"""
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        return None
+    privata = 0
+    with open('/proc/self/smaps_rollup') as f:
+        for linie in f:
+            if linie.startswith(('Private_Clean:', 'Private_Dirty:')):
+                privata += int(linie.split()[1])
+    return privata / 1024
+
+
+def _ruleaza_worker(varianta, fisier):
+    """Un proces worker: extrage ferestrele Brasov pentru o dată (apelat în subprocess)"""
+    from unified_hub_report_generator import BRASOV_CONFIG, UnifiedHubReportGenerator
+
+    director = os.path.dirname(fisier) + os.sep
+    # Fișierul Arrow rămâne în directorul temporar al benchmark-ului (șters la final)
+    generator = UnifiedHubReportGenerator(fisier, '2025-08-14', director, BRASOV_CONFIG, sursa=varianta,
+                                          fisier_partajat=os.path.join(director, 'master_data.arrow'))
+    start = time.perf_counter()
+    ferestre = generator.extrage_ferestre()
+    durata = time.perf_counter() - start
+    print(json.dumps({
+        'secunde': durata,
+        'randuri': sum(len(df) for df in ferestre.values()),
+        'peak_rss_mb': _peak_rss_mb(),
+        'privata_mb': _memorie_privata_mb()
+    }))
+
+
+def _masoara(varianta, fisier, nr_workeri):
+    """Pornește nr_workeri procese simultan și returnează rezultatele lor"""
+    procese = [
+        subprocess.Popen([sys.executable, __file__, '--worker', varianta, fisier],
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for _ in range(nr_workeri)
+    ]
+    rezultate = []
+    for proces in procese:
+        iesire, _ = proces.communicate()
+        if proces.returncode != 0:
+            raise RuntimeError(f"Worker-ul {varianta} a eșuat (cod {proces.returncode})")
+        rezultate.append(json.loads(iesire.strip().splitlines()[-1]))
+    return rezultate
+
+
+def ruleaza_benchmark(workeri=None, nr_randuri=NR_RANDURI_IMPLICIT):
+    workeri = workeri or WORKERI_IMPLICITI
+    with tempfile.TemporaryDirectory() as director:
+        fisier = os.path.join(director, 'master_data.csv')
+        genereaza_master_sintetic(fisier, nr_randuri)
+        print(f"{nr_randuri:,} rânduri ({os.path.getsize(fisier) / (1024 * 1024):.1f} MB), "
+              f"nuclee CPU disponibile: {os.cpu_count()}")
+
+        # Cache-ul Parquet și fișierul Arrow sunt construite înaintea măsurătorilor
+        for varianta in VARIANTE:
+            _masoara(varianta, fisier, 1)
+
+        print(f"{'Workeri':>8} {'Varianta':<9} {'Timp/worker (s)':>16} {'Peak RSS/worker (MB)':>21} "
+              f"{'USS total (MB)':>15}")
+        for nr_workeri in workeri:
+            for varianta in VARIANTE:
+                rezultate = _masoara(varianta, fisier, nr_workeri)
+                timp = max(r['secunde'] for r in rezultate)
+                rss = max(r['peak_rss_mb'] for r in rezultate)
+                privata = (sum(r['privata_mb'] for r in rezultate)
+                           if all(r['privata_mb'] is not None for r in rezultate) else float('nan'))
+                print(f"{nr_workeri:>8} {varianta:<9} {timp:>16.2f} {rss:>21.0f} {privata:>15.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        _ruleaza_worker(sys.argv[2], sys.argv[3])
+    else:
+        argumente = [int(x) for x in sys.argv[1:]]
+        # python benchmark_master_partajat.py [nr_randuri] [workeri ...]
+        ruleaza_benchmark(argumente[1:] or None, argumente[0] if argumente else NR_RANDURI_IMPLICIT)
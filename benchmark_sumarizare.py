@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru coloanele derivate din rapoartele HUB
+Compară vechile expresii apply(axis=1) cu variantele vectorizate din report_engine
+(Greutate Medie, echivalența rutelor, "Fara scan iesire", procentele din Sumar)
+și verifică faptul că rezultatele sunt identice.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from report_engine import (
+    aplica_echivalenta_rute,
+    calculeaza_greutate_medie,
+    calculeaza_procent,
+    marcheaza_fara_scan_iesire,
+)
+
+DIMENSIUNI_IMPLICITE = [100_000, 1_000_000, 5_000_000]
+
+
+def genereaza_date_finale(nr_randuri, seed=42):
+    """DataFrame cu structura lui df_final (după merge-ul ieșire/intrare)"""
+    rng = np.random.default_rng(seed)
+    rute = np.array([f"Ruta {i}" for i in range(300)], dtype=object)
+    expeditori = np.array([f"Firma {i}" for i in range(2000)], dtype=object)
+
+    ruta_iesire = pd.Series(rute[rng.integers(0, len(rute), nr_randuri)])
+    ruta_iesire[rng.random(nr_randuri) < 0.1] = np.nan
+    data_iesire = pd.Series(pd.Timestamp('2025-08-27') + pd.to_timedelta(rng.integers(0, 86_400, nr_randuri), unit='s'))
+    data_iesire[rng.random(nr_randuri) < 0.05] = pd.NaT
+
+    return pd.DataFrame({
+        'Ruta Iesire Centru': ruta_iesire,
+        'Ruta Intrare Hub': rute[rng.integers(0, len(rute), nr_randuri)],
+        'DataScanare Iesire Centru': data_iesire,
+        'Expeditor': expeditori[rng.integers(0, len(expeditori), nr_randuri)],
+        'bucati': rng.integers(0, 5, nr_randuri).astype(float),
+        # Greutăți cu 3 zecimale: multe valori sunt exact la jumătate la rotunjire
+        'Greutate': rng.integers(1, 500_000, nr_randuri) / 1000,
+    })
+
+
+def varianta_apply(df, dict_echivalenta, valori_fara_scan):
+    rezultat = {}
+    rezultat['Greutate Medie'] = df.apply(
+        lambda row: round(row['Greutate'] / row['bucati'], 2) if row['bucati'] != 0 else 0,
+        axis=1
+    )
+    rezultat['Ruta Iesire Centru'] = df.apply(
+        lambda row: dict_echivalenta.get(row['Ruta Intrare Hub'])
+        if pd.isna(row['Ruta Iesire Centru']) and row['Ruta Intrare Hub'] in dict_echivalenta
+        else row['Ruta Iesire Centru'],
+        axis=1
+    )
+    rezultat['DataScanare Iesire Centru'] = df.apply(
+        lambda row: "Fara scan iesire"
+        if pd.isna(row['DataScanare Iesire Centru']) and str(row['Expeditor']) in valori_fara_scan
+        else row['DataScanare Iesire Centru'],
+        axis=1
+    )
+    df_sumar = _sumar(df, rezultat['Greutate Medie'])
+    rezultat['Procent'] = df_sumar.apply(
+        lambda row: row["Scan iesire Centru"] / row["Nr Colete"] if row["Nr Colete"] != 0 else 0,
+        axis=1
+    )
+    return rezultat
+
+
+def varianta_vectorizata(df, dict_echivalenta, valori_fara_scan):
+    rezultat = {}
+    rezultat['Greutate Medie'] = calculeaza_greutate_medie(df)
+    rezultat['Ruta Iesire Centru'] = aplica_echivalenta_rute(
+        df['Ruta Iesire Centru'], df['Ruta Intrare Hub'], dict_echivalenta
+    )
+    rezultat['DataScanare Iesire Centru'] = marcheaza_fara_scan_iesire(
+        df['DataScanare Iesire Centru'], df['Expeditor'], valori_fara_scan
+    )
+    df_sumar = _sumar(df, rezultat['Greutate Medie'])
+    rezultat['Procent'] = calculeaza_procent(df_sumar["Scan iesire Centru"], df_sumar["Nr Colete"])
+    return rezultat
+
+
+def _sumar(df, greutate_medie):
+    return df.assign(**{'Greutate Medie': greutate_medie}).groupby('Ruta Intrare Hub').agg(
+        **{
+            "Nr Colete": ("Ruta Intrare Hub", "count"),
+            "Greutate": ("Greutate Medie", "sum"),
+            "Scan iesire Centru": ("DataScanare Iesire Centru", "count"),
+        }
+    ).reset_index()
+
+
+def _identice(a, b):
+    # Comparație pe valori (ca în Excel): tipurile pot diferi între object și dtype-ul numpy
+    valori_a, valori_b = a.to_numpy(dtype=object), b.to_numpy(dtype=object)
+    return len(valori_a) == len(valori_b) and all(
+        (pd.isna(x) and pd.isna(y)) or x == y for x, y in zip(valori_a, valori_b)
+    )
+
+
+def ruleaza_benchmark(dimensiuni=None):
+    dimensiuni = dimensiuni or DIMENSIUNI_IMPLICITE
+    dict_echivalenta = {f"Ruta {i}": f"Ruta echivalenta {i}" for i in range(0, 300, 3)}
+    valori_fara_scan = {f"Firma {i}" for i in range(0, 2000, 10)}
+
+    print(f"{'Rânduri':>10} {'apply (s)':>10} {'vectorizat (s)':>15} {'Accelerare':>11} {'Identice':>9}")
+    for nr_randuri in dimensiuni:
+        df = genereaza_date_finale(nr_randuri)
+
+        start = time.perf_counter()
+        rezultat_apply = varianta_apply(df, dict_echivalenta, valori_fara_scan)
+        durata_apply = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rezultat_vectorizat = varianta_vectorizata(df, dict_echivalenta, valori_fara_scan)
+        durata_vectorizat = time.perf_counter() - start
+
+        identice = all(_identice(rezultat_apply[c], rezultat_vectorizat[c]) for c in rezultat_apply)
+        print(f"{nr_randuri:>10,} {durata_apply:>10.2f} {durata_vectorizat:>15.3f} "
+              f"{durata_apply / durata_vectorizat:>10.0f}x {'da' if identice else 'NU':>9}")
+
+
+if __name__ == "__main__":
+    ruleaza_benchmark([int(x) for x in sys.argv[1:]] or None)
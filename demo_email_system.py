@@ -62,12 +62,7 @@ def demo_system():
     
     print("\n3. 🗄️ Verific baza de date...")
     try:
-        import sqlite3
-        conn = sqlite3.connect(generator.email_system.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM rapoarte_istoric")
-        count = cursor.fetchone()[0]
-        conn.close()
+        count = generator.email_system.baza.citeste("SELECT COUNT(*) FROM rapoarte_istoric")[0][0]
         print(f"✅ Baza de date conține {count} înregistrări")
     except Exception as e:
         print(f"❌ Eroare la verificarea bazei de date: {e}")
@@ -7,7 +7,6 @@ Sistem de raportare email pentru HUB Reporting
 """
 
 import pandas as pd
-import sqlite3
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -23,6 +22,108 @@ matplotlib.use('Agg')  # Backend non-interactiv pentru server
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from unified_hub_report_generator import UnifiedHubReportGenerator, BRASOV_CONFIG, SIBIU_CONFIG
+from history_db import BazaIstoric
+from reference_data import mapare
+
+# Versiunea schemei bazei de date a istoricului (PRAGMA user_version):
+# 1 - tabelul rapoarte_istoric cu centrul și ruta ca text; 2 - dimensiuni centre/rute + istoric_rute
+VERSIUNE_SCHEMA = 2
+
+# Istoricul unui centru pe un interval de date: index acoperitor idx_centru_data (centru, apoi date)
+INTEROGARE_ISTORIC_CENTRU = '''
+    SELECT 
+        i.data_raport,
+        c.nume AS centru,
+        r.nume AS ruta,
+        i.nr_colete,
+        i.greutate,
+        i.procent_iesire_centru,
+        i.procent_intrare_centru
+    FROM centre c
+    JOIN istoric_rute i ON i.centru_id = c.id
+    JOIN rute r ON r.id = i.ruta_id
+    WHERE c.nume = ? 
+        AND i.data_raport >= ? 
+        AND i.data_raport <= ?
+    ORDER BY i.data_raport DESC, r.nume
+'''
+
+# Centrele cu date începând de la o dată: câte o căutare în idx_centru_data pentru fiecare centru
+INTEROGARE_CENTRE_ACTIVE = '''
+    SELECT c.nume AS centru
+    FROM centre c
+    WHERE c.nume != 'NECUNOSCUT'
+    AND EXISTS (
+        SELECT 1 FROM istoric_rute i WHERE i.centru_id = c.id AND i.data_raport >= ?
+    )
+    ORDER BY c.nume
+'''
+
+# Centrele și numărul de rânduri pe un interval de date
+INTEROGARE_CENTRE_DISPONIBILE = '''
+    SELECT c.nume AS centru, COUNT(*) as numar_rute
+    FROM istoric_rute i
+    JOIN centre c ON c.id = i.centru_id
+    WHERE i.data_raport >= ? 
+    AND i.data_raport <= ?
+    AND c.nume != 'NECUNOSCUT'
+    GROUP BY c.nume
+    ORDER BY c.nume
+'''
+
+def _enumera(valori, maxim=10):
+    """Primele `maxim` valori, pentru mesajele de log"""
+    valori = [str(v) for v in valori]
+    return ', '.join(valori[:maxim]) + (f" ... (+{len(valori) - maxim})" if len(valori) > maxim else '')
+
+
+def calculeaza_randuri_istoric(raport_data, rute_to_centru, echivalente_dict, raport_data_hub_statie=None):
+    """
+    Rândurile de istoric pentru Sumar-ul unui raport Statie-Hub (fără rândul Total), calculate vectorizat.
+    
+    - centru: centrul rutei din fișierul de rute ('NECUNOSCUT' dacă ruta lipsește)
+    - procent_iesire_centru: Procent Iesire Centru * 100 (0 dacă coloana lipsește)
+    - procent_intrare_centru: Procent Intrare Centru * 100 al rutei echivalente din Hub-Statie
+      (prima apariție a rutei); 0 dacă ruta nu are echivalență sau echivalentul lipsește din Hub-Statie
+    
+    Coloanele ruta_echivalenta și gasita_hub_statie sunt păstrate pentru mesajele de log.
+    """
+    raport_data = raport_data[raport_data['Ruta'] != 'Total']
+    # Ca obiecte Python: isin pe coloanele text Arrow este mult mai lent decât pe obiecte
+    ruta = raport_data['Ruta'].astype(object)
+    
+    # isin păstrează centrele goale din fișierul de rute, ca dict.get
+    centru = ruta.map(rute_to_centru).where(ruta.isin(list(rute_to_centru)), 'NECUNOSCUT')
+    procent_iesire = (
+        raport_data['Procent Iesire Centru'] * 100 if 'Procent Iesire Centru' in raport_data
+        else pd.Series(0.0, index=raport_data.index)
+    )
+    
+    # Doar echivalențele nevide contează (ca `if ruta_echivalenta`)
+    ruta_echivalenta = ruta.map({cheie: valoare for cheie, valoare in echivalente_dict.items() if valoare})
+    gasita = pd.Series(False, index=raport_data.index)
+    procent_intrare = pd.Series(0.0, index=raport_data.index)
+    if raport_data_hub_statie is not None:
+        hub_statie = raport_data_hub_statie[raport_data_hub_statie['Ruta'].notna()]
+        hub_statie = hub_statie.drop_duplicates('Ruta', keep='first').set_index('Ruta')
+        procente_hub_statie = (
+            hub_statie['Procent Intrare Centru'] if 'Procent Intrare Centru' in hub_statie
+            else pd.Series(0, index=hub_statie.index)
+        )
+        gasita = ruta_echivalenta.isin(procente_hub_statie.index.astype(object))
+        procent_intrare = procent_intrare.mask(gasita, ruta_echivalenta.map(procente_hub_statie) * 100)
+    
+    return pd.DataFrame({
+        'centru': centru,
+        'ruta': ruta,
+        'nr_colete': raport_data['Nr Colete'],
+        'greutate': raport_data['Greutate'],
+        'procent_iesire_centru': procent_iesire,
+        'procent_intrare_centru': procent_intrare,
+        'ruta_echivalenta': ruta_echivalenta,
+        'gasita_hub_statie': gasita
+    }, index=raport_data.index)
+
 
 class EmailReportingSystem:
     def __init__(self, base_path=None):
@@ -52,54 +153,129 @@ class EmailReportingSystem:
         )
         self.logger = logging.getLogger(__name__)
         
+        # Conexiunile la baza de date sunt refolosite pe toată durata sistemului (vezi history_db)
+        self.baza = BazaIstoric(self.db_path)
+        
         # Inițializează baza de date
         self._init_database()
     
     def _init_database(self):
-        """Inițializează baza de date SQLite pentru istoric"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Inițializează baza de date SQLite pentru istoric (cu migrarea schemei vechi, dacă este cazul)"""
+        versiune = self.baza.versiune_schema()
+        with self.baza.scrie() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            migrare = versiune < VERSIUNE_SCHEMA and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rapoarte_istoric'"
+            ).fetchone() is not None
+            if migrare:
+                # Schema 1: un singur tabel cu centrul și ruta ca text pe fiecare rând
+                conn.execute('ALTER TABLE rapoarte_istoric RENAME TO rapoarte_istoric_v1')
+            self._creeaza_tabele(conn)
+            if migrare:
+                randuri = self._migreaza_v1(conn)
+            conn.execute(f'PRAGMA user_version = {VERSIUNE_SCHEMA}')
+        
+        if migrare:
+            self.logger.info(f"Istoric migrat la schema {VERSIUNE_SCHEMA}: {randuri} rânduri")
+            # Spațiul tabelului vechi este eliberat, apoi statisticile sunt calculate pentru noua schemă
+            with self.baza.scrie() as conn:
+                conn.execute('VACUUM')
+            self.baza.analizeaza_daca_e_nevoie('istoric_rute')
+        self.logger.info(f"Baza de date inițializată: {self.db_path}")
+    
+    def _creeaza_tabele(self, conn):
+        # Dimensiuni: fiecare centru și rută este stocat o singură dată
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS centre (
+                id INTEGER PRIMARY KEY,
+                nume VARCHAR(100) NOT NULL UNIQUE
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS rute (
+                id INTEGER PRIMARY KEY,
+                nume VARCHAR(100) NOT NULL UNIQUE
+            )
+        ''')
         
         # Tabel pentru istoricul rapoartelor
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS rapoarte_istoric (
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS istoric_rute (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 data_raport DATE NOT NULL,
                 hub VARCHAR(50) NOT NULL,
                 tip_raport VARCHAR(50) NOT NULL,
-                centru VARCHAR(100) NOT NULL,
-                ruta VARCHAR(100) NOT NULL,
+                centru_id INTEGER NOT NULL REFERENCES centre (id),
+                ruta_id INTEGER NOT NULL REFERENCES rute (id),
                 nr_colete INTEGER NOT NULL,
                 greutate REAL NOT NULL,
                 procent_iesire_centru REAL NOT NULL,
                 procent_intrare_centru REAL NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(data_raport, hub, tip_raport, centru, ruta)
+                UNIQUE(data_raport, hub, tip_raport, centru_id, ruta_id)
             )
         ''')
         
-        # Index pentru performanță
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_data_centru 
-            ON rapoarte_istoric (data_raport, centru, hub)
+        # Index acoperitor pentru rapoartele pe centru (centru = ?, apoi interval de date):
+        # toate coloanele citite sunt în index, fără acces la tabel.
+        # Listele de centre pe interval de date folosesc indexul UNIQUE (data_raport, ...).
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_centru_data
+            ON istoric_rute (centru_id, data_raport, ruta_id, nr_colete, greutate,
+                             procent_iesire_centru, procent_intrare_centru)
         ''')
         
-        conn.commit()
-        conn.close()
-        self.logger.info(f"Baza de date inițializată: {self.db_path}")
+        # Vederea cu structura inițială, pentru interogările existente în afara sistemului
+        conn.execute('''
+            CREATE VIEW IF NOT EXISTS rapoarte_istoric AS
+            SELECT i.id, i.data_raport, i.hub, i.tip_raport, c.nume AS centru, r.nume AS ruta,
+                   i.nr_colete, i.greutate, i.procent_iesire_centru, i.procent_intrare_centru, i.created_at
+            FROM istoric_rute i
+            JOIN centre c ON c.id = i.centru_id
+            JOIN rute r ON r.id = i.ruta_id
+        ''')
+    
+    def _migreaza_v1(self, conn):
+        """Mută rândurile din tabelul schemei 1 în dimensiuni + istoric_rute (în tranzacția apelantului)"""
+        conn.execute('INSERT OR IGNORE INTO centre (nume) SELECT DISTINCT centru FROM rapoarte_istoric_v1 ORDER BY centru')
+        conn.execute('INSERT OR IGNORE INTO rute (nume) SELECT DISTINCT ruta FROM rapoarte_istoric_v1 ORDER BY ruta')
+        randuri = conn.execute('''
+            INSERT INTO istoric_rute
+            (id, data_raport, hub, tip_raport, centru_id, ruta_id, nr_colete,
+             greutate, procent_iesire_centru, procent_intrare_centru, created_at)
+            SELECT v.id, v.data_raport, v.hub, v.tip_raport, c.id, r.id, v.nr_colete,
+                   v.greutate, v.procent_iesire_centru, v.procent_intrare_centru, v.created_at
+            FROM rapoarte_istoric_v1 v
+            JOIN centre c ON c.nume = v.centru
+            JOIN rute r ON r.nume = v.ruta
+            ORDER BY v.id
+        ''').rowcount
+        conn.execute('DROP TABLE rapoarte_istoric_v1')
+        return randuri
     
-    def save_report_to_history(self, data_raport, hub_name, tip_raport, raport_data, file_path=None):
-        """Salvează datele raportului în istoric cu logică consolidată pentru ambele tipuri de raport"""
-        conn = sqlite3.connect(self.db_path)
+    def close(self):
+        """Închide conexiunile la baza de date (la finalul utilizării sistemului)"""
+        self.baza.inchide()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def save_report_to_history(self, data_raport, hub_name, tip_raport, raport_data, file_path=None,
+                               raport_data_hub_statie=None):
+        """Salvează datele raportului în istoric cu logică consolidată pentru ambele tipuri de raport
         
+        raport_data_hub_statie: foaia Sumar a raportului Hub-Statie (ex: returnată de generator);
+        dacă lipsește, este citită din fișierul HUB-Statie corespondent lui file_path.
+        """
         # Salvez doar rapoartele Statie-Hub - pentru Hub-Statie nu salvez separat
         if tip_raport != 'Statie-Hub':
-            conn.close()
             return True
         
         # Încearcă să găsească fișierul Hub-Statie corespondent pentru a prelua procent intrare centru
-        raport_data_hub_statie = None
-        if file_path:
+        if raport_data_hub_statie is None and file_path:
             hub_statie_file = file_path.replace('Statie-Hub', 'HUB-Statie')
             if os.path.exists(hub_statie_file):
                 try:
@@ -118,13 +294,12 @@ class EmailReportingSystem:
         
         if os.path.exists(echivalente_file):
             try:
-                echivalente_df = pd.read_excel(echivalente_file)
                 if hub_name.upper() == 'BRASOV':
                     # Pentru Brasov: Rute Tara -> Rute Brasov
-                    echivalente_dict = dict(zip(echivalente_df['Rute Tara'], echivalente_df['Rute Brasov']))
+                    echivalente_dict = mapare(echivalente_file, 'Rute Tara', 'Rute Brasov')
                 else:
                     # Pentru Sibiu: RutaEchivalenta (din Statie-Hub) -> RutaOriginala (din Hub-Statie)
-                    echivalente_dict = dict(zip(echivalente_df['RutaEchivalenta'], echivalente_df['RutaOriginala']))
+                    echivalente_dict = mapare(echivalente_file, 'RutaEchivalenta', 'RutaOriginala')
                 self.logger.info(f"Încărcat {len(echivalente_dict)} echivalențe de rute pentru {hub_name}")
             except Exception as e:
                 self.logger.warning(f"Eroare la încărcarea echivalențelor de rute: {e}")
@@ -139,119 +314,69 @@ class EmailReportingSystem:
             self.logger.error(f"Fișierul de rute nu există: {rute_file}")
             return False
         
-        rute_df = pd.read_csv(rute_file)
-        rute_to_centru = dict(zip(rute_df['Denumire'], rute_df['Centru']))
+        rute_to_centru = mapare(rute_file, 'Denumire', 'Centru')
         
         try:
-            cursor = conn.cursor()
+            randuri = calculeaza_randuri_istoric(raport_data, rute_to_centru, echivalente_dict, raport_data_hub_statie)
+            self._raporteaza_echivalente(randuri, raport_data_hub_statie is not None, file_path)
             
-            for _, row in raport_data.iterrows():
-                if row['Ruta'] == 'Total':
-                    continue
-                    
-                centru = rute_to_centru.get(row['Ruta'], 'NECUNOSCUT')
-                
-                # Procent Iesire Centru din fișierul Statie-Hub
-                procent_iesire = row.get('Procent Iesire Centru', 0) * 100
-                
-                # Procent Intrare Centru din fișierul Hub-Statie (folosind tabelul de echivalențe)
-                procent_intrare = 0
-                if raport_data_hub_statie is not None:
-                    ruta_statie_hub = row['Ruta']  # ex: ALB-SBH
-                    
-                    # Găsește ruta echivalentă din tabelul de echivalențe
-                    ruta_echivalenta = echivalente_dict.get(ruta_statie_hub)
-                    if ruta_echivalenta:
-                        # Caută ruta echivalentă în datele Hub-Statie
-                        matching_rows = raport_data_hub_statie[raport_data_hub_statie['Ruta'] == ruta_echivalenta]
-                        if not matching_rows.empty:
-                            procent_intrare = matching_rows.iloc[0].get('Procent Intrare Centru', 0) * 100
-                            self.logger.info(f"Ruta {ruta_statie_hub} -> {ruta_echivalenta}: Procent intrare {procent_intrare:.2f}%")
-                        else:
-                            self.logger.warning(f"Nu s-a găsit ruta echivalentă {ruta_echivalenta} în Hub-Statie pentru {ruta_statie_hub}")
-                    else:
-                        self.logger.warning(f"Nu s-a găsit echivalența pentru ruta {ruta_statie_hub}")
-                else:
-                    self.logger.warning(f"Nu s-a găsit fișierul Hub-Statie corespondent pentru {file_path}")
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO rapoarte_istoric 
-                    (data_raport, hub, tip_raport, centru, ruta, nr_colete, 
+            # Toate rândurile într-o singură tranzacție (rollback automat la eroare)
+            with self.baza.scrie() as conn:
+                conn.executemany('INSERT OR IGNORE INTO centre (nume) VALUES (?)',
+                                 [(centru,) for centru in randuri['centru'].unique()])
+                conn.executemany('INSERT OR IGNORE INTO rute (nume) VALUES (?)',
+                                 [(ruta,) for ruta in randuri['ruta'].unique()])
+                conn.executemany('''
+                    INSERT OR REPLACE INTO istoric_rute 
+                    (data_raport, hub, tip_raport, centru_id, ruta_id, nr_colete, 
                      greutate, procent_iesire_centru, procent_intrare_centru)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    data_raport, hub_name, tip_raport, centru, row['Ruta'],
-                    int(row['Nr Colete']), float(row['Greutate']),
-                    float(procent_iesire), float(procent_intrare)
+                    VALUES (?, ?, ?, (SELECT id FROM centre WHERE nume = ?), (SELECT id FROM rute WHERE nume = ?),
+                            ?, ?, ?, ?)
+                ''', zip(
+                    [data_raport] * len(randuri), [hub_name] * len(randuri), [tip_raport] * len(randuri),
+                    randuri['centru'].tolist(), randuri['ruta'].tolist(),
+                    randuri['nr_colete'].astype('int64').tolist(), randuri['greutate'].astype(float).tolist(),
+                    randuri['procent_iesire_centru'].astype(float).tolist(),
+                    randuri['procent_intrare_centru'].astype(float).tolist()
                 ))
-            
-            conn.commit()
-            self.logger.info(f"Salvat în istoric: {data_raport} - {hub_name} - {tip_raport}")
+            self.logger.info(f"Salvat în istoric: {data_raport} - {hub_name} - {tip_raport} ({len(randuri)} rute)")
+            self.baza.analizeaza_daca_e_nevoie('istoric_rute', len(randuri))
             return True
             
         except Exception as e:
             self.logger.error(f"Eroare la salvarea în istoric: {str(e)}")
-            conn.rollback()
             return False
-        finally:
-            conn.close()
+    
+    def _raporteaza_echivalente(self, randuri, are_hub_statie, file_path):
+        """Un singur mesaj de log pentru toate rutele fără echivalență / negăsite în Hub-Statie"""
+        if not are_hub_statie:
+            self.logger.warning(f"Nu s-a găsit fișierul Hub-Statie corespondent pentru {file_path}")
+            return
+        
+        fara_echivalenta = randuri.loc[randuri['ruta_echivalenta'].isna(), 'ruta']
+        if len(fara_echivalenta):
+            self.logger.warning(f"Nu s-a găsit echivalența pentru {len(fara_echivalenta)} rute: "
+                                f"{_enumera(fara_echivalenta)}")
+        negasite = randuri.loc[randuri['ruta_echivalenta'].notna() & ~randuri['gasita_hub_statie'], 'ruta_echivalenta']
+        if len(negasite):
+            self.logger.warning(f"Nu s-au găsit {len(negasite)} rute echivalente în Hub-Statie: {_enumera(negasite)}")
+        self.logger.info(f"Procent intrare preluat din Hub-Statie pentru "
+                         f"{int(randuri['gasita_hub_statie'].sum())}/{len(randuri)} rute")
     
     def get_centre_report_last_30_days(self, centru, data_raport):
         """Obține raportul pentru un centru pe ultimele 30 de zile"""
-        conn = sqlite3.connect(self.db_path)
-        
         data_start = (datetime.strptime(data_raport, '%Y-%m-%d') - timedelta(days=30)).strftime('%Y-%m-%d')
         
-        query = '''
-            SELECT 
-                data_raport,
-                centru,
-                ruta,
-                nr_colete,
-                greutate,
-                procent_iesire_centru,
-                procent_intrare_centru
-            FROM rapoarte_istoric
-            WHERE centru = ? 
-                AND data_raport >= ? 
-                AND data_raport <= ?
-            ORDER BY data_raport DESC, ruta
-        '''
-        
-        df = pd.read_sql_query(query, conn, params=(centru, data_start, data_raport))
-        conn.close()
-        
-        return df
+        return self.baza.citeste_df(INTEROGARE_ISTORIC_CENTRU, (centru, data_start, data_raport))
     
     def get_centre_report_last_3_days(self, centru, data_raport):
         """Obține raportul pentru un centru pe ultimele 3 zile cu statistici zilnice"""
-        conn = sqlite3.connect(self.db_path)
-        
         # Calculăm data de start pentru ultimele 3 zile (inclusiv data raportului)
         data_end = datetime.strptime(data_raport, '%Y-%m-%d')
         data_start = data_end - timedelta(days=2)  # 3 zile: azi, ieri, alaltăieri
         data_start_str = data_start.strftime('%Y-%m-%d')
         
-        query = '''
-            SELECT 
-                data_raport,
-                centru,
-                ruta,
-                nr_colete,
-                greutate,
-                procent_iesire_centru,
-                procent_intrare_centru
-            FROM rapoarte_istoric
-            WHERE centru = ? 
-                AND data_raport >= ? 
-                AND data_raport <= ?
-            ORDER BY data_raport DESC, ruta
-        '''
-        
-        df = pd.read_sql_query(query, conn, params=(centru, data_start_str, data_raport))
-        conn.close()
-        
-        return df
+        return self.baza.citeste_df(INTEROGARE_ISTORIC_CENTRU, (centru, data_start_str, data_raport))
     
     def get_daily_stats_last_3_days(self, centru, data_raport):
         """Calculează statistici zilnice pentru ultimele 3 zile"""
@@ -817,26 +942,13 @@ class EmailReportingSystem:
     
     def send_all_centre_reports(self, data_raport):
         """Trimite rapoarte pentru toate centrele care au date în ultimele 3 zile"""
-        conn = sqlite3.connect(self.db_path)
-        
-        # Obține lista centrelor cu date în ultimele 3 zile
-        query = '''
-            SELECT DISTINCT centru 
-            FROM rapoarte_istoric 
-            WHERE data_raport >= ? 
-            AND centru != 'NECUNOSCUT'
-            ORDER BY centru
-        '''
-        
         # Calculează data de start pentru ultimele 3 zile
         data_end = datetime.strptime(data_raport, '%Y-%m-%d')
         data_start = data_end - timedelta(days=2)  # 3 zile: azi, ieri, alaltăieri
         data_start_str = data_start.strftime('%Y-%m-%d')
         
-        cursor = conn.cursor()
-        cursor.execute(query, (data_start_str,))
-        centre = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        # Obține lista centrelor cu date în ultimele 3 zile
+        centre = [row[0] for row in self.baza.citeste(INTEROGARE_CENTRE_ACTIVE, (data_start_str,))]
         
         self.logger.info(f"Se trimit rapoarte pentru {len(centre)} centre")
         
@@ -865,28 +977,27 @@ class EmailReportingSystem:
 
 def main():
     """Funcția principală pentru testare"""
-    # Inițializează sistemul
-    email_system = EmailReportingSystem()
-    
-    # Creează template-urile dacă nu există
-    try:
-        email_system.load_email_config()
-    except FileNotFoundError as e:
-        print(f"⚠️ {e}")
-        print("Completați configurația email și rulați din nou.")
-        return
-    
-    try:
-        email_system.load_email_addresses()
-    except FileNotFoundError as e:
-        print(f"⚠️ {e}")
-        print("Actualizați adresele email pentru centre și rulați din nou.")
-        return
-    
-    print("✅ Sistemul de email reporting a fost inițializat cu succes!")
-    print(f"📧 Configurație email: {email_system.config_path}")
-    print(f"📬 Adrese email centre: {email_system.email_addresses_path}")
-    print(f"🗄️ Baza de date istoric: {email_system.db_path}")
+    # Inițializează sistemul (conexiunile la istoric sunt închise la ieșirea din bloc)
+    with EmailReportingSystem() as email_system:
+        # Creează template-urile dacă nu există
+        try:
+            email_system.load_email_config()
+        except FileNotFoundError as e:
+            print(f"⚠️ {e}")
+            print("Completați configurația email și rulați din nou.")
+            return
+        
+        try:
+            email_system.load_email_addresses()
+        except FileNotFoundError as e:
+            print(f"⚠️ {e}")
+            print("Actualizați adresele email pentru centre și rulați din nou.")
+            return
+        
+        print("✅ Sistemul de email reporting a fost inițializat cu succes!")
+        print(f"📧 Configurație email: {email_system.config_path}")
+        print(f"📬 Adrese email centre: {email_system.email_addresses_path}")
+        print(f"🗄️ Baza de date istoric: {email_system.db_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
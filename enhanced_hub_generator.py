@@ -4,23 +4,29 @@ Enhanced HUB Report Generator cu funcționalitate email
 Extinde generatorul existent cu salvarea în istoric și trimiterea de email-uri
 """
 
-import pandas as pd
 import os
 from datetime import datetime
 from unified_hub_report_generator import (
-    UnifiedHubReportGenerator, 
-    BRASOV_CONFIG, 
-    SIBIU_CONFIG,
-    generate_all_hub_reports
+    HUB_CONFIGS,
+    generate_all_hub_reports,
+    genereaza_rapoarte_hub_uri
 )
-from email_reporting_system import EmailReportingSystem
+from email_reporting_system import INTEROGARE_CENTRE_DISPONIBILE, EmailReportingSystem
+from report_writers import MOTOR_EXCEL_IMPLICIT
 
 class EnhancedHubGenerator:
-    def __init__(self, base_url=None):
+    def __init__(self, base_url=None, procese=None, motor_excel=MOTOR_EXCEL_IMPLICIT, formate_iesire=None):
         if base_url is None:
             base_url = '/Users/telermarius/Library/CloudStorage/Dropbox/DSC/Rapoarte/HUB Brasov/'
         
         self.base_url = base_url
+        # procese > 1: rapoartele (hub x direcție) sunt construite în paralel
+        self.procese = procese
+        # Motorul Excel și formatul fiecărei foi (vezi UnifiedHubReportGenerator)
+        self.motor_excel = motor_excel
+        self.formate_iesire = formate_iesire
+        # Foile Sumar ale ultimei generări: {nume_hub: {'statie_hub'/'hub_statie': DataFrame}}
+        self.sumare = {}
         self.email_system = EmailReportingSystem(base_url)
     
     def generate_reports_with_email(self, data_raport, send_emails=True):
@@ -73,13 +79,15 @@ class EnhancedHubGenerator:
                 print(f"❌ Fișierul master nu există: {fisier_master}")
                 return False
             
-            print("📈 Generez rapoarte pentru Brașov...")
-            generator_brasov = UnifiedHubReportGenerator(fisier_master, data_raport, self.base_url, BRASOV_CONFIG)
-            generator_brasov.genereaza_rapoarte()
-            
-            print("\n📈 Generez rapoarte pentru Sibiu...")
-            generator_sibiu = UnifiedHubReportGenerator(fisier_master, data_raport, self.base_url, SIBIU_CONFIG)
-            generator_sibiu.genereaza_rapoarte()
+            # Master-ul este încărcat o singură dată pentru toate hub-urile; foile Sumar sunt
+            # păstrate pentru istoric, fără recitirea fișierelor Excel
+            self.sumare = {}
+            rezultate = genereaza_rapoarte_hub_uri(
+                fisier_master, data_raport, self.base_url, HUB_CONFIGS, procese=self.procese, sumare=self.sumare,
+                motor_excel=self.motor_excel, formate_iesire=self.formate_iesire
+            )
+            if not all(rezultate.values()):
+                return False
             
             return True
             
@@ -88,61 +96,30 @@ class EnhancedHubGenerator:
             return False
     
     def _save_reports_to_history(self, data_raport):
-        """Salvează rapoartele în istoric pentru email-uri"""
+        """Salvează rapoartele în istoric pentru email-uri, din foile Sumar returnate de generator"""
         try:
-            data_obj = datetime.strptime(data_raport, "%Y-%m-%d")
-            data_str = data_obj.strftime("%d.%m")
-            data_urmatoare_str = (data_obj.replace(day=data_obj.day + 1) if data_obj.day < 28 
-                                else data_obj.replace(month=data_obj.month + 1, day=1)).strftime("%d.%m")
-            
-            # Procesează rapoartele Brașov
-            self._process_hub_reports('Brasov', data_str, data_urmatoare_str, data_raport)
-            
-            # Procesează rapoartele Sibiu
-            self._process_hub_reports('Sibiu', data_str, data_urmatoare_str, data_raport)
+            for hub, sumare_hub in self.sumare.items():
+                self._process_hub_reports(hub.capitalize(), sumare_hub, data_raport)
             
         except Exception as e:
             print(f"⚠️ Eroare la salvarea în istoric: {str(e)}")
     
-    def _process_hub_reports(self, hub_name, data_str, data_urmatoare_str, data_raport):
-        """Procesează rapoartele pentru un hub specific"""
-        # Paths pentru rapoarte
-        statie_hub_path = os.path.join(
-            self.base_url, 
-            f"Raport Statie-Hub {hub_name} {data_str}-{data_urmatoare_str}.xlsx"
-        )
-        hub_statie_path = os.path.join(
-            self.base_url, 
-            f"Raport HUB-Statie {hub_name} {data_str}-{data_urmatoare_str}.xlsx"
-        )
-        
-        # Procesează Statie-Hub
-        if os.path.exists(statie_hub_path):
-            try:
-                df_sumar = pd.read_excel(statie_hub_path, sheet_name='Sumar')
-                # Exclude rândul Total
-                df_sumar = df_sumar[df_sumar['Ruta'] != 'Total']
-                self.email_system.save_report_to_history(data_raport, hub_name, 'Statie-Hub', df_sumar, statie_hub_path)
-                print(f"✅ Salvat istoric Statie-Hub {hub_name}")
-            except Exception as e:
-                print(f"⚠️ Eroare salvare Statie-Hub {hub_name}: {str(e)}")
-                # Debug info
-                import traceback
-                traceback.print_exc()
-        
-        # Procesează Hub-Statie
-        if os.path.exists(hub_statie_path):
-            try:
-                df_sumar = pd.read_excel(hub_statie_path, sheet_name='Sumar')
-                # Exclude rândul Total
-                df_sumar = df_sumar[df_sumar['Ruta'] != 'Total']
-                self.email_system.save_report_to_history(data_raport, hub_name, 'Hub-Statie', df_sumar, hub_statie_path)
-                print(f"✅ Salvat istoric Hub-Statie {hub_name}")
-            except Exception as e:
-                print(f"⚠️ Eroare salvare Hub-Statie {hub_name}: {str(e)}")
-                # Debug info
-                import traceback
-                traceback.print_exc()
+    def _process_hub_reports(self, hub_name, sumare_hub, data_raport):
+        """Procesează rapoartele pentru un hub specific (Statie-Hub, cu procentele din Hub-Statie)"""
+        try:
+            df_sumar = sumare_hub['statie_hub']
+            # Exclude rândul Total
+            df_sumar = df_sumar[df_sumar['Ruta'] != 'Total']
+            self.email_system.save_report_to_history(
+                data_raport, hub_name, 'Statie-Hub', df_sumar,
+                raport_data_hub_statie=sumare_hub['hub_statie']
+            )
+            print(f"✅ Salvat istoric {hub_name}")
+        except Exception as e:
+            print(f"⚠️ Eroare salvare istoric {hub_name}: {str(e)}")
+            # Debug info
+            import traceback
+            traceback.print_exc()
     
     def setup_email_system(self):
         """Configurează sistemul de email (creează template-urile)"""
@@ -180,31 +157,23 @@ class EnhancedHubGenerator:
             print(f"❌ Eroare: {str(e)}")
             return False
     
+    def close(self):
+        """Închide sistemul de email (conexiunile la baza de date a istoricului)"""
+        self.email_system.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
     def get_available_centres(self, data_raport):
         """Returnează lista centrelor disponibile pentru raportare"""
-        import sqlite3
         from datetime import timedelta
         
-        conn = sqlite3.connect(self.email_system.db_path)
-        
         data_start = (datetime.strptime(data_raport, '%Y-%m-%d') - timedelta(days=30)).strftime('%Y-%m-%d')
         
-        query = '''
-            SELECT DISTINCT centru, COUNT(*) as numar_rute
-            FROM rapoarte_istoric 
-            WHERE data_raport >= ? 
-            AND data_raport <= ?
-            AND centru != 'NECUNOSCUT'
-            GROUP BY centru
-            ORDER BY centru
-        '''
-        
-        cursor = conn.cursor()
-        cursor.execute(query, (data_start, data_raport))
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
+        return self.email_system.baza.citeste(INTEROGARE_CENTRE_DISPONIBILE, (data_start, data_raport))
 
 def main():
     """Funcția principală"""
@@ -214,98 +183,102 @@ def main():
     # Inițializează generatorul
     generator = EnhancedHubGenerator()
     
-    # Meniu interactiv
-    while True:
-        print("\nSelectați o opțiune:")
-        print("1. Generează rapoarte cu email (complet)")
-        print("2. Generează doar rapoarte (fără email)")
-        print("3. Trimite doar email-uri (din istoric)")
-        print("4. Configurează sistemul de email")
-        print("5. Trimite email de test")
-        print("6. Vezi centrele disponibile")
-        print("0. Ieșire")
-        
-        try:
-            optiune = input("\nOpțiunea (0-6): ").strip()
-            
-            if optiune == "0":
-                print("👋 La revedere!")
-                break
+    # La ieșire, baza de date a istoricului este optimizată și jurnalul WAL transferat în fișierul .db
+    try:
+        # Meniu interactiv
+        while True:
+            print("\nSelectați o opțiune:")
+            print("1. Generează rapoarte cu email (complet)")
+            print("2. Generează doar rapoarte (fără email)")
+            print("3. Trimite doar email-uri (din istoric)")
+            print("4. Configurează sistemul de email")
+            print("5. Trimite email de test")
+            print("6. Vezi centrele disponibile")
+            print("0. Ieșire")
             
-            elif optiune == "1":
-                data_raport = input("Data raport (YYYY-MM-DD): ").strip()
-                if not data_raport:
-                    data_raport = datetime.now().strftime("%Y-%m-%d")
+            try:
+                optiune = input("\nOpțiunea (0-6): ").strip()
                 
-                generator.generate_reports_with_email(data_raport, send_emails=True)
-            
-            elif optiune == "2":
-                data_raport = input("Data raport (YYYY-MM-DD): ").strip()
-                if not data_raport:
-                    data_raport = datetime.now().strftime("%Y-%m-%d")
+                if optiune == "0":
+                    print("👋 La revedere!")
+                    break
                 
-                generator.generate_reports_with_email(data_raport, send_emails=False)
-            
-            elif optiune == "3":
-                data_raport = input("Data raport (YYYY-MM-DD): ").strip()
-                if not data_raport:
-                    data_raport = datetime.now().strftime("%Y-%m-%d")
+                elif optiune == "1":
+                    data_raport = input("Data raport (YYYY-MM-DD): ").strip()
+                    if not data_raport:
+                        data_raport = datetime.now().strftime("%Y-%m-%d")
+                    
+                    generator.generate_reports_with_email(data_raport, send_emails=True)
                 
-                try:
-                    success_count, total_count = generator.email_system.send_all_centre_reports(data_raport)
-                    print(f"✅ Email-uri trimise: {success_count}/{total_count}")
-                except Exception as e:
-                    print(f"❌ Eroare: {str(e)}")
-            
-            elif optiune == "4":
-                generator.setup_email_system()
-            
-            elif optiune == "5":
-                data_raport = input("Data raport (YYYY-MM-DD): ").strip()
-                if not data_raport:
-                    data_raport = datetime.now().strftime("%Y-%m-%d")
+                elif optiune == "2":
+                    data_raport = input("Data raport (YYYY-MM-DD): ").strip()
+                    if not data_raport:
+                        data_raport = datetime.now().strftime("%Y-%m-%d")
+                    
+                    generator.generate_reports_with_email(data_raport, send_emails=False)
                 
-                centre_disponibile = generator.get_available_centres(data_raport)
-                if not centre_disponibile:
-                    print("❌ Nu există centre disponibile pentru această dată")
-                    continue
+                elif optiune == "3":
+                    data_raport = input("Data raport (YYYY-MM-DD): ").strip()
+                    if not data_raport:
+                        data_raport = datetime.now().strftime("%Y-%m-%d")
+                    
+                    try:
+                        success_count, total_count = generator.email_system.send_all_centre_reports(data_raport)
+                        print(f"✅ Email-uri trimise: {success_count}/{total_count}")
+                    except Exception as e:
+                        print(f"❌ Eroare: {str(e)}")
                 
-                print("\nCentre disponibile:")
-                for i, (centru, numar_rute) in enumerate(centre_disponibile, 1):
-                    print(f"{i}. {centru} ({numar_rute} rute)")
+                elif optiune == "4":
+                    generator.setup_email_system()
                 
-                try:
-                    idx = int(input("Selectați centrul pentru test (numărul): ")) - 1
-                    if 0 <= idx < len(centre_disponibile):
-                        centru = centre_disponibile[idx][0]
-                        generator.send_test_email(centru, data_raport)
-                    else:
-                        print("❌ Selecție invalidă")
-                except ValueError:
-                    print("❌ Introduceți un număr valid")
-            
-            elif optiune == "6":
-                data_raport = input("Data raport (YYYY-MM-DD): ").strip()
-                if not data_raport:
-                    data_raport = datetime.now().strftime("%Y-%m-%d")
+                elif optiune == "5":
+                    data_raport = input("Data raport (YYYY-MM-DD): ").strip()
+                    if not data_raport:
+                        data_raport = datetime.now().strftime("%Y-%m-%d")
+                    
+                    centre_disponibile = generator.get_available_centres(data_raport)
+                    if not centre_disponibile:
+                        print("❌ Nu există centre disponibile pentru această dată")
+                        continue
+                    
+                    print("\nCentre disponibile:")
+                    for i, (centru, numar_rute) in enumerate(centre_disponibile, 1):
+                        print(f"{i}. {centru} ({numar_rute} rute)")
+                    
+                    try:
+                        idx = int(input("Selectați centrul pentru test (numărul): ")) - 1
+                        if 0 <= idx < len(centre_disponibile):
+                            centru = centre_disponibile[idx][0]
+                            generator.send_test_email(centru, data_raport)
+                        else:
+                            print("❌ Selecție invalidă")
+                    except ValueError:
+                        print("❌ Introduceți un număr valid")
                 
-                centre_disponibile = generator.get_available_centres(data_raport)
+                elif optiune == "6":
+                    data_raport = input("Data raport (YYYY-MM-DD): ").strip()
+                    if not data_raport:
+                        data_raport = datetime.now().strftime("%Y-%m-%d")
+                    
+                    centre_disponibile = generator.get_available_centres(data_raport)
+                    
+                    print(f"\nCentre disponibile pentru {data_raport} (ultimele 30 zile):")
+                    if centre_disponibile:
+                        for centru, numar_rute in centre_disponibile:
+                            print(f"• {centru}: {numar_rute} rute")
+                    else:
+                        print("❌ Nu există date pentru această perioadă")
                 
-                print(f"\nCentre disponibile pentru {data_raport} (ultimele 30 zile):")
-                if centre_disponibile:
-                    for centru, numar_rute in centre_disponibile:
-                        print(f"• {centru}: {numar_rute} rute")
                 else:
-                    print("❌ Nu există date pentru această perioadă")
-            
-            else:
-                print("❌ Opțiune invalidă")
-                
-        except KeyboardInterrupt:
-            print("\n👋 Operațiune anulată.")
-            break
-        except Exception as e:
-            print(f"❌ Eroare: {str(e)}")
+                    print("❌ Opțiune invalidă")
+                    
+            except KeyboardInterrupt:
+                print("\n👋 Operațiune anulată.")
+                break
+            except Exception as e:
+                print(f"❌ Eroare: {str(e)}")
+    finally:
+        generator.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
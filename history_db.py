@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Acces la baza de date SQLite a istoricului de rapoarte
+- Conexiunile sunt deschise o singură dată și refolosite pe toată durata sistemului
+- Jurnal WAL: citirile nu blochează scrierea și nici invers
+- synchronous=NORMAL (sigur în modul WAL) și I/O mapat în memorie (mmap_size)
+- Instrucțiunile SQL sunt pregătite o singură dată pe conexiune (cache-ul sqlite3 după textul interogării)
+- Fiecare fir de execuție citește prin propria conexiune (închisă după terminarea firului);
+  scrierile trec printr-o singură conexiune protejată de un lock
+- Statisticile planificatorului (ANALYZE) sunt reîmprospătate automat după ce o parte suficientă
+  din tabel a fost modificată (numărul de rânduri analizate este păstrat în tabelul TABEL_ANALIZA)
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Dimensiunea zonei mapate în memorie pentru citiri (bytes)
+MMAP_SIZE_IMPLICIT = 256 * 1024 * 1024
+
+# Numărul de instrucțiuni pregătite păstrate pe conexiune
+INSTRUCTIUNI_PREGATITE = 128
+
+# Cât așteaptă o conexiune după un lock al altui proces (secunde)
+TIMEOUT_LOCK = 30
+
+# ANALYZE se repetă când rândurile modificate de la ultima analiză depășesc 10% din rândurile analizate
+PRAG_ANALIZA = 0.1
+
+# Tabelul cu numărul de rânduri la ultima analiză și modificările de atunci, pe tabel
+TABEL_ANALIZA = 'analiza_statistici'
+
+# Rândurile examinate per index de ANALYZE (limitează durata pe baze de date mari)
+LIMITA_ANALIZA = 1000
+
+
+class BazaIstoric:
+    def __init__(self, db_path, mmap_size=MMAP_SIZE_IMPLICIT):
+        self.db_path = db_path
+        self.mmap_size = mmap_size
+        self._lock_scriere = threading.Lock()
+        self._lock_conexiuni = threading.Lock()
+        # Conexiunile de citire pe fir de execuție: {thread: conexiune}
+        self._citire = {}
+        self._conexiuni = []
+
+        self._scriere = self._conecteaza()
+        # Modul WAL este persistent în fișierul bazei de date
+        self._scriere.execute('PRAGMA journal_mode=WAL')
+
+    def _conecteaza(self):
+        # check_same_thread=False: conexiunea de scriere este folosită (sub lock) din orice fir,
+        # iar inchide() poate închide conexiunile de citire ale celorlalte fire
+        conn = sqlite3.connect(
+            self.db_path, timeout=TIMEOUT_LOCK, check_same_thread=False,
+            cached_statements=INSTRUCTIUNI_PREGATITE
+        )
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+        with self._lock_conexiuni:
+            self._conexiuni.append(conn)
+        return conn
+
+    def _conexiune_citire(self):
+        """Conexiunea de citire a firului curent (deschisă la prima citire și păstrată)"""
+        fir = threading.current_thread()
+        conn = self._citire.get(fir)
+        if conn is None:
+            self._inchide_conexiuni_fire_terminate()
+            conn = self._conecteaza()
+            with self._lock_conexiuni:
+                self._citire[fir] = conn
+        return conn
+
+    def _inchide_conexiuni_fire_terminate(self):
+        """
+        Închide conexiunile de citire ale firelor terminate (ex: fire de pool recreate), astfel încât
+        numărul de conexiuni deschise nu crește cu fiecare fir nou.
+        """
+        with self._lock_conexiuni:
+            for fir in [fir for fir in self._citire if not fir.is_alive()]:
+                conn = self._citire.pop(fir)
+                self._conexiuni.remove(conn)
+                conn.close()
+
+    @contextmanager
+    def scrie(self):
+        """Tranzacție de scriere: commit la final, rollback la eroare"""
+        with self._lock_scriere:
+            with self._scriere:
+                yield self._scriere
+
+    def versiune_schema(self):
+        return self.citeste('PRAGMA user_version')[0][0]
+
+    def analizeaza_daca_e_nevoie(self, tabel, modificari=0):
+        """
+        Rulează ANALYZE dacă tabelul nu a fost încă analizat (și nu este gol) sau dacă rândurile
+        modificate de la ultima analiză depășesc PRAG_ANALIZA din rândurile de atunci.
+        modificari: rândurile inserate/înlocuite/șterse de apelant de la apelul anterior; sunt
+        adunate în TABEL_ANALIZA, deci tabelul nu este renumărat la fiecare salvare.
+        Returnează True dacă a rulat ANALYZE.
+        """
+        with self._lock_scriere:
+            conn = self._scriere
+            with conn:
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {TABEL_ANALIZA} (
+                        tabel TEXT PRIMARY KEY,
+                        randuri INTEGER NOT NULL,
+                        modificari INTEGER NOT NULL
+                    )
+                """)
+                stare = conn.execute(
+                    f"SELECT randuri, modificari FROM {TABEL_ANALIZA} WHERE tabel = ?", (tabel,)
+                ).fetchone()
+                if stare is not None:
+                    randuri, modificari = stare[0], stare[1] + modificari
+                    if modificari <= PRAG_ANALIZA * max(randuri, 1):
+                        if modificari != stare[1]:
+                            conn.execute(f"UPDATE {TABEL_ANALIZA} SET modificari = ? WHERE tabel = ?",
+                                         (modificari, tabel))
+                        return False
+                elif self._numara(conn, tabel) == 0:
+                    return False
+
+            conn.execute(f'PRAGMA analysis_limit={LIMITA_ANALIZA}')
+            conn.execute('ANALYZE')
+            with conn:
+                conn.execute(f"INSERT OR REPLACE INTO {TABEL_ANALIZA} VALUES (?, ?, 0)",
+                             (tabel, self._numara(conn, tabel)))
+            return True
+
+    @staticmethod
+    def _numara(conn, tabel):
+        return conn.execute(f'SELECT COUNT(*) FROM "{tabel}"').fetchone()[0]
+
+    def citeste(self, query, params=()):
+        """Rândurile unei interogări (listă de tupluri)"""
+        return self._conexiune_citire().execute(query, params).fetchall()
+
+    def citeste_df(self, query, params=()):
+        """Rezultatul unei interogări ca DataFrame"""
+        return pd.read_sql_query(query, self._conexiune_citire(), params=params)
+
+    def inchide(self):
+        """
+        Închide toate conexiunile. Jurnalul WAL este transferat în fișierul bazei de date,
+        astfel încât fișierul .db rămâne complet și fără fișierele -wal/-shm (ex: în Dropbox).
+        Apelurile repetate nu au efect.
+        """
+        if not self._conexiuni:
+            return
+        with self._lock_scriere:
+            self._scriere.execute('PRAGMA optimize')
+            self._scriere.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        with self._lock_conexiuni:
+            for conn in self._conexiuni:
+                conn.close()
+            self._conexiuni.clear()
+            self._citire.clear()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Încărcarea fișierului master pentru generatorul de rapoarte HUB
+- Citește doar coloanele folosite, cu tipuri declarate (schema master)
+- Motor de citire selectabil: pandas (implicit) sau pyarrow (CSV multithread)
+- Păstrează un cache columnar (Parquet) lângă master_data.csv
+- Cache-ul este validat pe baza dimensiunii, mtime și hash-ului conținutului
+- Se reconstruiește automat când fișierul master se modifică; dacă fișierul doar a
+  crescut prin adăugare la final, se citește numai coada nouă (ingestie incrementală)
+- Mod streaming: citire pe blocuri, păstrând doar rândurile din ferestrele raportului
+"""
+
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+
+from scan_windows import masca_fereastra
+
+try:
+    import pyarrow  # noqa: F401 - necesar pentru Parquet
+    PYARROW_DISPONIBIL = True
+except ImportError:
+    PYARROW_DISPONIBIL = False
+
+# Se incrementează când se schimbă modul în care se construiește cache-ul
+VERSIUNE_CACHE = 4
+
+# Schema fișierului master: doar coloanele folosite de rapoarte.
+# Dimensiunile cu puține valori distincte se încarcă drept categorii;
+# None înseamnă tipul dedus de pandas (păstrează formatul din rapoarte).
+SCHEMA_MASTER = {
+    'CodBare': None,
+    'Tip Scanare': 'category',
+    'Centru': 'category',
+    'Ruta': 'category',
+    'Centru exp': None,
+    'Centru dest': None,
+    'Expeditor': None,
+    'Destinatar': None,
+    'bucati': None,
+    'Greutate': 'float64',
+    'Categorie': 'category',
+    'Scanare': 'datetime64[ns]',
+    'User': 'category'
+}
+
+COLOANE_MASTER = list(SCHEMA_MASTER)
+
+# Formatul coloanei Scanare în master_data.csv
+FORMAT_SCANARE = "%Y-%m-%d %H:%M:%S"
+
+# Motoarele disponibile pentru citirea CSV-ului master
+MOTOARE_CITIRE = ('pandas', 'pyarrow')
+
+DIMENSIUNE_BLOC_HASH = 8 * 1024 * 1024
+
+# Numărul de rânduri citite odată în modul streaming
+DIMENSIUNE_BLOC_STREAM = 500_000
+
+
+def cale_cache(fisier_master):
+    """Returnează calea fișierului Parquet de cache pentru un fișier master"""
+    return f"{os.path.splitext(fisier_master)[0]}.parquet"
+
+
+def cale_metadate_cache(fisier_master):
+    """Returnează calea fișierului JSON cu metadatele cache-ului"""
+    return f"{os.path.splitext(fisier_master)[0]}.cache.json"
+
+
+def _hash_nou():
+    return hashlib.blake2b(digest_size=20)
+
+
+def _actualizeaza_hash(h, f, nr_bytes=None):
+    """Adaugă la hash conținutul citit din f (tot restul fișierului sau nr_bytes)"""
+    ramas = nr_bytes
+    while ramas is None or ramas > 0:
+        bloc = f.read(DIMENSIUNE_BLOC_HASH if ramas is None else min(DIMENSIUNE_BLOC_HASH, ramas))
+        if not bloc:
+            break
+        h.update(bloc)
+        if ramas is not None:
+            ramas -= len(bloc)
+
+
+def calculeaza_hash_fisier(fisier):
+    """Calculează hash-ul conținutului unui fișier, citit în blocuri"""
+    h = _hash_nou()
+    with open(fisier, 'rb') as f:
+        _actualizeaza_hash(h, f)
+    return h.hexdigest()
+
+
+def _termina_cu_newline(fisier, dimensiune):
+    """Verifică dacă primii `dimensiune` bytes ai fișierului se termină cu un rând complet"""
+    if dimensiune == 0:
+        return False
+    with open(fisier, 'rb') as f:
+        f.seek(dimensiune - 1)
+        return f.read(1) == b'\n'
+
+
+def _amprenta_fisier(fisier):
+    """Dimensiunea și mtime-ul fișierului (fără citirea conținutului)"""
+    st = os.stat(fisier)
+    return {'dimensiune': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def _citeste_metadate(fisier_master):
+    cale = cale_metadate_cache(fisier_master)
+    if not os.path.exists(cale) or not os.path.exists(cale_cache(fisier_master)):
+        return None
+    try:
+        with open(cale, 'r', encoding='utf-8') as f:
+            metadate = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if metadate.get('versiune') != VERSIUNE_CACHE:
+        return None
+    return metadate
+
+
+def _scrie_metadate(fisier_master, metadate):
+    cale = cale_metadate_cache(fisier_master)
+    cale_temp = f"{cale}.tmp"
+    with open(cale_temp, 'w', encoding='utf-8') as f:
+        json.dump(metadate, f, indent=4)
+    os.replace(cale_temp, cale)
+
+
+def converteste_scanare(valori, format_scanare=FORMAT_SCANARE):
+    """Convertește coloana Scanare cu formatul explicit, cu fallback la detecție automată"""
+    try:
+        return pd.to_datetime(valori, format=format_scanare)
+    except (ValueError, TypeError):
+        print(f"⚠️ Coloana Scanare nu respectă formatul {format_scanare}, se detectează automat")
+        return pd.to_datetime(valori)
+
+
+def _dtypes_citire():
+    """Tipurile transmise la read_csv (Scanare se convertește separat)"""
+    return {
+        coloana: tip for coloana, tip in SCHEMA_MASTER.items()
+        if tip is not None and coloana != 'Scanare'
+    }
+
+
+def _dtypes_necategorizate():
+    """Tipurile de citire fără categorii (categoriile ar diferi de la un bloc la altul)"""
+    return {coloana: tip for coloana, tip in _dtypes_citire().items() if tip != 'category'}
+
+
+def tipizeaza_categorii(df):
+    """
+    Categoriile citite din CSV sunt text; valorile lor primesc tipul pe care pandas l-ar fi dedus
+    pentru coloană (ex: User sau Ruta numerice -> int64), astfel încât rapoartele păstrează valorile,
+    ordinea și celulele inițiale. Se convertesc doar valorile distincte.
+    """
+    for coloana in df.columns:
+        tip = df[coloana].dtype
+        if not isinstance(tip, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(tip.categories):
+            continue
+        numerice = pd.to_numeric(tip.categories.astype(object), errors='coerce')
+        if len(numerice) == 0 or numerice.isna().any():
+            continue
+        if numerice.duplicated().any():
+            # Texte diferite cu aceeași valoare numerică (ex: '05' și '5')
+            df[coloana] = df[coloana].map(dict(zip(tip.categories, numerice))).astype('category')
+        else:
+            df[coloana] = df[coloana].cat.rename_categories(numerice).cat.reorder_categories(numerice.sort_values())
+    return df
+
+
+def aplica_schema(df, format_scanare=FORMAT_SCANARE):
+    """Aduce un DataFrame citit din CSV la schema master (Scanare ca datetime, categorii tipizate)"""
+    if not pd.api.types.is_datetime64_any_dtype(df['Scanare']):
+        df['Scanare'] = converteste_scanare(df['Scanare'], format_scanare)
+    return tipizeaza_categorii(df)
+
+
+def citeste_master_csv(fisier_master, format_scanare=FORMAT_SCANARE, motor='pandas'):
+    """Citește fișierul master direct din CSV (fără cache), conform schemei"""
+    if motor not in MOTOARE_CITIRE:
+        raise ValueError(f"Motor de citire necunoscut: {motor} (disponibile: {', '.join(MOTOARE_CITIRE)})")
+    if motor == 'pyarrow':
+        return _citeste_master_pyarrow(fisier_master, format_scanare)
+
+    df = pd.read_csv(
+        fisier_master,
+        usecols=COLOANE_MASTER,
+        dtype=_dtypes_citire()
+    )
+    return aplica_schema(df, format_scanare)
+
+
+def _citeste_master_pyarrow(fisier_master, format_scanare=FORMAT_SCANARE):
+    """
+    Citește fișierul master cu cititorul CSV multithread din pyarrow.
+    Aceeași schemă ca varianta pandas: categoriile devin dictionary, Scanare se
+    parsează cu formatul explicit (cu fallback la detecția automată din pandas).
+    """
+    if not PYARROW_DISPONIBIL:
+        raise ImportError("Motorul de citire 'pyarrow' necesită pyarrow (pip install pyarrow)")
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    tipuri = {}
+    for coloana, tip in SCHEMA_MASTER.items():
+        if tip == 'category':
+            tipuri[coloana] = pa.dictionary(pa.int32(), pa.string())
+        elif tip == 'float64':
+            tipuri[coloana] = pa.float64()
+
+    def citeste(tip_scanare, parsere):
+        optiuni_conversie = pa_csv.ConvertOptions(
+            include_columns=COLOANE_MASTER,
+            column_types={**tipuri, 'Scanare': tip_scanare},
+            timestamp_parsers=parsere,
+            # Ca în pandas: celulele goale devin NaN și în coloanele text
+            strings_can_be_null=True
+        )
+        return pa_csv.read_csv(
+            fisier_master,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=optiuni_conversie
+        )
+
+    try:
+        tabel = citeste(pa.timestamp('ns'), [format_scanare])
+    except pa.ArrowInvalid:
+        # Scanare nu respectă formatul: se citește ca text și se convertește ca în pandas
+        tabel = citeste(pa.string(), None)
+
+    return aplica_schema(tabel.to_pandas(), format_scanare)
+
+
+def _scrie_cache(fisier_master, df_master, amprenta, hash_continut):
+    """Scrie cache-ul Parquet și metadatele (atomic, prin fișiere temporare)"""
+    cale = cale_cache(fisier_master)
+    cale_temp = f"{cale}.tmp"
+    try:
+        df_master.to_parquet(cale_temp, index=False)
+        os.replace(cale_temp, cale)
+    except Exception as e:
+        print(f"⚠️ Nu s-a putut scrie cache-ul master ({cale}): {str(e)}")
+        if os.path.exists(cale_temp):
+            os.remove(cale_temp)
+        return False
+
+    _scrie_metadate(fisier_master, {
+        'versiune': VERSIUNE_CACHE,
+        'fisier_master': os.path.basename(fisier_master),
+        'dimensiune': amprenta['dimensiune'],
+        'mtime_ns': amprenta['mtime_ns'],
+        'hash': hash_continut,
+        # Marcajul pentru ingestia incrementală: offset-ul (dimensiune) este la capăt de rând
+        'termina_cu_newline': _termina_cu_newline(fisier_master, amprenta['dimensiune'])
+    })
+    return True
+
+
+def citeste_cache(fisier_master):
+    """
+    Citește cache-ul Parquet. Parquet păstrează ca dicționar doar categoriile text, deci coloanele
+    categoriale cu valori numerice (ex: User numeric) sunt recategorizate.
+    """
+    df_master = pd.read_parquet(cale_cache(fisier_master))
+    for coloana, tip in SCHEMA_MASTER.items():
+        if tip == 'category' and not isinstance(df_master[coloana].dtype, pd.CategoricalDtype):
+            df_master[coloana] = df_master[coloana].astype('category')
+    return df_master
+
+
+def _concateneaza_tipizat(df_vechi, df_nou):
+    """Concatenează coada nouă la datele din cache păstrând tipurile (inclusiv categoriile)"""
+    for coloana in df_vechi.columns:
+        tip_vechi = df_vechi[coloana].dtype
+        if isinstance(tip_vechi, pd.CategoricalDtype):
+            # Categoriile noi se adaugă la final, deci codurile existente rămân neschimbate
+            valori_noi = pd.Index(df_nou[coloana].dropna().unique())
+            if len(valori_noi) and valori_noi.dtype.kind != tip_vechi.categories.dtype.kind:
+                # Ex: text nou într-o coloană numerică - tipul dedus pentru tot fișierul se schimbă
+                raise ValueError(f"Tipul valorilor din coloana {coloana} s-a schimbat")
+            categorii_noi = valori_noi.difference(tip_vechi.categories)
+            if len(categorii_noi):
+                df_vechi[coloana] = df_vechi[coloana].cat.add_categories(categorii_noi)
+            df_nou[coloana] = pd.Categorical(df_nou[coloana], categories=df_vechi[coloana].cat.categories)
+        elif df_nou[coloana].dtype != tip_vechi:
+            df_nou[coloana] = df_nou[coloana].astype(tip_vechi)
+    return pd.concat([df_vechi, df_nou[df_vechi.columns]], ignore_index=True)
+
+
+def _incarca_incremental(fisier_master, metadate, amprenta, format_scanare):
+    """
+    Actualizează cache-ul citind doar rândurile adăugate după marcajul salvat.
+
+    Returnează None dacă fișierul nu a fost doar extins (prefixul diferă de cel din
+    cache) sau dacă actualizarea nu se poate face sigur; apelantul face reîncărcare completă.
+    """
+    offset = metadate['dimensiune']
+    h = _hash_nou()
+    with open(fisier_master, 'rb') as f:
+        _actualizeaza_hash(h, f, offset)
+        if h.copy().hexdigest() != metadate['hash']:
+            print("⚠️ Fișierul master a fost rescris (nu doar extins), se reîncarcă complet")
+            return None
+        coada = f.read()
+
+    try:
+        df_vechi = citeste_cache(fisier_master)
+        coloane_fisier = pd.read_csv(fisier_master, nrows=0).columns
+        df_nou = pd.read_csv(
+            io.BytesIO(coada),
+            header=None,
+            names=coloane_fisier,
+            usecols=COLOANE_MASTER,
+            dtype=_dtypes_necategorizate()
+        )
+        df_nou = aplica_schema(df_nou, format_scanare)
+        df_master = _concateneaza_tipizat(df_vechi, df_nou)
+    except Exception as e:
+        print(f"⚠️ Ingestia incrementală a eșuat, se reîncarcă complet: {str(e)}")
+        return None
+
+    h.update(coada)
+    amprenta = {'dimensiune': offset + len(coada), 'mtime_ns': amprenta['mtime_ns']}
+    _scrie_cache(fisier_master, df_master, amprenta, h.hexdigest())
+    print(f"Fișier master actualizat incremental: {len(df_nou)} înregistrări noi")
+    return df_master
+
+
+def incarca_master(fisier_master, foloseste_cache=True, format_scanare=FORMAT_SCANARE, motor_citire='pandas'):
+    """
+    Încarcă fișierul master, folosind cache-ul Parquet când este valid.
+
+    Cache-ul este considerat valid dacă dimensiunea și mtime-ul coincid cu cele
+    salvate. Dacă doar mtime-ul diferă (ex: fișier atins de Dropbox), se verifică
+    hash-ul conținutului înainte de a reconstrui cache-ul. Dacă fișierul a crescut
+    și începutul lui are același hash ca la ultima încărcare, se citesc doar rândurile noi.
+    """
+    if not foloseste_cache or not PYARROW_DISPONIBIL:
+        return citeste_master_csv(fisier_master, format_scanare, motor_citire)
+
+    amprenta = _amprenta_fisier(fisier_master)
+    metadate = _citeste_metadate(fisier_master)
+
+    if (metadate is not None and metadate.get('termina_cu_newline')
+            and amprenta['dimensiune'] > metadate['dimensiune']):
+        # Fișierul a crescut: se încearcă citirea doar a cozii adăugate
+        df_master = _incarca_incremental(fisier_master, metadate, amprenta, format_scanare)
+        if df_master is not None:
+            return df_master
+
+    if metadate is not None and metadate['dimensiune'] == amprenta['dimensiune']:
+        valid = metadate['mtime_ns'] == amprenta['mtime_ns']
+        if not valid and calculeaza_hash_fisier(fisier_master) == metadate['hash']:
+            # Conținut identic, doar mtime-ul s-a schimbat
+            metadate['mtime_ns'] = amprenta['mtime_ns']
+            _scrie_metadate(fisier_master, metadate)
+            valid = True
+
+        if valid:
+            try:
+                df_master = citeste_cache(fisier_master)
+                print(f"Fișier master încărcat din cache: {cale_cache(fisier_master)}")
+                return df_master
+            except Exception as e:
+                print(f"⚠️ Cache master invalid, se reconstruiește: {str(e)}")
+
+    print("Se reconstruiește cache-ul fișierului master...")
+    hash_continut = calculeaza_hash_fisier(fisier_master)
+    df_master = citeste_master_csv(fisier_master, format_scanare, motor_citire)
+    _scrie_cache(fisier_master, df_master, amprenta, hash_continut)
+    return df_master
+
+
+def filtreaza_master_pe_ferestre(fisier_master, ferestre, dimensiune_bloc=DIMENSIUNE_BLOC_STREAM,
+                                 format_scanare=FORMAT_SCANARE):
+    """
+    Citește fișierul master pe blocuri și distribuie fiecare rând ferestrelor din care face parte.
+
+    Rândurile din afara tuturor ferestrelor sunt eliminate imediat, astfel încât memoria
+    folosită depinde de dimensiunea ferestrelor raportului, nu de istoricul din master.
+    Returnează un dicționar {nume_fereastra: DataFrame}.
+    """
+    tipuri_scanare = {f.tip_scanare for f in ferestre.values()}
+    start_total = min(f.start for f in ferestre.values())
+    end_total = max(f.end for f in ferestre.values())
+
+    dtypes = _dtypes_necategorizate()
+    bucati_ferestre = {nume: [] for nume in ferestre}
+
+    for bloc in pd.read_csv(fisier_master, usecols=COLOANE_MASTER, dtype=dtypes,
+                            chunksize=dimensiune_bloc):
+        # Filtrul ieftin pe tipul scanării se aplică înainte de conversia datelor
+        bloc = bloc[bloc['Tip Scanare'].isin(tipuri_scanare)]
+        if bloc.empty:
+            continue
+        bloc = aplica_schema(bloc.copy(), format_scanare)
+        bloc = bloc[(bloc['Scanare'] >= start_total) & (bloc['Scanare'] <= end_total)]
+        if bloc.empty:
+            continue
+
+        for nume, fereastra in ferestre.items():
+            selectie = bloc[masca_fereastra(bloc, fereastra)]
+            if not selectie.empty:
+                bucati_ferestre[nume].append(selectie)
+
+    rezultat = {}
+    for nume, bucati in bucati_ferestre.items():
+        if bucati:
+            rezultat[nume] = pd.concat(bucati, ignore_index=True)
+        else:
+            rezultat[nume] = _cadru_gol(dtypes)
+    return rezultat
+
+
+def decategorizeaza(df):
+    """Convertește coloanele categoriale la tipul valorilor lor (pentru seturi mici, ex: ferestre)"""
+    coloane = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    if not coloane:
+        return df
+    df = df.copy()
+    for coloana in coloane:
+        tip = df[coloana].cat.categories.dtype
+        if tip.kind in 'iu' and df[coloana].isna().any():
+            # Ca la citirea CSV: o coloană numerică cu valori lipsă devine float
+            tip = 'float64'
+        df[coloana] = df[coloana].astype(tip)
+    return df
+
+
+def _cadru_gol(dtypes):
+    """DataFrame gol cu coloanele și tipurile schemei master"""
+    df = pd.DataFrame({coloana: pd.Series(dtype=dtypes.get(coloana, object)) for coloana in COLOANE_MASTER})
+    df['Scanare'] = pd.to_datetime(df['Scanare'])
+    return df
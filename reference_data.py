@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Registru pentru fișierele de referință din Utile (rute, echivalențe, firme fără scanare de ieșire)
+- Fiecare fișier este citit o singură dată pe proces (toate sheet-urile, la prima cerere)
+- Dicționarele și seturile derivate sunt construite o singură dată pe versiune de fișier
+- Un fișier este recitit doar dacă dimensiunea sau mtime-ul se schimbă
+- Fișierele sunt identificate după (st_dev, st_ino), astfel că aceeași cale scrisă diferit
+  (ex: ruteBRASOV.csv / ruteBrasov.csv pe un sistem de fișiere case-insensitive) este citită o dată
+
+DataFrame-urile, dicționarele și seturile returnate sunt partajate: nu trebuie modificate.
+"""
+
+import os
+
+import pandas as pd
+
+# (st_dev, st_ino) -> {'amprenta': (size, mtime_ns), 'foi': ..., 'derivate': {...}}
+_FISIERE_REFERINTA = {}
+
+
+def _intrare(cale):
+    st = os.stat(cale)
+    cheie = (st.st_dev, st.st_ino)
+    amprenta = (st.st_size, st.st_mtime_ns)
+
+    intrare = _FISIERE_REFERINTA.get(cheie)
+    if intrare is None or intrare['amprenta'] != amprenta:
+        intrare = {'amprenta': amprenta, 'cale': cale, 'foi': None, 'derivate': {}}
+        _FISIERE_REFERINTA[cheie] = intrare
+    return intrare
+
+
+def citeste_tabel(cale, sheet_name=0):
+    """
+    Returnează conținutul unui fișier CSV sau al unui sheet Excel (după nume sau poziție).
+    Un fișier Excel este parsat o singură dată pentru toate sheet-urile sale.
+    """
+    intrare = _intrare(cale)
+    if intrare['foi'] is None:
+        if cale.lower().endswith('.csv'):
+            intrare['foi'] = {0: pd.read_csv(cale)}
+        else:
+            intrare['foi'] = pd.read_excel(cale, sheet_name=None)
+
+    foi = intrare['foi']
+    if cale.lower().endswith('.csv'):
+        return foi[0]
+    if isinstance(sheet_name, int):
+        return list(foi.values())[sheet_name]
+    if sheet_name not in foi:
+        raise ValueError(f"Sheet-ul '{sheet_name}' nu există în {cale}")
+    return foi[sheet_name]
+
+
+def _derivat(cale, cheie, construieste):
+    """Valoare calculată din fișier, memorată până la următoarea modificare a fișierului"""
+    derivate = _intrare(cale)['derivate']
+    if cheie not in derivate:
+        derivate[cheie] = construieste()
+    return derivate[cheie]
+
+
+def _coloana(df, coloana):
+    # Coloanele pot fi date după nume sau după poziție
+    return df.iloc[:, coloana] if isinstance(coloana, int) else df[coloana]
+
+
+def mapare(cale, col_cheie, col_valoare, sheet_name=0):
+    """Dicționarul col_cheie -> col_valoare (ex: ruta -> centru, ruta -> ruta echivalentă)"""
+    def construieste():
+        df = citeste_tabel(cale, sheet_name)
+        return dict(zip(_coloana(df, col_cheie), _coloana(df, col_valoare)))
+    return _derivat(cale, ('mapare', col_cheie, col_valoare, sheet_name), construieste)
+
+
+def valori_unice(cale, coloana, sheet_name=0):
+    """Valorile distincte ale unei coloane (array, folosit cu isin)"""
+    return _derivat(
+        cale, ('valori_unice', coloana, sheet_name),
+        lambda: _coloana(citeste_tabel(cale, sheet_name), coloana).unique()
+    )
+
+
+def valori_text(cale, coloana, sheet_name=0):
+    """Setul valorilor nenule ale unei coloane, ca text (ex: firmele fără scanare de ieșire)"""
+    return _derivat(
+        cale, ('valori_text', coloana, sheet_name),
+        lambda: set(_coloana(citeste_tabel(cale, sheet_name), coloana).dropna().astype(str))
+    )
+
+
+def goleste_registru():
+    """Eliberează toate fișierele de referință păstrate în memorie"""
+    _FISIERE_REFERINTA.clear()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Scrierea rapoartelor HUB
+- Fiecare foaie poate fi scrisă în alt format: xlsx (pentru oameni), parquet, csv.gz sau json
+  (pentru procesare automată, fără costul serializării Excel)
+- xlsxwriter în mod constant_memory: rândurile sunt scrise în ordine și eliberate imediat,
+  deci memoria nu crește cu numărul de rânduri din Detaliat
+- Formatele numerice se aplică pe coloană (un singur obiect format per coloană)
+- openpyxl rămâne disponibil ca motor alternativ (calea inițială prin pd.ExcelWriter)
+"""
+
+import math
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xlsxwriter
+    XLSXWRITER_DISPONIBIL = True
+except ImportError:
+    XLSXWRITER_DISPONIBIL = False
+
+MOTOARE_EXCEL = ('xlsxwriter', 'openpyxl')
+MOTOR_EXCEL_IMPLICIT = 'xlsxwriter' if XLSXWRITER_DISPONIBIL else 'openpyxl'
+
+# Același format pentru date ca pd.ExcelWriter (header-ul rămâne fără stil, ca în pandas)
+FORMAT_DATA_ORA = 'YYYY-MM-DD HH:MM:SS'
+FORMAT_PROCENT = '0.00%'
+
+DIMENSIUNE_BLOC_SCRIERE = 50_000
+
+
+def verifica_motor_excel(motor):
+    if motor not in MOTOARE_EXCEL:
+        raise ValueError(f"Motor Excel necunoscut: {motor} (disponibile: {', '.join(MOTOARE_EXCEL)})")
+    if motor == 'xlsxwriter' and not XLSXWRITER_DISPONIBIL:
+        raise ImportError("Motorul Excel 'xlsxwriter' necesită xlsxwriter (pip install xlsxwriter)")
+
+
+def _valori_coloana(serie):
+    """
+    Valorile unei coloane ca listă Python, pregătite pentru scriere:
+    None pentru celulele goale, datetime pentru date, float/int/bool/str în rest.
+    """
+    valori = serie.to_numpy()
+    if valori.dtype.kind == 'M':
+        # datetime64 -> datetime (NaT -> None); scanările au precizie de secunde
+        return valori.astype('datetime64[us]').astype(object).tolist()
+    if valori.dtype.kind in 'fiub':
+        return [None if isinstance(v, float) and math.isnan(v) else v for v in valori.tolist()]
+    return [None if v is None or v is pd.NaT or (isinstance(v, float) and math.isnan(v)) else v
+            for v in valori.tolist()]
+
+
+def _scrie_celula(worksheet, rand, coloana, valoare, format_coloana, format_data):
+    if isinstance(valoare, str):
+        if not valoare:
+            # openpyxl nu scrie textele goale (ex: "User:" pe rândul Total)
+            return
+        if valoare.startswith('='):
+            # Valoarea memorată goală: formula este calculată de Excel la deschidere
+            worksheet.write_formula(rand, coloana, valoare, format_coloana, '')
+        else:
+            worksheet.write_string(rand, coloana, valoare, format_coloana)
+    elif isinstance(valoare, datetime):
+        worksheet.write_datetime(rand, coloana, valoare, format_coloana or format_data)
+    elif isinstance(valoare, (bool, np.bool_)):
+        worksheet.write_boolean(rand, coloana, bool(valoare), format_coloana)
+    elif isinstance(valoare, (int, float, np.integer, np.floating)):
+        worksheet.write_number(rand, coloana, valoare, format_coloana)
+    else:
+        worksheet.write(rand, coloana, valoare, format_coloana)
+
+
+def _scrie_foaie_xlsxwriter(workbook, nume_foaie, df, formate, format_data):
+    worksheet = workbook.add_worksheet(nume_foaie)
+    for coloana, nume in enumerate(df.columns):
+        worksheet.write_string(0, coloana, str(nume))
+
+    formate_coloane = [formate.get(nume) for nume in df.columns]
+    # Valorile sunt convertite pe blocuri de rânduri, ca memoria să nu depindă de mărimea foii
+    for inceput in range(0, len(df), DIMENSIUNE_BLOC_SCRIERE):
+        bloc = df.iloc[inceput:inceput + DIMENSIUNE_BLOC_SCRIERE]
+        coloane = [_valori_coloana(bloc.iloc[:, i]) for i in range(bloc.shape[1])]
+        for rand, valori in enumerate(zip(*coloane), start=inceput + 1):
+            for coloana, valoare in enumerate(valori):
+                if valoare is not None:
+                    _scrie_celula(worksheet, rand, coloana, valoare, formate_coloane[coloana], format_data)
+
+
+def scrie_excel(fisier_output, foi, formate_coloane=None, motor=MOTOR_EXCEL_IMPLICIT):
+    """
+    Scrie un workbook cu foile date în ordine.
+
+    foi: {nume foaie: DataFrame}
+    formate_coloane: {nume foaie: {nume coloană: format numeric Excel}}, ex: procentele din Sumar
+    """
+    verifica_motor_excel(motor)
+    formate_coloane = formate_coloane or {}
+
+    if motor == 'openpyxl':
+        with pd.ExcelWriter(fisier_output, engine="openpyxl") as writer:
+            for nume_foaie, df in foi.items():
+                df.to_excel(writer, sheet_name=nume_foaie, index=False)
+                worksheet = writer.sheets[nume_foaie]
+                for nume_coloana, format_numeric in formate_coloane.get(nume_foaie, {}).items():
+                    coloana = df.columns.get_loc(nume_coloana) + 1
+                    for rand in range(2, len(df) + 2):  # începe de la rândul 2 (după header)
+                        worksheet.cell(row=rand, column=coloana).number_format = format_numeric
+        return
+
+    workbook = xlsxwriter.Workbook(fisier_output, {'constant_memory': True, 'nan_inf_to_errors': True})
+    try:
+        format_data = workbook.add_format({'num_format': FORMAT_DATA_ORA})
+        for nume_foaie, df in foi.items():
+            formate = {
+                nume_coloana: workbook.add_format({'num_format': format_numeric})
+                for nume_coloana, format_numeric in formate_coloane.get(nume_foaie, {}).items()
+            }
+            _scrie_foaie_xlsxwriter(workbook, nume_foaie, df, formate, format_data)
+    finally:
+        workbook.close()
+
+
+def _coloane_uniforme(df):
+    """
+    Coloanele object cu tipuri amestecate (ex: date și "Fara scan iesire", sau user și 0)
+    devin text, ca formatele tipizate (Parquet) să le poată scrie; valorile lipsă rămân lipsă.
+    """
+    mixte = {
+        coloana: df[coloana].map(lambda v: v if pd.isna(v) else str(v))
+        for coloana in df.columns
+        if df[coloana].dtype == object and pd.api.types.infer_dtype(df[coloana], skipna=True).startswith('mixed')
+    }
+    return df.assign(**mixte) if mixte else df
+
+
+def scrie_parquet(fisier, df):
+    _coloane_uniforme(df).to_parquet(fisier, index=False)
+
+
+def scrie_csv_gz(fisier, df):
+    df.to_csv(fisier, index=False, compression='gzip')
+
+
+def scrie_json(fisier, df):
+    df.to_json(fisier, orient='records', date_format='iso', force_ascii=False, indent=None)
+
+
+# Formatele pentru foile scrise în fișiere separate: {format: (extensie, funcție de scriere)}
+SCRIITORI_FOI = {
+    'parquet': ('parquet', scrie_parquet),
+    'csv.gz': ('csv.gz', scrie_csv_gz),
+    'json': ('json', scrie_json),
+}
+
+FORMATE_IESIRE = ('xlsx',) + tuple(SCRIITORI_FOI)
+
+
+def verifica_formate_iesire(formate_iesire):
+    for foaie, format_iesire in (formate_iesire or {}).items():
+        if format_iesire not in FORMATE_IESIRE:
+            raise ValueError(
+                f"Format necunoscut pentru foaia {foaie}: {format_iesire} (disponibile: {', '.join(FORMATE_IESIRE)})"
+            )
+
+
+def cale_foaie(fisier_output, foaie, format_iesire):
+    """Fișierul unei foi scrise separat: 'Raport ... 27.08-28.08 Detaliat.parquet'"""
+    return f"{os.path.splitext(fisier_output)[0]} {foaie}.{SCRIITORI_FOI[format_iesire][0]}"
+
+
+def scrie_foi(fisier_output, foi, formate_iesire=None, formate_coloane=None, motor_excel=MOTOR_EXCEL_IMPLICIT):
+    """
+    Scrie foile unui raport, fiecare în formatul ales.
+
+    foi: {nume foaie: DataFrame}
+    formate_iesire: {nume foaie: 'xlsx' / 'parquet' / 'csv.gz' / 'json'}; implicit 'xlsx'.
+    Foile xlsx ajung împreună în fisier_output, celelalte în fișiere separate (vezi cale_foaie).
+    Returnează lista fișierelor scrise.
+    """
+    verifica_formate_iesire(formate_iesire)
+    formate_iesire = formate_iesire or {}
+
+    foi_xlsx = {}
+    fisiere = []
+    for foaie, df in foi.items():
+        format_iesire = formate_iesire.get(foaie, 'xlsx')
+        if format_iesire == 'xlsx':
+            foi_xlsx[foaie] = df
+        else:
+            fisier = cale_foaie(fisier_output, foaie, format_iesire)
+            SCRIITORI_FOI[format_iesire][1](fisier, df)
+            fisiere.append(fisier)
+
+    if foi_xlsx:
+        scrie_excel(fisier_output, foi_xlsx, formate_coloane, motor_excel)
+        fisiere.insert(0, fisier_output)
+    return fisiere
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Index sortat al scanărilor pentru extragerea rapidă a ferestrelor
+- Scanările sunt sortate o singură dată după (Tip Scanare, Centru, Scanare)
+- Fiecare fereastră se decupează cu searchsorted: O(log n + k) în loc de o mască pe tot master-ul
+- Indexul se reutilizează între hub-uri și date în același proces
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from master_data_loader import incarca_master
+
+
+class IndexScanari:
+    def __init__(self, df_master):
+        if not pd.api.types.is_datetime64_any_dtype(df_master['Scanare']):
+            raise TypeError("Coloana Scanare trebuie să fie de tip datetime pentru indexare")
+
+        self.df_master = df_master
+        self._tip_timp = df_master['Scanare'].values.dtype
+
+        coduri_tip, self._tipuri = pd.factorize(df_master['Tip Scanare'])
+        coduri_centru, self._centre = pd.factorize(df_master['Centru'])
+        # NaT devine cea mai mică valoare int64, deci nu intră în nicio fereastră
+        timp = df_master['Scanare'].values.view('i8')
+
+        # Ordinea principală: (tip, centru, scanare) - pentru ferestrele cu centru fix
+        self._ordine = np.lexsort((timp, coduri_centru, coduri_tip))
+        self._timp_sortat = timp[self._ordine]
+        self._grupuri = self._limite_grupuri(
+            coduri_tip[self._ordine].astype(np.int64) * (len(self._centre) + 1) +
+            coduri_centru[self._ordine]
+        )
+
+        # Ordinea secundară: (tip, scanare) - pentru ferestrele pe toate centrele
+        self._ordine_tip = np.lexsort((timp, coduri_tip))
+        self._timp_sortat_tip = timp[self._ordine_tip]
+        self._grupuri_tip = self._limite_grupuri(coduri_tip[self._ordine_tip].astype(np.int64))
+
+    @staticmethod
+    def _limite_grupuri(chei_sortate):
+        """Returnează {cheie: (inceput, sfarsit)} pentru cheile consecutive egale"""
+        if len(chei_sortate) == 0:
+            return {}
+        inceputuri = np.concatenate(([0], np.flatnonzero(np.diff(chei_sortate)) + 1))
+        sfarsituri = np.append(inceputuri[1:], len(chei_sortate))
+        return {
+            int(chei_sortate[i]): (int(i), int(j))
+            for i, j in zip(inceputuri, sfarsituri)
+        }
+
+    def _cod(self, valori, valoare):
+        pozitii = np.flatnonzero(np.asarray(valori == valoare))
+        return int(pozitii[0]) if len(pozitii) else None
+
+    def _moment(self, valoare):
+        return np.datetime64(pd.Timestamp(valoare)).astype(self._tip_timp).view('i8')
+
+    def pozitii_fereastra(self, fereastra):
+        """Pozițiile (în ordinea din master) ale scanărilor dintr-o FereastraScanare"""
+        cod_tip = self._cod(self._tipuri, fereastra.tip_scanare)
+        if cod_tip is None:
+            return np.array([], dtype=np.intp)
+
+        if fereastra.centru is None:
+            limite = self._grupuri_tip.get(cod_tip)
+            ordine, timp = self._ordine_tip, self._timp_sortat_tip
+        else:
+            cod_centru = self._cod(self._centre, fereastra.centru)
+            if cod_centru is None:
+                return np.array([], dtype=np.intp)
+            limite = self._grupuri.get(cod_tip * (len(self._centre) + 1) + cod_centru)
+            ordine, timp = self._ordine, self._timp_sortat
+
+        if limite is None:
+            return np.array([], dtype=np.intp)
+
+        inceput, sfarsit = limite
+        grup = timp[inceput:sfarsit]
+        i = inceput + np.searchsorted(grup, self._moment(fereastra.start), side='left')
+        j = inceput + np.searchsorted(grup, self._moment(fereastra.end), side='right')
+        # Sortarea pozițiilor păstrează ordinea originală a rândurilor din master
+        return np.sort(ordine[i:j])
+
+    def fereastra(self, fereastra):
+        """Returnează scanările dintr-o FereastraScanare, în ordinea din master"""
+        return self.df_master.iloc[self.pozitii_fereastra(fereastra)]
+
+
+# Indexuri construite în procesul curent, pe fișier master
+_INDEXURI_MASTER = {}
+
+
+def obtine_index_master(fisier_master, foloseste_cache=True, motor_citire='pandas'):
+    """
+    Returnează indexul pentru un fișier master, construindu-l o singură dată pe proces.
+    Indexul este reconstruit dacă dimensiunea sau mtime-ul fișierului se schimbă.
+    """
+    st = os.stat(fisier_master)
+    amprenta = (st.st_size, st.st_mtime_ns)
+    cheie = os.path.abspath(fisier_master)
+
+    intrare = _INDEXURI_MASTER.get(cheie)
+    if intrare is not None and intrare[0] == amprenta:
+        return intrare[1]
+
+    index = IndexScanari(incarca_master(fisier_master, foloseste_cache, motor_citire=motor_citire))
+    _INDEXURI_MASTER[cheie] = (amprenta, index)
+    return index
+
+
+def goleste_indexuri():
+    """Eliberează indexurile (și master-ele) păstrate în memorie"""
+    _INDEXURI_MASTER.clear()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Depozit de scanări partiționat pe zile
+- Ingestie: master_data.csv este împărțit în scans/date=YYYY-MM-DD/part-NNNNN.parquet
+- Citire: se încarcă doar partițiile zilelor care se suprapun cu ferestrele raportului
+"""
+
+import os
+import shutil
+from datetime import timedelta
+
+import pandas as pd
+
+from master_data_loader import (
+    COLOANE_MASTER,
+    DIMENSIUNE_BLOC_STREAM,
+    FORMAT_SCANARE,
+    PYARROW_DISPONIBIL,
+    _cadru_gol,
+    _dtypes_necategorizate,
+    aplica_schema,
+)
+
+PREFIX_PARTITIE = 'date='
+
+
+def cale_partitie(director_partitii, zi):
+    """Directorul partiției pentru o zi (datetime/date/Timestamp)"""
+    return os.path.join(director_partitii, f"{PREFIX_PARTITIE}{zi.strftime('%Y-%m-%d')}")
+
+
+def _verifica_pyarrow():
+    if not PYARROW_DISPONIBIL:
+        raise ImportError("Depozitul de scanări partiționat necesită pyarrow (pip install pyarrow)")
+
+
+def ingereaza_master_in_partitii(fisier_master, director_partitii, dimensiune_bloc=DIMENSIUNE_BLOC_STREAM,
+                                 format_scanare=FORMAT_SCANARE):
+    """
+    Împarte fișierul master în partiții zilnice.
+
+    Depozitul este reconstruit într-un director temporar și înlocuiește apoi
+    depozitul existent, astfel încât o ingestie întreruptă nu lasă partiții incomplete.
+    Returnează numărul de rânduri scrise pentru fiecare zi.
+    """
+    _verifica_pyarrow()
+    director_partitii = director_partitii.rstrip(os.sep)
+    director_temp = f"{director_partitii}.tmp"
+    if os.path.exists(director_temp):
+        shutil.rmtree(director_temp)
+    os.makedirs(director_temp)
+
+    dtypes = _dtypes_necategorizate()
+    randuri_pe_zi = {}
+
+    print(f"Ingestie fișier master în partiții zilnice: {director_partitii}")
+    blocuri = pd.read_csv(fisier_master, usecols=COLOANE_MASTER, dtype=dtypes, chunksize=dimensiune_bloc)
+    for nr_bloc, bloc in enumerate(blocuri):
+        bloc = aplica_schema(bloc, format_scanare)
+        bloc = bloc[bloc['Scanare'].notna()]
+
+        for zi, df_zi in bloc.groupby(bloc['Scanare'].dt.normalize()):
+            director_zi = cale_partitie(director_temp, zi)
+            os.makedirs(director_zi, exist_ok=True)
+            df_zi.to_parquet(os.path.join(director_zi, f"part-{nr_bloc:05d}.parquet"), index=False)
+            cheie = zi.strftime('%Y-%m-%d')
+            randuri_pe_zi[cheie] = randuri_pe_zi.get(cheie, 0) + len(df_zi)
+
+    director_vechi = f"{director_partitii}.old"
+    if os.path.exists(director_partitii):
+        os.replace(director_partitii, director_vechi)
+    os.replace(director_temp, director_partitii)
+    if os.path.exists(director_vechi):
+        shutil.rmtree(director_vechi)
+
+    print(f"Scrise {sum(randuri_pe_zi.values())} înregistrări în {len(randuri_pe_zi)} partiții zilnice")
+    return randuri_pe_zi
+
+
+def zile_disponibile(director_partitii):
+    """Lista zilelor (YYYY-MM-DD) pentru care există partiții"""
+    if not os.path.isdir(director_partitii):
+        return []
+    return sorted(
+        nume[len(PREFIX_PARTITIE):] for nume in os.listdir(director_partitii)
+        if nume.startswith(PREFIX_PARTITIE)
+    )
+
+
+def citeste_partitii(director_partitii, start, end):
+    """
+    Citește scanările din partițiile zilelor dintre start și end (inclusiv).
+    Costul depinde doar de numărul de zile cerute, nu de istoricul total.
+    """
+    _verifica_pyarrow()
+    fisiere = []
+    zi = pd.Timestamp(start).normalize()
+    while zi <= pd.Timestamp(end):
+        director_zi = cale_partitie(director_partitii, zi)
+        if os.path.isdir(director_zi):
+            fisiere.extend(
+                os.path.join(director_zi, nume) for nume in sorted(os.listdir(director_zi))
+                if nume.endswith('.parquet')
+            )
+        zi += timedelta(days=1)
+
+    if not fisiere:
+        print(f"⚠️ Nu există partiții între {pd.Timestamp(start):%Y-%m-%d} și {pd.Timestamp(end):%Y-%m-%d}")
+        return _cadru_gol(_dtypes_necategorizate())
+
+    return pd.concat([pd.read_parquet(fisier) for fisier in fisiere], ignore_index=True)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Utilizare: python scan_store.py <master_data.csv> <director_partitii>")
+        sys.exit(1)
+    ingereaza_master_in_partitii(sys.argv[1], sys.argv[2])
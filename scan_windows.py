@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Ferestre de scanare folosite de generatorul de rapoarte HUB
+O fereastră = tip scanare + centru (opțional) + interval de timp închis [start, end]
+"""
+
+from collections import namedtuple
+
+# centru=None înseamnă orice centru
+FereastraScanare = namedtuple('FereastraScanare', ['tip_scanare', 'centru', 'start', 'end'])
+
+
+def masca_fereastra(df, fereastra):
+    """Returnează masca booleană a rândurilor din df care aparțin ferestrei"""
+    masca = (
+        (df['Tip Scanare'] == fereastra.tip_scanare) &
+        (df['Scanare'] >= fereastra.start) &
+        (df['Scanare'] <= fereastra.end)
+    )
+    if fereastra.centru is not None:
+        masca &= df['Centru'] == fereastra.centru
+    return masca
+
+
+def interval_ferestre(ferestre):
+    """Returnează intervalul (start, end) care acoperă toate ferestrele"""
+    ferestre = list(ferestre)
+    return min(f.start for f in ferestre), max(f.end for f in ferestre)
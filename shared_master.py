@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Master partajat între procese, prin memory-mapping
+- Master-ul tipizat este scris o singură dată ca fișier Arrow IPC (Feather v2) necomprimat
+- Fiecare proces se atașează fișierului cu pa.memory_map: coloanele nu sunt copiate,
+  paginile sunt citite din page cache-ul sistemului și partajate de toate procesele
+- Rândurile sunt scrise sortate după (Tip Scanare, Centru, Scanare), cu limitele fiecărui grup
+  (tip, centru) în metadate: o fereastră se decupează cu searchsorted, ca în IndexScanari, fără
+  o mască pe tot tabelul; doar rândurile selectate ajung în pandas, în ordinea din master
+- Fișierul este republicat doar când master_data.csv se modifică (dimensiune sau mtime)
+- Implicit fișierul este scris în directorul temporar local, nu lângă master (folderul master-ului
+  este sincronizat în Dropbox, iar fișierul are dimensiunea întregului master)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from master_data_loader import (
+    COLOANE_MASTER,
+    PYARROW_DISPONIBIL,
+    VERSIUNE_CACHE,
+    decategorizeaza,
+    incarca_master,
+)
+
+if PYARROW_DISPONIBIL:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+# Directorul implicit al fișierelor partajate (local, în afara folderelor sincronizate)
+DIRECTOR_PARTAJAT_IMPLICIT = os.path.join(tempfile.gettempdir(), 'hub_reports_master')
+
+# Metadatele schemei Arrow: amprenta fișierului master sursă și limitele grupurilor sortate
+CHEIE_AMPRENTA = b'amprenta_master'
+CHEIE_GRUPURI = b'grupuri'
+
+# Versiunea formatului fișierului partajat (2: rânduri sortate pe grupuri)
+VERSIUNE_FORMAT = 2
+
+# Coloanele adăugate master-ului în fișierul partajat: poziția rândului în master și momentul
+# scanării ca int64 (NaT = cea mai mică valoare, deci nu intră în nicio fereastră)
+COLOANA_POZITIE = '_pozitie'
+COLOANA_TIMP = '_timp'
+
+# Master-ele atașate în procesul curent: cale -> (amprenta fișier arrow, MasterPartajat)
+_TABELE_ATASATE = {}
+
+
+def _verifica_pyarrow():
+    if not PYARROW_DISPONIBIL:
+        raise ImportError("Master-ul partajat necesită pyarrow (pip install pyarrow)")
+
+
+def cale_master_partajat(fisier_master, director=None):
+    """
+    Returnează calea implicită a fișierului Arrow partajat pentru un fișier master, în `director`
+    (implicit DIRECTOR_PARTAJAT_IMPLICIT). Numele conține un hash al căii master-ului, astfel încât
+    fișierele master diferite nu folosesc același fișier partajat.
+    """
+    sufix = hashlib.sha1(os.path.abspath(fisier_master).encode()).hexdigest()[:12]
+    nume = os.path.splitext(os.path.basename(fisier_master))[0]
+    return os.path.join(director or DIRECTOR_PARTAJAT_IMPLICIT, f"{nume}-{sufix}.arrow")
+
+
+def _amprenta_master(fisier_master):
+    # Versiunea cache-ului: fișierul este republicat și când se schimbă schema master-ului
+    st = os.stat(fisier_master)
+    return f"{VERSIUNE_FORMAT}:{VERSIUNE_CACHE}:{st.st_size}:{st.st_mtime_ns}".encode()
+
+
+def _amprenta_publicata(cale):
+    """Amprenta master-ului din care a fost scris fișierul partajat (None dacă lipsește)"""
+    if not os.path.exists(cale):
+        return None
+    try:
+        with pa.memory_map(cale) as sursa:
+            metadate = pa.ipc.open_file(sursa).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return metadate.get(CHEIE_AMPRENTA)
+
+
+def _valoare_json(valoare):
+    """Valoarea unei categorii în metadatele JSON (None pentru valori lipsă)"""
+    if pd.isna(valoare):
+        return None
+    return valoare.item() if isinstance(valoare, np.generic) else valoare
+
+
+def _tabel_sortat(df_master):
+    """
+    Tabelul Arrow al master-ului sortat după (Tip Scanare, Centru, Scanare), cu coloanele
+    COLOANA_POZITIE și COLOANA_TIMP, și limitele grupurilor: [[tip, centru, inceput, sfarsit], ...]
+    """
+    coduri_tip, tipuri = pd.factorize(df_master['Tip Scanare'])
+    coduri_centru, centre = pd.factorize(df_master['Centru'])
+    timp = df_master['Scanare'].values.view('i8')
+    ordine = np.lexsort((timp, coduri_centru, coduri_tip))
+
+    tip_sortat, centru_sortat = coduri_tip[ordine], coduri_centru[ordine]
+    schimbari = np.flatnonzero((np.diff(tip_sortat) != 0) | (np.diff(centru_sortat) != 0)) + 1
+    inceputuri = np.concatenate(([0], schimbari)) if len(ordine) else np.array([], dtype=np.intp)
+    sfarsituri = np.append(inceputuri[1:], len(ordine))
+    grupuri = [
+        [_valoare_json(tipuri[tip_sortat[i]]) if tip_sortat[i] >= 0 else None,
+         _valoare_json(centre[centru_sortat[i]]) if centru_sortat[i] >= 0 else None,
+         int(i), int(j)]
+        for i, j in zip(inceputuri, sfarsituri)
+    ]
+
+    tabel = pa.Table.from_pandas(df_master[COLOANE_MASTER], preserve_index=False).take(ordine)
+    tabel = tabel.append_column(COLOANA_POZITIE, pa.array(ordine.astype(np.int64)))
+    tabel = tabel.append_column(COLOANA_TIMP, pa.array(timp[ordine]))
+    return tabel, grupuri
+
+
+def publica_master_partajat(fisier_master, cale=None, foloseste_cache=True, motor_citire='pandas'):
+    """
+    Scrie master-ul tipizat ca fișier Arrow necomprimat, sortat pe grupuri (vezi _tabel_sortat),
+    dacă nu există deja pentru versiunea curentă a master-ului. Categoriile devin coloane
+    dictionary (coduri int32 + valori distincte). Returnează calea fișierului.
+    """
+    _verifica_pyarrow()
+    cale = cale or cale_master_partajat(fisier_master)
+    amprenta = _amprenta_master(fisier_master)
+    if _amprenta_publicata(cale) == amprenta:
+        return cale
+
+    print(f"Se publică master-ul partajat: {cale}")
+    df_master = incarca_master(fisier_master, foloseste_cache, motor_citire=motor_citire)
+    tabel, grupuri = _tabel_sortat(df_master)
+    tabel = tabel.replace_schema_metadata({
+        **(tabel.schema.metadata or {}),
+        CHEIE_AMPRENTA: amprenta,
+        CHEIE_GRUPURI: json.dumps(grupuri).encode()
+    })
+
+    # Scriere atomică: procesele deja atașate păstrează versiunea veche până la reatașare.
+    # Fișierul temporar are un nume unic, deci procesele care publică simultan nu se încurcă.
+    director = os.path.dirname(os.path.abspath(cale))
+    os.makedirs(director, exist_ok=True)
+    descriptor, cale_temp = tempfile.mkstemp(dir=director, suffix='.tmp')
+    os.close(descriptor)
+    try:
+        feather.write_feather(tabel, cale_temp, compression='uncompressed')
+        os.replace(cale_temp, cale)
+    except BaseException:
+        os.remove(cale_temp)
+        raise
+    return cale
+
+
+class MasterPartajat:
+    """Tabelul partajat mapat în memorie și grupurile lui sortate, pentru decuparea ferestrelor"""
+
+    def __init__(self, tabel):
+        self.tabel = tabel
+        self._tip_timp = tabel.schema.field('Scanare').type
+        grupuri = json.loads(tabel.schema.metadata[CHEIE_GRUPURI])
+        # {tip: [(centru, inceput, sfarsit), ...]}
+        self._grupuri = {}
+        for tip, centru, inceput, sfarsit in grupuri:
+            self._grupuri.setdefault(tip, []).append((centru, inceput, sfarsit))
+        # Bucățile (record batch-urile) coloanei de timp, ca view-uri numpy fără copiere
+        bucati = tabel[COLOANA_TIMP].chunks
+        self._timp = [bucata.to_numpy(zero_copy_only=True) for bucata in bucati]
+        self._inceputuri = np.cumsum([0] + [len(bucata) for bucata in bucati[:-1]])
+
+    def _moment(self, valoare):
+        return pa.scalar(pd.Timestamp(valoare), type=self._tip_timp).cast(pa.int64()).as_py()
+
+    def _cauta(self, inceput, sfarsit, moment, side):
+        """np.searchsorted pe timpul sortat din [inceput, sfarsit), peste bucățile coloanei"""
+        k = int(np.searchsorted(self._inceputuri, inceput, side='right')) - 1
+        for bucata, deplasare in zip(self._timp[k:], self._inceputuri[k:]):
+            if deplasare >= sfarsit:
+                break
+            i = max(inceput, deplasare) - deplasare
+            j = min(sfarsit, deplasare + len(bucata)) - deplasare
+            pozitie = int(np.searchsorted(bucata[i:j], moment, side=side))
+            if pozitie < j - i:
+                return deplasare + i + pozitie
+        return sfarsit
+
+    def fereastra(self, fereastra):
+        """Scanările unei FereastraScanare, în ordinea din master (DataFrame)"""
+        start, end = self._moment(fereastra.start), self._moment(fereastra.end)
+        bucati = []
+        for centru, inceput, sfarsit in self._grupuri.get(fereastra.tip_scanare, []):
+            if fereastra.centru is not None and centru != fereastra.centru:
+                continue
+            i = self._cauta(inceput, sfarsit, start, 'left')
+            j = self._cauta(i, sfarsit, end, 'right')
+            if j > i:
+                bucati.append(self.tabel.slice(i, j - i))
+
+        if not bucati:
+            selectie = self.tabel.slice(0, 0)
+        else:
+            selectie = pa.concat_tables(bucati)
+            # Fereastra pe toate centrele vine din mai multe grupuri: se revine la ordinea din master
+            selectie = selectie.take(np.argsort(selectie[COLOANA_POZITIE].to_numpy(), kind='stable'))
+        return decategorizeaza(selectie.select(COLOANE_MASTER).to_pandas())
+
+
+def ataseaza_master_partajat(cale):
+    """
+    MasterPartajat pentru fișierul de la `cale`: tabelul Arrow este mapat în memorie (fără copierea
+    datelor). Atașarea se face o singură dată pe proces și pe versiune a fișierului.
+    """
+    _verifica_pyarrow()
+    st = os.stat(cale)
+    amprenta = (st.st_size, st.st_mtime_ns)
+
+    intrare = _TABELE_ATASATE.get(cale)
+    if intrare is not None and intrare[0] == amprenta:
+        return intrare[1]
+
+    master = MasterPartajat(pa.ipc.open_file(pa.memory_map(cale)).read_all())
+    _TABELE_ATASATE[cale] = (amprenta, master)
+    return master
+
+
+def ferestre_partajate(cale, ferestre):
+    """{nume: DataFrame} pentru ferestrele date, extrase din fișierul partajat"""
+    master = ataseaza_master_partajat(cale)
+    return {nume: master.fereastra(fereastra) for nume, fereastra in ferestre.items()}
+
+
+def detaseaza_masterele_partajate():
+    """Eliberează tabelele atașate în procesul curent (maparea se închide la colectarea lor)"""
+    _TABELE_ATASATE.clear()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Utilizare: python shared_master.py <master_data.csv> [fisier.arrow]")
+        sys.exit(1)
+    print(publica_master_partajat(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Generator de fișiere master sintetice pentru benchmark-uri
+Produce un master_data.csv cu aceeași structură ca exportul real
+"""
+
+import numpy as np
+import pandas as pd
+
+CENTRE_SINTETICE = [
+    'ALBA IULIA', 'ARAD', 'BACAU', 'BRASOV', 'BUZAU', 'CLUJ', 'CONSTANTA', 'CRAIOVA',
+    'DEVA', 'GALATI', 'IASI', 'ORADEA', 'PITESTI', 'PLOIESTI', 'SIBIU', 'TIMISOARA'
+]
+
+
+def genereaza_master_sintetic(fisier, nr_randuri, data_start="2025-08-01", nr_zile=30,
+                              seed=42, dimensiune_bloc=500_000):
+    """
+    Scrie un fișier master sintetic cu nr_randuri scanări distribuite pe nr_zile.
+    Scrierea se face pe blocuri pentru a nu ține tot fișierul în memorie.
+    """
+    rng = np.random.default_rng(seed)
+    start = np.datetime64(f"{data_start}T00:00:00")
+    coduri = [c[:3] for c in CENTRE_SINTETICE]
+    rute = ([f'{c}-BVH' for c in coduri] + [f'BVH-{c}' for c in coduri] +
+            [f'{c}-SBH' for c in coduri] + [f'SBH-{c}' for c in coduri])
+    useri = [f'user{i:03d}' for i in range(300)]
+    firme = [f'FIRMA {i:04d} SRL' for i in range(2000)]
+
+    total_secunde = nr_zile * 86400
+    scrise = 0
+    while scrise < nr_randuri:
+        n = min(dimensiune_bloc, nr_randuri - scrise)
+        # Scanările sunt adăugate cronologic, ca în exportul real
+        inceput = total_secunde * scrise // nr_randuri
+        sfarsit = total_secunde * (scrise + n) // nr_randuri
+        secunde = np.sort(rng.integers(inceput, max(sfarsit, inceput + 1), n))
+        df = pd.DataFrame({
+            'CodBare': [f'{x:013d}' for x in rng.integers(10**12, 10**13 - 1, n)],
+            'Tip Scanare': rng.choice(['Iesire Centru', 'Intrare Centru', 'Livrare', 'Ridicare'], n),
+            'Centru': rng.choice(CENTRE_SINTETICE, n),
+            'Ruta': rng.choice(rute, n),
+            'Centru exp': rng.choice(CENTRE_SINTETICE, n),
+            'Centru dest': rng.choice(CENTRE_SINTETICE, n),
+            'Expeditor': rng.choice(firme, n),
+            'Destinatar': rng.choice(firme, n),
+            'bucati': rng.choice([1, 1, 1, 2, 3, 5], n),
+            'Greutate': np.round(rng.gamma(2.0, 6.0, n), 2),
+            'Categorie': rng.choice(['Colete', 'Paleti', 'Plicuri'], n, p=[0.8, 0.1, 0.1]),
+            'Scanare': pd.Series(start + secunde.astype('timedelta64[s]')).dt.strftime('%Y-%m-%d %H:%M:%S'),
+            'User': rng.choice(useri, n),
+            'Observatii': rng.choice(['', 'Fragil', 'Retur', 'Urgent'], n),
+            'Adresa': [f'Str. Exemplu nr. {x}' for x in rng.integers(1, 500, n)]
+        })
+        df.to_csv(fisier, index=False, mode='w' if scrise == 0 else 'a', header=scrise == 0)
+        scrise += n
+    return fisier
+
+
+if __name__ == "__main__":
+    import sys
+    fisier = sys.argv[1] if len(sys.argv) > 1 else 'master_data_sintetic.csv'
+    nr_randuri = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    genereaza_master_sintetic(fisier, nr_randuri)
+    print(f"Generat {nr_randuri:,} rânduri în {fisier}")
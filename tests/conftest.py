@@ -0,0 +1,139 @@
+"""
+Date de test și generatorul inițial (de referință) pentru comparațiile cu rapoartele inițiale.
+"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+RADACINA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RADACINA)
+
+from unified_hub_report_generator import BRASOV_CONFIG, SIBIU_CONFIG, UnifiedHubReportGenerator  # noqa: E402
+
+# Datele pentru care se compară rapoartele (joi și vineri, pentru regula de weekend)
+DATE_RAPORT = ['2025-08-21', '2025-08-22']
+
+CENTRE = ['ALBA', 'ARAD', 'CLUJ', 'DEVA', 'IASI', 'SIBIU', 'BRASOV', 'ORADEA']
+
+
+def incarca_generator_initial():
+    """Modulul generatorului inițial (copia păstrată în repository), fără optimizări"""
+    cale = os.path.join(RADACINA, 'unified_hub_report_generator copy.py')
+    spec = importlib.util.spec_from_file_location('generator_initial', cale)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def _rute(prefix, sufix, numerice, baza):
+    if numerice:
+        return [baza + i for i in range(len(CENTRE))]
+    return [f"{prefix}{c[:3]}{sufix}" for c in CENTRE]
+
+
+def creeaza_date_test(director, nr_randuri=6_000, seed=1, user_numeric=False, ruta_numerica=False):
+    """
+    Fișierele Utile și un master_data.csv sintetic pentru hub-urile Brașov și Sibiu.
+    user_numeric / ruta_numerica: coloanele User / Ruta conțin numere (ca în unele exporturi).
+    Returnează calea fișierului master.
+    """
+    rng = np.random.default_rng(seed)
+    utile = os.path.join(director, 'Utile')
+    os.makedirs(utile, exist_ok=True)
+
+    rute_bv = _rute('', '-BVH', ruta_numerica, 101)
+    rute_sb = _rute('', '-SBH', ruta_numerica, 301)
+    retur_bv = _rute('BVH-', '', ruta_numerica, 201)
+    retur_sb = _rute('SBH-', '', ruta_numerica, 401)
+
+    pd.DataFrame({'Denumire': rute_bv + retur_bv, 'Centru': CENTRE + CENTRE}).to_csv(
+        os.path.join(utile, 'ruteBRASOV.csv'), index=False)
+    pd.DataFrame({'Denumire': rute_sb + retur_sb, 'Centru': CENTRE + CENTRE}).to_csv(
+        os.path.join(utile, 'ruteSIBIU.csv'), index=False)
+    pd.DataFrame({'Rute Tara': rute_bv, 'Rute Brasov': rute_bv, 'Retur': retur_bv}).to_excel(
+        os.path.join(utile, 'ruteBrasov_echivalenta.xlsx'), sheet_name='Sheet1', index=False)
+    pd.DataFrame({'RutaEchivalenta': rute_sb, 'RutaOriginala': rute_sb, 'Retur': retur_sb}).to_excel(
+        os.path.join(utile, 'ruteSibiu_echivalenta.xlsx'), sheet_name='Sheet1', index=False)
+    pd.DataFrame({'Firma': ['EXP1', 'EXP3']}).to_excel(
+        os.path.join(utile, 'FirmeFaraScanIesire.xlsx'), sheet_name='Sheet3', index=False)
+
+    start = np.datetime64('2025-08-19T00:00:00')
+    secunde = rng.integers(0, 8 * 86400, nr_randuri)
+    toate_rutele = rute_bv + rute_sb + retur_bv + retur_sb + ([999] if ruta_numerica else ['ZZZ-QQQ'])
+    useri = list(range(1, 21)) if user_numeric else [f'user{i}' for i in range(20)]
+    df = pd.DataFrame({
+        'CodBare': [f'CB{x:08d}' for x in rng.integers(0, nr_randuri // 3 + 1, nr_randuri)],
+        'Tip Scanare': rng.choice(['Iesire Centru', 'Intrare Centru', 'Livrare'], nr_randuri),
+        'Centru': rng.choice(CENTRE, nr_randuri),
+        'Ruta': rng.choice(np.array(toate_rutele, dtype=object), nr_randuri),
+        'Centru exp': rng.choice(CENTRE, nr_randuri),
+        'Centru dest': rng.choice(CENTRE, nr_randuri),
+        'Expeditor': rng.choice([f'EXP{i}' for i in range(6)], nr_randuri),
+        'Destinatar': rng.choice([f'DST{i}' for i in range(6)], nr_randuri),
+        'bucati': rng.choice([0, 1, 2, 3], nr_randuri, p=[.05, .6, .25, .1]),
+        'Greutate': np.round(rng.random(nr_randuri) * 30, 3),
+        'Categorie': rng.choice(['Colete', 'Paleti', 'Plicuri'], nr_randuri),
+        'Scanare': start + secunde.astype('timedelta64[s]'),
+        'User': rng.choice(np.array(useri, dtype=object), nr_randuri),
+        'Extra': 'x',
+    }).sort_values('Scanare')
+    df['Scanare'] = df['Scanare'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    fisier_master = os.path.join(director, 'master_data.csv')
+    df.to_csv(fisier_master, index=False)
+    return fisier_master
+
+
+def rapoarte(director):
+    """{nume fișier: {'Detaliat': DataFrame, 'Sumar': DataFrame}} pentru rapoartele xlsx din director"""
+    rezultat = {}
+    for nume in sorted(os.listdir(director)):
+        if nume.startswith('Raport') and nume.endswith('.xlsx'):
+            foi = pd.read_excel(os.path.join(director, nume), sheet_name=None)
+            rezultat[nume] = foi
+    return rezultat
+
+
+def _citeste_si_sterge(director):
+    rezultat = rapoarte(director)
+    for nume in os.listdir(director):
+        if nume.startswith('Raport'):
+            os.remove(os.path.join(director, nume))
+    return rezultat
+
+
+def genereaza_initial(fisier_master, director, date=DATE_RAPORT):
+    """Rapoartele generatorului inițial pentru ambele hub-uri (citite din xlsx, apoi șterse)"""
+    modul = incarca_generator_initial()
+    for data in date:
+        for config in (BRASOV_CONFIG, SIBIU_CONFIG):
+            modul.UnifiedHubReportGenerator(fisier_master, data, director, config).genereaza_rapoarte()
+    return _citeste_si_sterge(director)
+
+
+def genereaza_curent(fisier_master, director, date=DATE_RAPORT, procese=None, **optiuni):
+    """Rapoartele generatorului curent pentru ambele hub-uri (citite din xlsx, apoi șterse)"""
+    for data in date:
+        for config in (BRASOV_CONFIG, SIBIU_CONFIG):
+            UnifiedHubReportGenerator(fisier_master, data, director, config, **optiuni).genereaza_rapoarte(procese)
+    return _citeste_si_sterge(director)
+
+
+def verifica_rapoarte_identice(asteptate, obtinute):
+    assert sorted(asteptate) == sorted(obtinute)
+    for nume, foi in asteptate.items():
+        assert sorted(foi) == sorted(obtinute[nume]), nume
+        for foaie, df in foi.items():
+            pd.testing.assert_frame_equal(obtinute[nume][foaie], df, check_exact=True, obj=f"{nume} {foaie}")
+
+
+@pytest.fixture
+def director_date(tmp_path):
+    """Director cu fișierele Utile și master_data.csv (cale terminată cu separator, ca base_url)"""
+    director = str(tmp_path) + os.sep
+    creeaza_date_test(director)
+    return director
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from conftest import DATE_RAPORT, genereaza_curent, genereaza_initial, verifica_rapoarte_identice
+from report_engine import DIRECTII, calculeaza_raport, pregateste_scanari
+from unified_hub_report_generator import BRASOV_CONFIG, UnifiedHubReportGenerator
+
+
+def test_implicit_identic_cu_initial(director_date):
+    """Fără mod_user, Sumar conține formulele VLOOKUP ale generatorului inițial"""
+    fisier_master = director_date + 'master_data.csv'
+    asteptate = genereaza_initial(fisier_master, director_date, DATE_RAPORT[:1])
+    obtinute = genereaza_curent(fisier_master, director_date, DATE_RAPORT[:1])
+    verifica_rapoarte_identice(asteptate, obtinute)
+
+
+def test_valori_ca_prima_potrivire_vlookup(director_date):
+    """Valorile sunt User (coloana M) de pe primul rând din Detaliat cu ruta (coloana B), fără majuscule"""
+    generator = UnifiedHubReportGenerator(director_date + 'master_data.csv', DATE_RAPORT[0], director_date,
+                                          BRASOV_CONFIG)
+    date_referinta = generator.incarca_date_referinta()
+    scanari = pregateste_scanari(generator.genereaza_date_in_memorie(), BRASOV_CONFIG['nume'], date_referinta.rute)
+
+    for directie in DIRECTII:
+        df_detaliat, df_sumar = calculeaza_raport(scanari, directie, date_referinta, 'valori')
+        _, df_formule = calculeaza_raport(scanari, directie, date_referinta)
+        assert df_formule['User:'].iloc[0].startswith('=VLOOKUP(')
+
+        rute = df_detaliat.iloc[:, 1].astype(str).str.lower().tolist()
+        for ruta, user in zip(df_sumar['Ruta'], df_sumar['User:']):
+            if ruta == 'Total':
+                assert user == ''
+                continue
+            asteptat = df_detaliat.iloc[rute.index(str(ruta).lower()), 12]
+            assert user == (0 if pd.isna(asteptat) else asteptat)
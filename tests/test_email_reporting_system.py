@@ -0,0 +1,42 @@
+import sqlite3
+
+from benchmark_istoric import COLOANE_ISTORIC, creeaza_baza_v1
+from email_reporting_system import VERSIUNE_SCHEMA, EmailReportingSystem
+
+
+def _randuri_v1(db_path, nr_randuri=300):
+    creeaza_baza_v1(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        f'INSERT INTO rapoarte_istoric ({COLOANE_ISTORIC}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(f'2025-08-{1 + i % 28:02d}', 'BRASOV', 'Statie-Hub', f'CENTRU{i % 7}', f'RUTA{i}',
+          i, i / 3, 0.5, 0.25) for i in range(nr_randuri)]
+    )
+    conn.commit()
+    randuri = conn.execute(f'SELECT id, {COLOANE_ISTORIC}, created_at FROM rapoarte_istoric ORDER BY id').fetchall()
+    conn.close()
+    return randuri
+
+
+def _vedere(sistem):
+    return sistem.baza.citeste(f'SELECT id, {COLOANE_ISTORIC}, created_at FROM rapoarte_istoric ORDER BY id')
+
+
+def test_migrare_v1_idempotenta(tmp_path):
+    """Vederea rapoarte_istoric are rândurile schemei 1; o a doua pornire nu mai modifică baza"""
+    base_path = str(tmp_path) + '/'
+    (tmp_path / 'Utile').mkdir()
+    asteptate = _randuri_v1(str(tmp_path / 'Utile' / 'rapoarte_istoric.db'))
+
+    with EmailReportingSystem(base_path) as sistem:
+        assert sistem.baza.versiune_schema() == VERSIUNE_SCHEMA
+        assert _vedere(sistem) == asteptate
+        assert sistem.baza.citeste('SELECT tabel, randuri, modificari FROM analiza_statistici') == [
+            ('istoric_rute', len(asteptate), 0)
+        ]
+
+    with EmailReportingSystem(base_path) as sistem:
+        assert _vedere(sistem) == asteptate
+        # Baza deja migrată și analizată: fără modificări, ANALYZE nu se repetă
+        assert not sistem.baza.analizeaza_daca_e_nevoie('istoric_rute')
+
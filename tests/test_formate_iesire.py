@@ -0,0 +1,38 @@
+import os
+
+import pandas as pd
+
+from conftest import DATE_RAPORT, genereaza_curent, genereaza_initial, verifica_rapoarte_identice
+from unified_hub_report_generator import BRASOV_CONFIG, UnifiedHubReportGenerator
+
+
+def test_foi_in_alte_formate(director_date):
+    """Detaliat în parquet și Sumar în json au același conținut ca foile xlsx"""
+    fisier_master = director_date + 'master_data.csv'
+    generator = UnifiedHubReportGenerator(fisier_master, DATE_RAPORT[0], director_date, BRASOV_CONFIG,
+                                          formate_iesire={'Detaliat': 'parquet', 'Sumar': 'json'})
+    generator.genereaza_rapoarte()
+    xlsx = UnifiedHubReportGenerator(fisier_master, DATE_RAPORT[0], director_date, BRASOV_CONFIG)
+
+    for cheie, fisier in generator.fisiere_output().items():
+        baza = os.path.splitext(fisier)[0]
+        detaliat = pd.read_parquet(f"{baza} Detaliat.parquet")
+        sumar = pd.read_json(f"{baza} Sumar.json", orient='records')
+        assert detaliat['bucati'].dtype == 'int64'
+        assert not os.path.exists(fisier)
+        assert len(sumar) == len(generator.sumare[cheie])
+        assert list(sumar['Ruta']) == list(generator.sumare[cheie]['Ruta'])
+
+    xlsx.genereaza_rapoarte()
+    for cheie, fisier in xlsx.fisiere_output().items():
+        foi = pd.read_excel(fisier, sheet_name=None)
+        detaliat = pd.read_parquet(f"{os.path.splitext(fisier)[0]} Detaliat.parquet")
+        assert len(foi['Detaliat']) == len(detaliat)
+        assert (foi['Detaliat']['bucati'].to_numpy() == detaliat['bucati'].to_numpy()).all()
+
+
+def test_xlsx_identic_cu_initial(director_date):
+    fisier_master = director_date + 'master_data.csv'
+    asteptate = genereaza_initial(fisier_master, director_date)
+    obtinute = genereaza_curent(fisier_master, director_date, mod_user='formula')
+    verifica_rapoarte_identice(asteptate, obtinute)
@@ -0,0 +1,67 @@
+import threading
+
+from history_db import BazaIstoric
+
+
+def _baza(tmp_path):
+    baza = BazaIstoric(str(tmp_path / 'istoric.db'))
+    with baza.scrie() as conn:
+        conn.execute('CREATE TABLE t (x INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?)', [(i,) for i in range(10)])
+    return baza
+
+
+def test_conexiuni_citire_inchise_dupa_fire(tmp_path):
+    """Firele care se termină nu lasă conexiuni deschise în urmă"""
+    baza = _baza(tmp_path)
+    rezultate = []
+    for _ in range(20):
+        fir = threading.Thread(target=lambda: rezultate.append(baza.citeste('SELECT COUNT(*) FROM t')[0][0]))
+        fir.start()
+        fir.join()
+        # Conexiunea de scriere și cel mult conexiunea firului abia terminat
+        assert len(baza._conexiuni) <= 2
+
+    assert rezultate == [10] * 20
+    assert baza.citeste('SELECT COUNT(*) FROM t') == [(10,)]
+    assert len(baza._conexiuni) == 2
+    baza.inchide()
+    assert baza._conexiuni == []
+
+
+def test_conexiune_refolosita_in_acelasi_fir(tmp_path):
+    baza = _baza(tmp_path)
+    baza.citeste('SELECT 1')
+    baza.citeste_df('SELECT * FROM t')
+    assert len(baza._conexiuni) == 2
+    baza.inchide()
+    baza.inchide()
+
+
+def test_analyze_doar_dupa_modificari(tmp_path):
+    """ANALYZE rulează din nou doar după ce peste PRAG_ANALIZA din rânduri au fost modificate"""
+    baza = BazaIstoric(str(tmp_path / 'istoric.db'))
+    with baza.scrie() as conn:
+        conn.execute('CREATE TABLE t (x INTEGER, y TEXT)')
+        conn.execute('CREATE INDEX idx_t ON t (y, x)')
+        conn.executemany('INSERT INTO t VALUES (?, ?)', [(i, f'v{i % 97}') for i in range(50_000)])
+
+    assert baza.analizeaza_daca_e_nevoie('t')
+    # Fără modificări nu se repetă, chiar dacă estimarea din sqlite_stat1 (analysis_limit) diferă
+    for _ in range(3):
+        assert not baza.analizeaza_daca_e_nevoie('t')
+    assert not baza.analizeaza_daca_e_nevoie('t', 3_000)
+    assert not baza.analizeaza_daca_e_nevoie('t', 2_000)
+    assert baza.analizeaza_daca_e_nevoie('t', 1)
+    assert not baza.analizeaza_daca_e_nevoie('t', 1)
+    assert baza.citeste('SELECT randuri, modificari FROM analiza_statistici') == [(50_000, 1)]
+    baza.inchide()
+
+
+def test_analyze_tabel_gol(tmp_path):
+    baza = _baza(tmp_path)
+    with baza.scrie() as conn:
+        conn.execute('CREATE TABLE gol (x INTEGER)')
+    assert not baza.analizeaza_daca_e_nevoie('gol')
+    assert baza.analizeaza_daca_e_nevoie('t')
+    baza.inchide()
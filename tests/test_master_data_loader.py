@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from conftest import creeaza_date_test, genereaza_curent, genereaza_initial, verifica_rapoarte_identice
+from master_data_loader import COLOANE_MASTER, citeste_master_csv, decategorizeaza, incarca_master
+
+
+@pytest.mark.parametrize('motor', ['pandas', 'pyarrow'])
+def test_schema_pastreaza_tipurile_deduse(tmp_path, motor):
+    """Valorile coloanelor categoriale au tipul dedus de pandas din CSV (ex: User numeric)"""
+    fisier_master = creeaza_date_test(str(tmp_path) + '/', user_numeric=True, ruta_numerica=True)
+    df = decategorizeaza(citeste_master_csv(fisier_master, motor=motor))
+    initial = pd.read_csv(fisier_master, parse_dates=['Scanare'])[COLOANE_MASTER]
+
+    assert isinstance(citeste_master_csv(fisier_master, motor=motor)['User'].dtype, pd.CategoricalDtype)
+    for coloana in COLOANE_MASTER:
+        assert df[coloana].dtype.kind == initial[coloana].dtype.kind, coloana
+    pd.testing.assert_frame_equal(df, initial, check_dtype=False)
+
+
+def test_cache_pastreaza_tipurile(tmp_path):
+    fisier_master = creeaza_date_test(str(tmp_path) + '/', user_numeric=True)
+    incarca_master(fisier_master)
+    df = incarca_master(fisier_master)
+    assert df['User'].cat.categories.dtype.kind == 'i'
+    assert df['bucati'].dtype == 'int64'
+
+
+@pytest.mark.parametrize('sursa', ['master', 'stream'])
+def test_rapoarte_cu_user_si_ruta_numerice(tmp_path, sursa):
+    """Regresie: User/Ruta numerice nu devin text (ordinea din Detaliat și celulele rămân ca inițial)"""
+    director = str(tmp_path) + '/'
+    fisier_master = creeaza_date_test(director, user_numeric=True, ruta_numerica=True)
+    asteptate = genereaza_initial(fisier_master, director)
+    obtinute = genereaza_curent(fisier_master, director, mod_user='formula', sursa=sursa)
+    verifica_rapoarte_identice(asteptate, obtinute)
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATE_RAPORT, genereaza_curent, genereaza_initial, verifica_rapoarte_identice
+from report_engine import DIRECTII, DateReferinta, calculeaza_raport, pregateste_scanari
+from unified_hub_report_generator import BRASOV_CONFIG, UnifiedHubReportGenerator
+
+
+@pytest.mark.parametrize('procese', [None, 2])
+def test_ambele_directii_identice_cu_initial(director_date, procese):
+    """Ambele rapoarte calculate din același set de scanări = rapoartele generatorului inițial"""
+    fisier_master = director_date + 'master_data.csv'
+    date = ['2025-08-20'] + DATE_RAPORT
+    asteptate = genereaza_initial(fisier_master, director_date, date)
+    obtinute = genereaza_curent(fisier_master, director_date, date, procese=procese, mod_user='formula')
+    verifica_rapoarte_identice(asteptate, obtinute)
+
+
+def test_coduri_bare_lipsa_identice_cu_initial(director_date):
+    """Scanările fără CodBare se potrivesc între ele în join, ca în merge-ul pe text inițial"""
+    fisier_master = director_date + 'master_data.csv'
+    df = pd.read_csv(fisier_master)
+    df.loc[np.random.default_rng(2).random(len(df)) < 0.05, 'CodBare'] = np.nan
+    df.to_csv(fisier_master, index=False)
+
+    asteptate = genereaza_initial(fisier_master, director_date, DATE_RAPORT[:1])
+    obtinute = genereaza_curent(fisier_master, director_date, DATE_RAPORT[:1], mod_user='formula')
+    verifica_rapoarte_identice(asteptate, obtinute)
+
+
+def test_directie_separata_identica_cu_ambele(director_date):
+    """O direcție pregătită singură dă același raport ca atunci când e pregătită împreună cu cealaltă"""
+    generator = UnifiedHubReportGenerator(director_date + 'master_data.csv', DATE_RAPORT[0], director_date,
+                                          BRASOV_CONFIG)
+    date_referinta = generator.incarca_date_referinta()
+    surse = generator.genereaza_date_in_memorie()
+    ambele = pregateste_scanari(surse, BRASOV_CONFIG['nume'], date_referinta.rute)
+
+    for directie in DIRECTII:
+        singura = pregateste_scanari({directie.cheie: surse[directie.cheie]}, BRASOV_CONFIG['nume'],
+                                     date_referinta.rute)
+        for asteptat, obtinut in zip(calculeaza_raport(ambele, directie, date_referinta),
+                                     calculeaza_raport(singura, directie, date_referinta)):
+            pd.testing.assert_frame_equal(obtinut, asteptat)
+
+
+def _scanari(coduri, ore, hub_pe_iesire):
+    """Scanări sintetice pe o parte: o rută BRASOV și centrul potrivit părții"""
+    return pd.DataFrame({
+        'CodBare': coduri, 'Ruta': 'R1', 'Centru': 'BRASOV' if hub_pe_iesire else 'CLUJ',
+        'Centru exp': 'CLUJ', 'Centru dest': 'BRASOV', 'Expeditor': 'EXP', 'Destinatar': 'DST',
+        'bucati': 1, 'Greutate': 1.0, 'Categorie': 'Colete',
+        'Scanare': pd.Timestamp('2025-08-21') + pd.to_timedelta(ore, unit='h'), 'User': [f'u{o}' for o in ore],
+    })
+
+
+@pytest.mark.parametrize('politica, ore_pastrate, numar', [
+    ('prima', [1, 2], None),
+    ('ultima', [3, 2], None),
+    ('prima_cu_numar', [1, 2], [2, 1]),
+])
+def test_politici_duplicate(politica, ore_pastrate, numar):
+    """Un singur rând pe CodBare și parte; rândurile fără CodBare rămân toate, necombinate"""
+    iesire = _scanari(['A', np.nan, 'B', 'A', np.nan], [1, 4, 2, 3, 5], hub_pe_iesire=True)
+    intrare = _scanari(['A', np.nan], [6, 7], hub_pe_iesire=False)
+    scanari = pregateste_scanari({'hub_statie': {'iesire': iesire, 'intrare': intrare}}, 'BRASOV', ['R1'],
+                                 politica)
+    assert scanari.duplicate['hub_statie'] == {'iesire': 1, 'intrare': 0}
+
+    parte = scanari.parti['hub_statie']['iesire']
+    cu_cod = parte[scanari.coduri_bare.take(parte['CodBare'].to_numpy()).notna()]
+    assert sorted((cu_cod['Scanare'].dt.hour).tolist()) == sorted(ore_pastrate)
+    if numar is not None:
+        assert sorted(cu_cod['Nr Scanari'].tolist(), reverse=True) == numar
+        assert (parte['Nr Scanari'] >= 1).all()
+
+    date_referinta = DateReferinta(['R1'], {'hub_statie': {}}, set())
+    df_detaliat, _ = calculeaza_raport(scanari, DIRECTII[1], date_referinta)
+    # A (ieșire + intrare), B, două scanări de ieșire și una de intrare fără CodBare
+    assert len(df_detaliat) == 5
+    assert df_detaliat['CodBare'].isna().sum() == 3
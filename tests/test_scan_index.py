@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from master_data_loader import incarca_master
+from scan_index import IndexScanari
+from scan_windows import FereastraScanare, masca_fereastra
+from unified_hub_report_generator import BRASOV_CONFIG, SIBIU_CONFIG, UnifiedHubReportGenerator
+
+FERESTRE = [
+    FereastraScanare('Iesire Centru', None, pd.Timestamp('2025-08-21 15:30'), pd.Timestamp('2025-08-22 15:30')),
+    FereastraScanare('Intrare Centru', 'BRASOV', pd.Timestamp('2025-08-21'), pd.Timestamp('2025-08-21 23:59:59')),
+    FereastraScanare('Intrare Centru', 'NU EXISTA', pd.Timestamp('2025-08-21'), pd.Timestamp('2025-08-22')),
+    FereastraScanare('Livrare', None, pd.Timestamp('2030-01-01'), pd.Timestamp('2030-01-02')),
+]
+
+
+@pytest.mark.parametrize('fereastra', FERESTRE)
+def test_fereastra_identica_cu_masca(director_date, fereastra):
+    """Decuparea cu searchsorted selectează aceleași rânduri, în ordinea din master, ca masca completă"""
+    df_master = incarca_master(director_date + 'master_data.csv')
+    asteptat = df_master[masca_fereastra(df_master, fereastra)]
+    pd.testing.assert_frame_equal(IndexScanari(df_master).fereastra(fereastra), asteptat)
+
+
+def test_scanare_lipsa_nu_intra_in_ferestre(director_date):
+    df_master = incarca_master(director_date + 'master_data.csv').copy()
+    df_master.loc[df_master.index[:50], 'Scanare'] = pd.NaT
+    fereastra = FereastraScanare('Iesire Centru', None, pd.Timestamp('2000-01-01'), pd.Timestamp('2100-01-01'))
+    pd.testing.assert_frame_equal(
+        IndexScanari(df_master).fereastra(fereastra), df_master[masca_fereastra(df_master, fereastra)]
+    )
+
+
+@pytest.mark.parametrize('config', [BRASOV_CONFIG, SIBIU_CONFIG])
+@pytest.mark.parametrize('data', ['2025-08-21', '2025-08-22'])
+def test_ferestre_identice_intre_surse(director_date, config, data):
+    """Ferestrele raportului extrase din index sunt identice cu cele citite în streaming"""
+    fisier_master = director_date + 'master_data.csv'
+    din_index = UnifiedHubReportGenerator(fisier_master, data, director_date, config).extrage_ferestre()
+    din_stream = UnifiedHubReportGenerator(fisier_master, data, director_date, config,
+                                           sursa='stream').extrage_ferestre()
+    for nume, df in din_stream.items():
+        pd.testing.assert_frame_equal(din_index[nume].reset_index(drop=True), df.reset_index(drop=True),
+                                      check_dtype=False, check_categorical=False)
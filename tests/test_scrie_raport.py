@@ -0,0 +1,71 @@
+import re
+
+import openpyxl
+import pandas as pd
+
+from conftest import DATE_RAPORT
+from report_engine import HUB_STATIE, calculeaza_raport, imparte_detaliat, pregateste_scanari, scrie_raport
+from unified_hub_report_generator import BRASOV_CONFIG, UnifiedHubReportGenerator
+
+MAX_RANDURI_TEST = 10
+
+
+def _raport(director_date, mod_user):
+    generator = UnifiedHubReportGenerator(director_date + 'master_data.csv', DATE_RAPORT[0], director_date,
+                                          BRASOV_CONFIG)
+    date_referinta = generator.incarca_date_referinta()
+    scanari = pregateste_scanari(generator.genereaza_date_in_memorie(), BRASOV_CONFIG['nume'], date_referinta.rute)
+    return calculeaza_raport(scanari, HUB_STATIE, date_referinta, mod_user)
+
+
+def test_imparte_detaliat():
+    df = pd.DataFrame({'a': range(7)})
+    assert list(imparte_detaliat(df, 7)) == ['Detaliat']
+    foi = imparte_detaliat(df, 3)
+    assert list(foi) == ['Detaliat_1', 'Detaliat_2', 'Detaliat_3']
+    assert [len(f) for f in foi.values()] == [3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(foi.values()), df)
+
+
+def test_formule_cauta_in_foaia_primei_aparitii(director_date, tmp_path):
+    """Fiecare VLOOKUP caută ruta în foaia Detaliat_k în care apare prima dată"""
+    df_detaliat, df_sumar = _raport(director_date, 'formula')
+    assert len(df_detaliat) > 3 * MAX_RANDURI_TEST
+    fisier = str(tmp_path / 'raport.xlsx')
+    scrie_raport(fisier, df_detaliat, df_sumar, max_randuri_foaie=MAX_RANDURI_TEST)
+
+    registru = openpyxl.load_workbook(fisier)
+    foi = [f for f in registru.sheetnames if f != 'Sumar']
+    assert foi == [f'Detaliat_{k + 1}' for k in range(-(-len(df_detaliat) // MAX_RANDURI_TEST))]
+    rute_pe_foi = [
+        {str(r[0]).lower() for r in registru[f].iter_rows(min_row=2, min_col=2, max_col=2, values_only=True)}
+        for f in foi
+    ]
+    assert sum(registru[f].max_row - 1 for f in foi) == len(df_detaliat)
+
+    sumar = registru['Sumar']
+    coloana_user = [c.value for c in sumar[1]].index('User:')
+    for rand in sumar.iter_rows(min_row=2, values_only=True):
+        ruta, formula = rand[0], rand[coloana_user]
+        if ruta == 'Total':
+            assert not formula
+            continue
+        foaie = re.match(r"=VLOOKUP\(A\d+,(\w+)!B:M,12,FALSE\)", formula).group(1)
+        k = foi.index(foaie)
+        assert str(ruta).lower() in rute_pe_foi[k]
+        assert all(str(ruta).lower() not in rute for rute in rute_pe_foi[:k])
+
+
+def test_valori_nemodificate_la_impartire(director_date, tmp_path):
+    """În modul 'valori' foaia Sumar este aceeași cu sau fără împărțirea foii Detaliat"""
+    df_detaliat, df_sumar = _raport(director_date, 'valori')
+    impartit, intreg = str(tmp_path / 'impartit.xlsx'), str(tmp_path / 'intreg.xlsx')
+    scrie_raport(impartit, df_detaliat, df_sumar, max_randuri_foaie=MAX_RANDURI_TEST)
+    scrie_raport(intreg, df_detaliat, df_sumar)
+
+    foi = pd.read_excel(impartit, sheet_name=None)
+    foi_intreg = pd.read_excel(intreg, sheet_name=None)
+    assert len(foi) > 2
+    pd.testing.assert_frame_equal(foi['Sumar'], foi_intreg['Sumar'])
+    detaliat = pd.concat([foi[f] for f in foi if f != 'Sumar'], ignore_index=True)
+    assert list(detaliat['CodBare']) == list(foi_intreg['Detaliat']['CodBare'])
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATE_RAPORT, creeaza_date_test, genereaza_curent, genereaza_initial, verifica_rapoarte_identice
+from master_data_loader import decategorizeaza, incarca_master
+from scan_windows import FereastraScanare, masca_fereastra
+from shared_master import ataseaza_master_partajat, detaseaza_masterele_partajate, publica_master_partajat
+
+pytest.importorskip('pyarrow')
+
+FERESTRE = [
+    FereastraScanare('Iesire Centru', None, pd.Timestamp('2025-08-21 15:30'), pd.Timestamp('2025-08-22 15:30')),
+    FereastraScanare('Intrare Centru', 'BRASOV', pd.Timestamp('2025-08-21'), pd.Timestamp('2025-08-21 23:59:59')),
+    FereastraScanare('Intrare Centru', None, pd.Timestamp('2000-01-01'), pd.Timestamp('2100-01-01')),
+    FereastraScanare('Intrare Centru', 'NU EXISTA', pd.Timestamp('2025-08-21'), pd.Timestamp('2025-08-22')),
+    FereastraScanare('Livrare', None, pd.Timestamp('2030-01-01'), pd.Timestamp('2030-01-02')),
+]
+
+
+@pytest.fixture(scope='module')
+def master_partajat(tmp_path_factory):
+    """Master cu mai multe record batch-uri Arrow, Scanare și Centru lipsă pe unele rânduri"""
+    director = str(tmp_path_factory.mktemp('partajat'))
+    fisier_master = creeaza_date_test(director, nr_randuri=150_000)
+    df = pd.read_csv(fisier_master)
+    rng = np.random.default_rng(3)
+    df.loc[rng.random(len(df)) < 0.01, 'Scanare'] = np.nan
+    df.loc[rng.random(len(df)) < 0.01, 'Centru'] = np.nan
+    df.to_csv(fisier_master, index=False)
+
+    cale = publica_master_partajat(fisier_master, os.path.join(director, 'master.arrow'))
+    yield incarca_master(fisier_master), ataseaza_master_partajat(cale)
+    detaseaza_masterele_partajate()
+
+
+def test_tabel_sortat_pe_mai_multe_bucati(master_partajat):
+    _, master = master_partajat
+    assert master.tabel.column('_timp').num_chunks > 1
+
+
+@pytest.mark.parametrize('fereastra', FERESTRE)
+def test_fereastra_identica_cu_masca(master_partajat, fereastra):
+    """Decuparea din fișierul sortat = masca pe tot master-ul, în ordinea din master"""
+    df_master, master = master_partajat
+    asteptat = decategorizeaza(df_master[masca_fereastra(df_master, fereastra)]).reset_index(drop=True)
+    pd.testing.assert_frame_equal(master.fereastra(fereastra), asteptat)
+
+
+def test_publicare_fara_fisiere_temporare_ramase(director_date, tmp_path):
+    cale = str(tmp_path / 'partajat' / 'master.arrow')
+    assert publica_master_partajat(director_date + 'master_data.csv', cale) == cale
+    assert os.listdir(os.path.dirname(cale)) == ['master.arrow']
+
+
+@pytest.mark.parametrize('procese', [None, 2])
+def test_rapoarte_partajat_identice_cu_initial(tmp_path, procese):
+    director = str(tmp_path) + os.sep
+    fisier_master = creeaza_date_test(director, user_numeric=True)
+    asteptate = genereaza_initial(fisier_master, director)
+    obtinute = genereaza_curent(fisier_master, director, procese=procese, sursa='partajat',
+                                fisier_partajat=os.path.join(director, 'master.arrow'))
+    verifica_rapoarte_identice(asteptate, obtinute)
@@ -1,12 +1,66 @@
 import pandas as pd
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import os
+import time
+from master_data_loader import filtreaza_master_pe_ferestre, decategorizeaza
+from report_engine import (
+    COLOANE_NECESARE,
+    DIRECTII,
+    HUB_STATIE,
+    STATIE_HUB,
+    calculeaza_raport,
+    incarca_date_referinta,
+    pregateste_scanari,
+    scrie_raport,
+    verifica_mod_user,
+    verifica_politica_duplicate,
+)
+from report_writers import MOTOR_EXCEL_IMPLICIT, verifica_formate_iesire, verifica_motor_excel
+from scan_index import obtine_index_master
+from scan_store import citeste_partitii
+from scan_windows import FereastraScanare, interval_ferestre, masca_fereastra
+from shared_master import cale_master_partajat, ferestre_partajate, publica_master_partajat
 
 class UnifiedHubReportGenerator:
-    def __init__(self, fisier_master, data_raport, base_url, hub_config=None):
+    def __init__(self, fisier_master, data_raport, base_url, hub_config=None, foloseste_cache=True,
+                 sursa='master', director_partitii=None, salveaza_temporare=False, index=None,
+                 motor_citire='pandas', politica_duplicate=None, motor_excel=MOTOR_EXCEL_IMPLICIT,
+                 mod_user='formula', formate_iesire=None, fisier_partajat=None):
         self.fisier_master = fisier_master
         self.data_raport = datetime.strptime(data_raport, "%Y-%m-%d")
         self.base_url = base_url
+        self.foloseste_cache = foloseste_cache
+        # Motorul pentru citirea CSV-ului master: 'pandas' sau 'pyarrow' (multithread)
+        self.motor_citire = motor_citire
+        # Sursa scanărilor: 'master' (încărcare completă, cu cache), 'stream' (citire pe blocuri)
+        # sau 'partitii' (depozitul zilnic creat cu scan_store.ingereaza_master_in_partitii)
+        # sau 'partajat' (fișier Arrow mapat în memorie, comun tuturor proceselor - vezi shared_master)
+        self.sursa = sursa
+        self.director_partitii = director_partitii or f"{base_url}scans"
+        self.fisier_partajat = fisier_partajat or cale_master_partajat(fisier_master)
+        # Mod debug: ferestrele sunt scrise ca temp_*.csv în base_url și păstrate pentru inspecție
+        self.salveaza_temporare = salveaza_temporare
+        # IndexScanari deja construit (opțional); altfel se folosește indexul procesului pentru fisier_master
+        self.index = index
+        # Coduri de bare scanate de mai multe ori pe aceeași parte: None (toate scanările intră în join),
+        # 'prima', 'ultima' sau 'prima_cu_numar' (prima scanare + numărul de scanări în Detaliat)
+        verifica_politica_duplicate(politica_duplicate)
+        self.politica_duplicate = politica_duplicate
+        # Scrierea Excel: 'xlsxwriter' (streaming, memorie constantă) sau 'openpyxl' (varianta inițială)
+        verifica_motor_excel(motor_excel)
+        self.motor_excel = motor_excel
+        # Coloana "User:" din Sumar: 'formula' (VLOOKUP în Detaliat, implicit) sau 'valori' (calculate la generare)
+        verifica_mod_user(mod_user)
+        # Formatul fiecărei foi: {'Detaliat'/'Sumar': 'xlsx'/'parquet'/'csv.gz'/'json'}, implicit xlsx
+        verifica_formate_iesire(formate_iesire)
+        self.formate_iesire = formate_iesire or {}
+        if mod_user == 'formula' and self.formate_iesire.get('Detaliat', 'xlsx') != 'xlsx':
+            # Formulele VLOOKUP au nevoie de foaia Detaliat în același workbook
+            print("⚠️ Detaliat nu este scris în xlsx - coloana User: conține valori, nu formule")
+            mod_user = 'valori'
+        self.mod_user = mod_user
         
         # Configurarea implicită pentru Brașov (compatibilitate înapoi)
         default_config = {
@@ -31,11 +85,17 @@ class UnifiedHubReportGenerator:
         self.fisier_echivalenta = f"{base_url}Utile/rute{hub_nume_lower}_echivalenta.xlsx"
         self.fisier_fara_scan = f"{base_url}Utile/FirmeFaraScanIesire.xlsx"
         
-    def genereaza_fisiere_temporare(self):
-        """Generează fișierele temporare din fișierul master pe baza criteriilor"""
-        print("Se încarcă fișierul master...")
-        df_master = pd.read_csv(self.fisier_master, parse_dates=['Scanare'])
+        # Foile Sumar ale ultimelor rapoarte generate: {'statie_hub'/'hub_statie': DataFrame, cu rândul Total}
+        self.sumare = {}
         
+    def _data_urmatoare(self):
+        """Ziua următoare datei raportului (luni, dacă raportul este vineri)"""
+        if self.data_raport.weekday() == 4:  # 4 = vineri (0=luni, 1=marți, etc.)
+            return self.data_raport + timedelta(days=3)
+        return self.data_raport + timedelta(days=1)
+    
+    def calculeaza_ferestre(self):
+        """Calculează ferestrele de scanare (tip, centru, interval) pentru cele 4 seturi de date"""
         # Calculează intervalele de timp pe baza configurației hub-ului
         data_raport_start = self.data_raport.replace(hour=0, minute=0, second=0)
         data_raport_end = self.data_raport.replace(hour=23, minute=59, second=59)
@@ -46,11 +106,10 @@ class UnifiedHubReportGenerator:
             minute=self.hub_config['intrare_start_minute'], 
             second=0
         )
-        if self.data_raport.weekday() == 4:  # 4 = vineri (0=luni, 1=marți, etc.)
-            data_urmatoare = self.data_raport + timedelta(days=3)  # pentru intrare_centru (luni)
+        data_urmatoare = self._data_urmatoare()  # pentru intrare_centru (luni, dacă e vineri)
+        if self.data_raport.weekday() == 4:  # vineri
             intrare_hub_end_date = self.data_raport + timedelta(days=1)  # pentru intrare_hub (sâmbătă)
         else:
-            data_urmatoare = self.data_raport + timedelta(days=1)
             intrare_hub_end_date = data_urmatoare
         intrare_end = intrare_hub_end_date.replace(
             hour=self.hub_config['intrare_end_hour'], 
@@ -77,44 +136,94 @@ class UnifiedHubReportGenerator:
         # Intervalul pentru intrarea centru (rămâne fix)
         data_urmatoare_16_59 = data_urmatoare.replace(hour=16, minute=59, second=59)
         
-        print(f"Generez fișierele pentru data raport: {self.data_raport.strftime('%Y-%m-%d')}")
-        
-        # Generează fișiere pentru primul raport (Statie-Hub)
-        # Ieșire centru: "Iesire Centru" din data raport 00:00-23:59
-        iesire_centru = df_master[
-            (df_master['Tip Scanare'] == 'Iesire Centru') &
-            (df_master['Scanare'] >= data_raport_start) &
-            (df_master['Scanare'] <= data_raport_end)
-        ]
-        
-        # Intrare hub: "Intrare Centru", centru=config, din interval configurabil
-        intrare_hub = df_master[
-            (df_master['Tip Scanare'] == 'Intrare Centru') &
-            (df_master['Centru'] == self.hub_config['nume']) &
-            (df_master['Scanare'] >= intrare_start) &
-            (df_master['Scanare'] <= intrare_end)
-        ]
-        
-        # Generează fișiere pentru al doilea raport (Hub-Statie)
-        # Ieșire HUB: "Iesire Centru", centru=config, din interval configurabil
-        iesire_hub = df_master[
-            (df_master['Tip Scanare'] == 'Iesire Centru') &
-            (df_master['Centru'] == self.hub_config['nume']) &
-            (df_master['Scanare'] >= iesire_start) &
-            (df_master['Scanare'] <= iesire_end)
-        ]
-        
         # Intrare centru: pentru vineri din sâmbătă 00:00 - luni 16:59, altfel din data+1 00:00 - data+1 16:59
         if self.data_raport.weekday() == 4:  # vineri
             intrare_centru_start = (self.data_raport + timedelta(days=1)).replace(hour=0, minute=0, second=0)  # sâmbătă 00:00
         else:
             intrare_centru_start = data_urmatoare.replace(hour=0, minute=0, second=0)  # data+1 00:00
         
-        intrare_centru = df_master[
-            (df_master['Tip Scanare'] == 'Intrare Centru') &
-            (df_master['Scanare'] >= intrare_centru_start) &
-            (df_master['Scanare'] <= data_urmatoare_16_59)
-        ]
+        return {
+            # Statie-Hub - ieșire centru: "Iesire Centru" din data raport 00:00-23:59
+            'iesire_centru': FereastraScanare('Iesire Centru', None, data_raport_start, data_raport_end),
+            # Statie-Hub - intrare hub: "Intrare Centru", centru=config, din interval configurabil
+            'intrare_hub': FereastraScanare('Intrare Centru', self.hub_config['nume'], intrare_start, intrare_end),
+            # Hub-Statie - ieșire HUB: "Iesire Centru", centru=config, din interval configurabil
+            'iesire_hub': FereastraScanare('Iesire Centru', self.hub_config['nume'], iesire_start, iesire_end),
+            # Hub-Statie - intrare centru: "Intrare Centru" până în ziua următoare 16:59
+            'intrare_centru': FereastraScanare('Intrare Centru', None, intrare_centru_start, data_urmatoare_16_59)
+        }
+    
+    def extrage_ferestre(self):
+        """Extrage din fișierul master scanările fiecărei ferestre (ca DataFrame-uri)"""
+        ferestre = self.calculeaza_ferestre()
+        
+        if self.sursa == 'stream':
+            # Citire pe blocuri: în memorie rămân doar rândurile din ferestre
+            return filtreaza_master_pe_ferestre(self.fisier_master, ferestre)
+        
+        if self.sursa == 'partitii':
+            # Se citesc doar zilele care se suprapun cu ferestrele raportului
+            start, end = interval_ferestre(ferestre.values())
+            df_partitii = citeste_partitii(self.director_partitii, start, end)
+            return {
+                nume: decategorizeaza(df_partitii[masca_fereastra(df_partitii, fereastra)])
+                for nume, fereastra in ferestre.items()
+            }
+        
+        if self.sursa == 'partajat':
+            # Ferestrele sunt filtrate direct din fișierul Arrow mapat în memorie
+            self.publica_master_partajat()
+            return ferestre_partajate(self.fisier_partajat, ferestre)
+        
+        # Indexul sortat este construit o singură dată și refolosit între hub-uri și date
+        index = self.index or obtine_index_master(self.fisier_master, self.foloseste_cache, self.motor_citire)
+        
+        # Ferestrele sunt mici, deci categoriile se pot converti înapoi la valori simple
+        return {
+            nume: decategorizeaza(index.fereastra(fereastra))
+            for nume, fereastra in ferestre.items()
+        }
+    
+    def genereaza_date_in_memorie(self):
+        """Extrage ferestrele și le grupează pe rapoarte, fără fișiere temporare"""
+        if self.index is not None:
+            print("Se folosește fișierul master deja încărcat...")
+        else:
+            print("Se încarcă fișierul master...")
+        date_ferestre = self.extrage_ferestre()
+        
+        print(f"Extrag datele pentru data raport: {self.data_raport.strftime('%Y-%m-%d')}")
+        print(f"Extras: {len(date_ferestre['iesire_centru'])} înregistrări pentru ieșire centru")
+        print(f"Extras: {len(date_ferestre['intrare_hub'])} înregistrări pentru intrare hub")
+        print(f"Extras: {len(date_ferestre['iesire_hub'])} înregistrări pentru ieșire hub")
+        print(f"Extras: {len(date_ferestre['intrare_centru'])} înregistrări pentru intrare centru")
+        
+        return {
+            cheie: {parte: date_ferestre[fereastra] for parte, fereastra in ferestre.items()}
+            for cheie, ferestre in FERESTRE_DIRECTII.items()
+        }
+    
+    def publica_master_partajat(self):
+        """Scrie fișierul Arrow partajat dacă lipsește sau dacă master-ul s-a modificat"""
+        return publica_master_partajat(self.fisier_master, self.fisier_partajat, self.foloseste_cache, self.motor_citire)
+    
+    def _surse(self):
+        """Ferestrele raportului: fișiere temp_*.csv (mod debug) sau DataFrame-uri în memorie"""
+        if self.salveaza_temporare:
+            return self.genereaza_fisiere_temporare()
+        return self.genereaza_date_in_memorie()
+    
+    def genereaza_fisiere_temporare(self):
+        """Generează fișierele temporare din fișierul master pe baza criteriilor"""
+        print("Se încarcă fișierul master...")
+        date_ferestre = self.extrage_ferestre()
+        iesire_centru = date_ferestre['iesire_centru']
+        intrare_hub = date_ferestre['intrare_hub']
+        iesire_hub = date_ferestre['iesire_hub']
+        intrare_centru = date_ferestre['intrare_centru']
+        data_urmatoare = self._data_urmatoare()
+        
+        print(f"Generez fișierele pentru data raport: {self.data_raport.strftime('%Y-%m-%d')}")
         
         # Salvează fișierele temporare
         data_str = self.data_raport.strftime("%d.%m")
@@ -146,307 +255,68 @@ class UnifiedHubReportGenerator:
             }
         }
     
-    def sumarizeaza_date_logistice_statie_hub(self, fisier_iesire, fisier_intrare, fisier_output):
-        """Generează raportul Statie-Hub (similar cu primul script)"""
-        print(f"Generez raportul Statie-Hub...")
-        
-        df_iesire = pd.read_csv(fisier_iesire, parse_dates=['Scanare'])
-        df_intrare = pd.read_csv(fisier_intrare, parse_dates=['Scanare'])
-        rute = pd.read_csv(self.fisier_rute)
-        
-        df_echivalenta = pd.read_excel(self.fisier_echivalenta, sheet_name='Sheet1')
-        df_fara_scan = pd.read_excel(self.fisier_fara_scan, sheet_name='Sheet3')
-        
-        valori_fara_scan = set(df_fara_scan.iloc[:, 0].dropna().astype(str))
-        
-        conditii_filtrare = lambda df: (
-            df['Categorie'].isin(['Colete', 'Paleti']) &
-            df['Ruta'].isin(rute['Denumire'])
-        )
-        
-        df_iesire = df_iesire[conditii_filtrare(df_iesire) & (df_iesire['Centru'] != self.hub_config['nume'])]
-        df_intrare = df_intrare[conditii_filtrare(df_intrare) & (df_intrare['Centru'] == self.hub_config['nume'])]
-        
-        coloane_necesare = ['CodBare', 'Ruta', 'Centru exp', 'Centru dest', 
-                             'Expeditor', 'Destinatar', 'bucati', 'Greutate', 
-                             'Categorie', 'Scanare', 'User']
-        
-        df_iesire = df_iesire[coloane_necesare].rename(columns={
-            'Ruta': 'Ruta Iesire Centru',
-            'Scanare': 'DataScanare Iesire Centru',
-            'User': 'User_iesire'
-        })
-        
-        df_intrare = df_intrare[coloane_necesare].rename(columns={
-            'Ruta': 'Ruta Intrare Hub',
-            'Scanare': 'DataScanare Intrare Centru',
-            'User': 'User_intrare'
-        })
-        
-        df_final = pd.merge(
-            df_iesire, 
-            df_intrare, 
-            on=['CodBare'], 
-            how='outer',
-            suffixes=('_iesire', '_intrare')
-        )
-        
-        for col in ['Centru exp', 'Centru dest', 'Expeditor', 'Destinatar', 
-                    'bucati', 'Greutate', 'Categorie']:
-            df_final[col] = df_final[f'{col}_iesire'].fillna(df_final[f'{col}_intrare'])
-            df_final = df_final.drop([f'{col}_iesire', f'{col}_intrare'], axis=1)
-        
-        df_final['User'] = df_final['User_intrare']
-        df_final = df_final.drop(['User_iesire', 'User_intrare'], axis=1)
-        
-        df_final['Data'] = df_final['DataScanare Iesire Centru'].fillna(
-            df_final['DataScanare Intrare Centru']
-        )
-        
-        df_final['Greutate Medie'] = df_final.apply(
-            lambda row: round(row['Greutate'] / row['bucati'], 2) if row['bucati'] != 0 else 0,
-            axis=1
-        )
-        
-        dict_echivalenta = dict(zip(df_echivalenta.iloc[:, 0], df_echivalenta.iloc[:, 1]))
-        
-        df_final['Ruta Iesire Centru'] = df_final.apply(
-            lambda row: dict_echivalenta.get(row['Ruta Intrare Hub']) 
-            if pd.isna(row['Ruta Iesire Centru']) and row['Ruta Intrare Hub'] in dict_echivalenta
-            else row['Ruta Iesire Centru'],
-            axis=1
-        )
-        
-        df_final['DataScanare Iesire Centru'] = df_final.apply(
-            lambda row: "Fara scan iesire" 
-            if pd.isna(row['DataScanare Iesire Centru']) and str(row['Expeditor']) in valori_fara_scan
-            else row['DataScanare Iesire Centru'],
-            axis=1
+    @staticmethod
+    def _incarca_fereastra(sursa):
+        """Acceptă un DataFrame (pipeline în memorie) sau calea unui fișier temporar CSV"""
+        if isinstance(sursa, pd.DataFrame):
+            return sursa
+        return pd.read_csv(sursa, parse_dates=['Scanare'])
+    
+    def incarca_date_referinta(self):
+        """Rutele, echivalențele și firmele fără scanare de ieșire (citite o dată pe proces, vezi reference_data)"""
+        return incarca_date_referinta(self.fisier_rute, self.fisier_echivalenta, self.fisier_fara_scan)
+    
+    def sumarizeaza_rapoarte(self, surse, fisiere_output, date_referinta=None):
+        """Generează ambele rapoarte dintr-un singur set de scanări filtrat
+        
+        surse: {'statie_hub'/'hub_statie': {'iesire', 'intrare'}} - căi CSV sau DataFrame-uri
+        fisiere_output: {'statie_hub'/'hub_statie': cale xlsx}
+        Returnează {'statie_hub'/'hub_statie': fișierele scrise} (xlsx și foile în alte formate);
+        foile Sumar rămân în self.sumare.
+        """
+        date_referinta = date_referinta or self.incarca_date_referinta()
+        surse = {
+            cheie: {parte: self._incarca_fereastra(sursa) for parte, sursa in parti.items()}
+            for cheie, parti in surse.items()
+        }
+        scanari = pregateste_scanari(
+            surse, self.hub_config['nume'], date_referinta.rute, self.politica_duplicate
         )
         
-        # Creez coloane helper pentru contorizare
-        df_final['has_scan_iesire'] = df_final['DataScanare Iesire Centru'].notna()
-        df_final['has_scan_intrare'] = df_final['DataScanare Intrare Centru'].notna()
-        
-        df_sumar = df_final.groupby("Ruta Iesire Centru").agg(
-            **{
-                "Nr Colete": ("Ruta Iesire Centru", "count"),
-                "Greutate": ("Greutate Medie", "sum"),
-                "Scan iesire Centru": ("has_scan_iesire", "sum"),
-                "Scan intrare Hub": ("has_scan_intrare", "sum")
-            }
-        ).reset_index().rename(columns={"Ruta Iesire Centru": "Ruta"})
-        
-        df_sumar["Procent Iesire Centru"] = df_sumar.apply(
-            lambda row: row["Scan iesire Centru"] / row["Nr Colete"] if row["Nr Colete"] != 0 else 0,
-            axis=1
-        )
-        df_sumar["Procent Intrare Hub"] = df_sumar.apply(
-            lambda row: row["Scan intrare Hub"] / row["Nr Colete"] if row["Nr Colete"] != 0 else 0,
-            axis=1
+        fisiere_scrise = {}
+        for directie in DIRECTII:
+            if directie.cheie not in scanari.parti:
+                continue
+            raporteaza_duplicate(directie, scanari.duplicate[directie.cheie], self.politica_duplicate)
+            print(f"Generez raportul {directie.nume}...")
+            df_detaliat, df_sumar = calculeaza_raport(scanari, directie, date_referinta, self.mod_user)
+            self.sumare[directie.cheie] = df_sumar
+            fisiere_scrise[directie.cheie] = scrie_raport(
+                fisiere_output[directie.cheie], df_detaliat, df_sumar, self.motor_excel,
+                formate_iesire=self.formate_iesire
+            )
+            print(f"Raportul {directie.nume} a fost salvat în: {', '.join(fisiere_scrise[directie.cheie])}")
+        return fisiere_scrise
+    
+    def _sumarizeaza_directie(self, directie, fisier_iesire, fisier_intrare, fisier_output):
+        self.sumarizeaza_rapoarte(
+            {directie.cheie: {'iesire': fisier_iesire, 'intrare': fisier_intrare}},
+            {directie.cheie: fisier_output}
         )
+    
+    def sumarizeaza_date_logistice_statie_hub(self, fisier_iesire, fisier_intrare, fisier_output):
+        """Generează raportul Statie-Hub (similar cu primul script)
         
-        total_nr_colete = int(df_sumar["Nr Colete"].sum())
-        total_greutate = float(df_sumar["Greutate"].sum())
-        total_scan_iesire = int(df_sumar["Scan iesire Centru"].sum())
-        total_scan_intrare = int(df_sumar["Scan intrare Hub"].sum())
-        total_procent_iesire = total_scan_iesire / total_nr_colete if total_nr_colete != 0 else 0
-        total_procent_intrare = total_scan_intrare / total_nr_colete if total_nr_colete != 0 else 0
-
-        total_row = pd.DataFrame({
-            "Ruta": ["Total"],
-            "Nr Colete": [total_nr_colete],
-            "Greutate": [total_greutate],
-            "Scan iesire Centru": [total_scan_iesire],
-            "Scan intrare Hub": [total_scan_intrare],
-            "Procent Iesire Centru": [total_procent_iesire],
-            "Procent Intrare Hub": [total_procent_intrare]
-        })
-        df_sumar = pd.concat([df_sumar, total_row], ignore_index=True)
-        
-        def formula_user(idx, ruta):
-            if ruta == "Total":
-                return ""
-            else:
-                return f"=VLOOKUP(A{idx+2},Detaliat!B:M,12,FALSE)"
-        
-        df_sumar["User:"] = [formula_user(idx, row["Ruta"]) for idx, row in df_sumar.iterrows()]
-        
-        # Sortează df_final după coloana User
-        df_final_sorted = df_final.sort_values('User', na_position='last')
-        
-        with pd.ExcelWriter(fisier_output, engine="openpyxl") as writer:
-            df_final_sorted.to_excel(writer, sheet_name="Detaliat", index=False)
-            df_sumar.to_excel(writer, sheet_name="Sumar", index=False)
-            
-            # Formatează celulele de procente în sheet-ul Sumar cu openpyxl
-            from openpyxl.styles import NamedStyle
-            from openpyxl.utils import get_column_letter
-            
-            workbook = writer.book
-            worksheet_sumar = writer.sheets["Sumar"]
-            
-            # Definește stilul pentru procente
-            percentage_style = NamedStyle(name="percentage")
-            percentage_style.number_format = "0.00%"
-            
-            # Aplică formatul pentru coloanele de procente (F și G)
-            for row in range(2, len(df_sumar) + 2):  # începe de la rândul 2 (după header)
-                # Coloana F = "Procent Iesire Centru"
-                cell_f = worksheet_sumar[f'F{row}']
-                cell_f.number_format = "0.00%"
-                
-                # Coloana G = "Procent Intrare Hub"
-                cell_g = worksheet_sumar[f'G{row}']
-                cell_g.number_format = "0.00%"
-        
-        print(f"Raportul Statie-Hub a fost salvat în: {fisier_output}")
+        fisier_iesire/fisier_intrare pot fi căi CSV sau DataFrame-uri deja extrase.
+        """
+        self._sumarizeaza_directie(STATIE_HUB, fisier_iesire, fisier_intrare, fisier_output)
     
     def sumarizeaza_date_logistice_hub_statie(self, fisier_iesire, fisier_intrare, fisier_output):
-        """Generează raportul Hub-Statie (similar cu al doilea script)"""
-        print(f"Generez raportul Hub-Statie...")
-        
-        df_iesire = pd.read_csv(fisier_iesire, parse_dates=['Scanare'])
-        df_intrare = pd.read_csv(fisier_intrare, parse_dates=['Scanare'])
-        rute = pd.read_csv(self.fisier_rute)
-        
-        df_echivalenta = pd.read_excel(self.fisier_echivalenta, sheet_name='Sheet1')
-        
-        conditii_filtrare = lambda df: (
-            df['Categorie'].isin(['Colete', 'Paleti']) &
-            df['Ruta'].isin(rute['Denumire'])
-        )
-        
-        df_iesire = df_iesire[conditii_filtrare(df_iesire) & (df_iesire['Centru'] == self.hub_config['nume'])]
-        df_intrare = df_intrare[conditii_filtrare(df_intrare) & (df_intrare['Centru'] != self.hub_config['nume'])]
-        
-        coloane_necesare = ['CodBare', 'Ruta', 'Centru exp', 'Centru dest', 
-                             'Expeditor', 'Destinatar', 'bucati', 'Greutate', 
-                             'Categorie', 'Scanare', 'User']
-        
-        df_iesire = df_iesire[coloane_necesare].rename(columns={
-            'Ruta': 'Ruta Iesire HUB',
-            'Scanare': 'DataScanare Iesire Centru',
-            'User': 'User_iesire'
-        })
-        
-        df_intrare = df_intrare[coloane_necesare].rename(columns={
-            'Ruta': 'Ruta Intrare Centru',
-            'Scanare': 'DataScanare Intrare Centru',
-            'User': 'User_intrare'
-        })
-        
-        df_final = pd.merge(
-            df_iesire, 
-            df_intrare, 
-            on=['CodBare'], 
-            how='outer',
-            suffixes=('_iesire', '_intrare')
-        )
-        
-        for col in ['Centru exp', 'Centru dest', 'Expeditor', 'Destinatar', 
-                    'bucati', 'Greutate', 'Categorie']:
-            df_final[col] = df_final[f'{col}_iesire'].fillna(df_final[f'{col}_intrare']).infer_objects(copy=False)
-            df_final = df_final.drop([f'{col}_iesire', f'{col}_intrare'], axis=1)
-        
-        df_final['User'] = df_final['User_iesire']
-        df_final = df_final.drop(['User_iesire', 'User_intrare'], axis=1)
-        
-        df_final['Data'] = df_final['DataScanare Iesire Centru'].fillna(
-            df_final['DataScanare Intrare Centru']
-        ).infer_objects(copy=False)
+        """Generează raportul Hub-Statie (similar cu al doilea script)
         
-        df_final['Greutate Medie'] = df_final.apply(
-            lambda row: round(row['Greutate'] / row['bucati'], 2) if row['bucati'] != 0 else 0,
-            axis=1
-        )
-        
-        dict_echivalenta = dict(zip(df_echivalenta.iloc[:, 1], df_echivalenta.iloc[:, 2]))
-        
-        df_final['Ruta Iesire HUB'] = df_final.apply(
-            lambda row: dict_echivalenta.get(row['Ruta Intrare Centru']) 
-            if pd.isna(row['Ruta Iesire HUB']) and row['Ruta Intrare Centru'] in dict_echivalenta
-            else row['Ruta Iesire HUB'],
-            axis=1
-        )
-        
-        # Creez coloane helper pentru contorizare
-        df_final['has_scan_iesire'] = df_final['DataScanare Iesire Centru'].notna()
-        df_final['has_scan_intrare'] = df_final['DataScanare Intrare Centru'].notna()
-        
-        df_sumar = df_final.groupby("Ruta Iesire HUB").agg(
-            **{
-                "Nr Colete": ("Ruta Iesire HUB", "count"),
-                "Greutate": ("Greutate Medie", "sum"),
-                "Scan iesire HUB": ("has_scan_iesire", "sum"),
-                "Scan intrare Centru": ("has_scan_intrare", "sum")
-            }
-        ).reset_index().rename(columns={"Ruta Iesire HUB": "Ruta"})
-        
-        df_sumar["Procent Iesire HUB"] = df_sumar.apply(
-            lambda row: row["Scan iesire HUB"] / row["Nr Colete"] if row["Nr Colete"] != 0 else 0,
-            axis=1
-        )
-        df_sumar["Procent Intrare Centru"] = df_sumar.apply(
-            lambda row: row["Scan intrare Centru"] / row["Nr Colete"] if row["Nr Colete"] != 0 else 0,
-            axis=1
-        )
-        
-        total_nr_colete = int(df_sumar["Nr Colete"].sum())
-        total_greutate = float(df_sumar["Greutate"].sum())
-        total_scan_iesire = int(df_sumar["Scan iesire HUB"].sum())
-        total_scan_intrare = int(df_sumar["Scan intrare Centru"].sum())
-        total_procent_iesire = total_scan_iesire / total_nr_colete if total_nr_colete != 0 else 0
-        total_procent_intrare = total_scan_intrare / total_nr_colete if total_nr_colete != 0 else 0
-
-        total_row = pd.DataFrame({
-            "Ruta": ["Total"],
-            "Nr Colete": [total_nr_colete],
-            "Greutate": [total_greutate],
-            "Scan iesire HUB": [total_scan_iesire],
-            "Scan intrare Centru": [total_scan_intrare],
-            "Procent Iesire HUB": [total_procent_iesire],
-            "Procent Intrare Centru": [total_procent_intrare]
-        })
-        df_sumar = pd.concat([df_sumar, total_row], ignore_index=True)
-        
-        def formula_user(idx, ruta):
-            if ruta == "Total":
-                return ""
-            else:
-                return f"=VLOOKUP(A{idx+2},Detaliat!B:M,12,FALSE)"
-        
-        df_sumar["User:"] = [formula_user(idx, row["Ruta"]) for idx, row in df_sumar.iterrows()]
-        
-        # Sortează df_final după coloana User
-        df_final_sorted = df_final.sort_values('User', na_position='last')
-        
-        with pd.ExcelWriter(fisier_output, engine="openpyxl") as writer:
-            df_final_sorted.to_excel(writer, sheet_name="Detaliat", index=False)
-            df_sumar.to_excel(writer, sheet_name="Sumar", index=False)
-            
-            # Formatează celulele de procente în sheet-ul Sumar cu openpyxl
-            from openpyxl.styles import NamedStyle
-            from openpyxl.utils import get_column_letter
-            
-            workbook = writer.book
-            worksheet_sumar = writer.sheets["Sumar"]
-            
-            # Definește stilul pentru procente
-            percentage_style = NamedStyle(name="percentage")
-            percentage_style.number_format = "0.00%"
-            
-            # Aplică formatul pentru coloanele de procente (F și G)
-            for row in range(2, len(df_sumar) + 2):  # începe de la rândul 2 (după header)
-                # Coloana F = "Procent Iesire HUB"
-                cell_f = worksheet_sumar[f'F{row}']
-                cell_f.number_format = "0.00%"
-                
-                # Coloana G = "Procent Intrare Centru"
-                cell_g = worksheet_sumar[f'G{row}']
-                cell_g.number_format = "0.00%"
-        
-        print(f"Raportul Hub-Statie a fost salvat în: {fisier_output}")
+        fisier_iesire/fisier_intrare pot fi căi CSV sau DataFrame-uri deja extrase.
+        """
+        self._sumarizeaza_directie(HUB_STATIE, fisier_iesire, fisier_intrare, fisier_output)
     
     def sterge_fisiere_temporare(self, fisiere_temp):
         """Șterge fișierele temporare create"""
@@ -456,45 +326,176 @@ class UnifiedHubReportGenerator:
                     os.remove(fisier)
                     print(f"Șters fișier temporar: {fisier}")
     
-    def genereaza_rapoarte(self):
-        """Generează ambele rapoarte pornind de la fișierul master"""
-        try:
-            # Generează fișierele temporare
-            fisiere_temp = self.genereaza_fisiere_temporare()
-            
-            # Generează output-urile cu numele hub-ului
-            data_str = self.data_raport.strftime("%d.%m")
-            data_urmatoare_str = (self.data_raport + timedelta(days=1)).strftime("%d.%m")
-            hub_nume = self.hub_config['nume'].capitalize()
-            
-            output_statie_hub = f"{self.base_url}Raport Statie-Hub {hub_nume} {data_str}-{data_urmatoare_str}.xlsx"
-            output_hub_statie = f"{self.base_url}Raport HUB-Statie {hub_nume} {data_str}-{data_urmatoare_str}.xlsx"
-            
-            # Generează primul raport (Statie-Hub)
-            self.sumarizeaza_date_logistice_statie_hub(
-                fisiere_temp['statie_hub']['iesire'],
-                fisiere_temp['statie_hub']['intrare'],
-                output_statie_hub
-            )
-            
-            # Generează al doilea raport (Hub-Statie)
-            self.sumarizeaza_date_logistice_hub_statie(
-                fisiere_temp['hub_statie']['iesire'],
-                fisiere_temp['hub_statie']['intrare'],
-                output_hub_statie
+    def fisiere_output(self):
+        """Căile rapoartelor xlsx, cu numele hub-ului: {'statie_hub': ..., 'hub_statie': ...}"""
+        data_str = self.data_raport.strftime("%d.%m")
+        data_urmatoare_str = (self.data_raport + timedelta(days=1)).strftime("%d.%m")
+        hub_nume = self.hub_config['nume'].capitalize()
+        
+        return {
+            'statie_hub': f"{self.base_url}Raport Statie-Hub {hub_nume} {data_str}-{data_urmatoare_str}.xlsx",
+            'hub_statie': f"{self.base_url}Raport HUB-Statie {hub_nume} {data_str}-{data_urmatoare_str}.xlsx"
+        }
+    
+    def sarcini_raport(self, surse=None):
+        """Câte o sarcină independentă pe direcție (pentru procese worker)
+        
+        Cu sursa='partajat', sarcina conține doar definițiile ferestrelor: fiecare worker le filtrează
+        din fișierul Arrow mapat în memorie, fără ca master-ul sau ferestrele să fie copiate între procese.
+        Altfel ferestrele sunt extrase aici (surse sau _surse()) și transmise worker-ilor.
+        """
+        fisiere = self.fisiere_output()
+        optiuni = {
+            'politica_duplicate': self.politica_duplicate,
+            'mod_user': self.mod_user,
+            'motor_excel': self.motor_excel,
+            'formate_iesire': self.formate_iesire
+        }
+        if self.sursa == 'partajat' and not self.salveaza_temporare:
+            ferestre = self.calculeaza_ferestre()
+            surse_sarcini = {
+                cheie: {parte: ferestre[fereastra] for parte, fereastra in ferestre_directie.items()}
+                for cheie, ferestre_directie in FERESTRE_DIRECTII.items()
+            }
+            master_partajat = self.publica_master_partajat()
+        else:
+            surse = surse or self._surse()
+            # Doar coloanele folosite de rapoarte sunt trimise procesului worker
+            surse_sarcini = {
+                cheie: {parte: self._incarca_fereastra(sursa)[COLOANE_SARCINA] for parte, sursa in parti.items()}
+                for cheie, parti in surse.items()
+            }
+            master_partajat = None
+        
+        return [
+            SarcinaRaport(
+                hub=self.hub_config['nume'],
+                directie=directie.cheie,
+                surse=surse_sarcini[directie.cheie],
+                fisier_output=fisiere[directie.cheie],
+                fisiere_referinta=(self.fisier_rute, self.fisier_echivalenta, self.fisier_fara_scan),
+                optiuni=optiuni,
+                master_partajat=master_partajat
             )
+            for directie in DIRECTII
+        ]
+    
+    def genereaza_rapoarte(self, procese=None):
+        """Generează ambele rapoarte pornind de la fișierul master
+        
+        procese: numărul de procese worker; cu mai mult de un proces, Statie-Hub și Hub-Statie
+        sunt construite în paralel după extragerea ferestrelor.
+        Returnează foile Sumar ale ambelor rapoarte: {'statie_hub'/'hub_statie': DataFrame}.
+        """
+        try:
+            if procese and procese > 1:
+                rezultate = executa_sarcini(self.sarcini_raport(), procese)
+                erori = [r for r in rezultate if r.eroare is not None]
+                if erori:
+                    raise RuntimeError('; '.join(f"{r.directie}: {r.eroare}" for r in erori))
+                fisiere_scrise = {r.directie: r.fisiere for r in rezultate}
+                self.sumare = {r.directie: r.sumar for r in rezultate}
+            else:
+                # Ambele rapoarte (Statie-Hub, apoi Hub-Statie) din aceleași scanări filtrate;
+                # în mod debug ferestrele sunt scrise și păstrate ca temp_*.csv în base_url
+                fisiere_scrise = self.sumarizeaza_rapoarte(self._surse(), self.fisiere_output())
             
-            # Șterge fișierele temporare
-            self.sterge_fisiere_temporare(fisiere_temp)
+            if self.salveaza_temporare:
+                print(f"🔍 Fișierele temporare au fost păstrate pentru debug în: {self.base_url}")
             
             print(f"\n✅ Rapoartele au fost generate cu succes!")
-            print(f"📊 Raport Statie-Hub: {output_statie_hub}")
-            print(f"📊 Raport Hub-Statie: {output_hub_statie}")
+            print(f"📊 Raport Statie-Hub: {', '.join(fisiere_scrise['statie_hub'])}")
+            print(f"📊 Raport Hub-Statie: {', '.join(fisiere_scrise['hub_statie'])}")
+            return self.sumare
             
         except Exception as e:
             print(f"❌ Eroare la generarea rapoartelor: {str(e)}")
             raise
 
+
+def raporteaza_duplicate(directie, duplicate, politica_duplicate):
+    """Afișează scanările duplicate găsite pe fiecare parte a unei direcții"""
+    for parte, numar in duplicate.items():
+        if numar == 0:
+            continue
+        if politica_duplicate is None:
+            print(f"⚠️ {numar} scanări duplicate pe CodBare ({parte}, {directie.nume}) - "
+                  f"join-ul le combină între ele (vezi politica_duplicate)")
+        else:
+            print(f"Eliminat {numar} scanări duplicate ({parte}, {directie.nume}, politica '{politica_duplicate}')")
+
+
+# Ferestrele din care se construiește fiecare raport: {direcție: {parte: fereastră}}
+FERESTRE_DIRECTII = {
+    'statie_hub': {'iesire': 'iesire_centru', 'intrare': 'intrare_hub'},
+    'hub_statie': {'iesire': 'iesire_hub', 'intrare': 'intrare_centru'}
+}
+
+# Coloanele ferestrelor de care are nevoie un raport (filtrare + Detaliat)
+COLOANE_SARCINA = COLOANE_NECESARE + ['Centru']
+
+# Un raport (hub + direcție) construit independent, eventual într-un proces worker.
+# master_partajat: calea fișierului Arrow din care worker-ul filtrează ferestrele din `surse`
+# (FereastraScanare); None când `surse` conține deja DataFrame-urile ferestrelor.
+SarcinaRaport = namedtuple(
+    'SarcinaRaport',
+    ['hub', 'directie', 'surse', 'fisier_output', 'fisiere_referinta', 'optiuni', 'master_partajat']
+)
+
+# Rezultatul unei sarcini: fișierele scrise și foaia Sumar, sau mesajul de eroare
+RezultatSarcina = namedtuple('RezultatSarcina', ['hub', 'directie', 'fisiere', 'sumar', 'eroare', 'secunde'])
+
+
+def executa_sarcina_raport(sarcina):
+    """Construiește și scrie un singur raport; funcție de nivel modul, apelabilă din ProcessPoolExecutor"""
+    start = time.perf_counter()
+    directie = next(d for d in DIRECTII if d.cheie == sarcina.directie)
+    date_referinta = incarca_date_referinta(*sarcina.fisiere_referinta)
+    surse = sarcina.surse
+    if sarcina.master_partajat is not None:
+        surse = ferestre_partajate(sarcina.master_partajat, surse)
+    
+    scanari = pregateste_scanari(
+        {directie.cheie: surse}, sarcina.hub, date_referinta.rute, sarcina.optiuni['politica_duplicate']
+    )
+    raporteaza_duplicate(directie, scanari.duplicate[directie.cheie], sarcina.optiuni['politica_duplicate'])
+    df_detaliat, df_sumar = calculeaza_raport(scanari, directie, date_referinta, sarcina.optiuni['mod_user'])
+    fisiere = scrie_raport(
+        sarcina.fisier_output, df_detaliat, df_sumar, sarcina.optiuni['motor_excel'],
+        formate_iesire=sarcina.optiuni['formate_iesire']
+    )
+    return fisiere, df_sumar, time.perf_counter() - start
+
+
+def executa_sarcini(sarcini, procese=None, executor=None):
+    """
+    Execută sarcinile de raport într-un ProcessPoolExecutor cu `procese` workeri (implicit câte nuclee
+    are sistemul). O eroare într-o sarcină nu le oprește pe celelalte; fiecare sarcină primește
+    un RezultatSarcina, în ordinea din `sarcini`.
+    executor: un ProcessPoolExecutor deja pornit (ex: comun tuturor datelor unui interval), altfel
+    se pornește unul doar pentru aceste sarcini.
+    """
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=procese) as executor:
+            return executa_sarcini(sarcini, procese, executor)
+    
+    start = time.perf_counter()
+    print(f"⚙️ Construiesc {len(sarcini)} rapoarte în paralel ({procese or os.cpu_count()} procese)...")
+    
+    rezultate = []
+    viitoare = [executor.submit(executa_sarcina_raport, sarcina) for sarcina in sarcini]
+    for sarcina, viitor in zip(sarcini, viitoare):
+        try:
+            fisiere, df_sumar, secunde = viitor.result()
+            rezultate.append(RezultatSarcina(sarcina.hub, sarcina.directie, fisiere, df_sumar, None, secunde))
+            print(f"✅ {sarcina.hub} {sarcina.directie}: {', '.join(fisiere)} ({secunde:.1f}s)")
+        except Exception as e:
+            rezultate.append(RezultatSarcina(sarcina.hub, sarcina.directie, [], None, str(e), None))
+            print(f"❌ {sarcina.hub} {sarcina.directie}: {str(e)}")
+    
+    print(f"⏱️ Rapoarte paralele finalizate în {time.perf_counter() - start:.1f}s")
+    return rezultate
+
 # Configurații predefinite pentru hub-uri
 BRASOV_CONFIG = {
     'nume': 'BRASOV',
@@ -522,6 +523,9 @@ SIBIU_CONFIG = {
     'iesire_end_minute': 0
 }
 
+# Hub-urile pentru care se generează rapoarte în mod implicit
+HUB_CONFIGS = [BRASOV_CONFIG, SIBIU_CONFIG]
+
 def create_brasov_generator(fisier_master, data_raport, base_url):
     """Creează generator pentru hub-ul Brașov"""
     return UnifiedHubReportGenerator(fisier_master, data_raport, base_url, BRASOV_CONFIG)
@@ -562,19 +566,142 @@ def generate_sibiu_reports(data_raport, base_url=None):
     generator.genereaza_rapoarte()
     return True
 
-def generate_all_hub_reports(data_raport, base_url=None):
-    """Generează rapoarte pentru toate hub-urile"""
+def genereaza_rapoarte_hub_uri(fisier_master, data_raport, base_url, configuratii=None, foloseste_cache=True,
+                               index=None, motor_citire='pandas', politica_duplicate=None, mod_user='formula',
+                               procese=None, sursa='master', sumare=None, motor_excel=MOTOR_EXCEL_IMPLICIT,
+                               formate_iesire=None, executor=None):
+    """Generează rapoartele Statie-Hub și Hub-Statie pentru mai multe hub-uri dintr-o singură încărcare a master-ului
+    
+    procese: cu mai mult de un proces, ferestrele tuturor hub-urilor sunt extrase în procesul curent,
+    apoi toate rapoartele (hub x direcție) sunt construite în paralel (în `executor`, dacă este dat).
+    sursa='partajat': master-ul este publicat o dată ca fișier Arrow mapat în memorie, iar fiecare
+    worker își filtrează singur ferestrele din el (fără încărcarea master-ului în procesul curent).
+    sumare: dicționar opțional completat cu foile Sumar ale hub-urilor reușite,
+    {nume_hub: {'statie_hub'/'hub_statie': DataFrame}} (ex: pentru salvarea în istoric fără recitirea Excel).
+    motor_excel, formate_iesire: ca în UnifiedHubReportGenerator, pentru toate hub-urile.
+    Returnează un dicționar {nume_hub: True/False} cu rezultatul pentru fiecare hub.
+    """
+    configuratii = configuratii or HUB_CONFIGS
+    
+    # Master-ul este încărcat și indexat (sau publicat) o singură dată, indiferent de numărul de hub-uri;
+    # sursele 'stream' și 'partitii' citesc doar ferestrele, fără încărcarea master-ului în memorie
+    if sursa == 'partajat':
+        publica_master_partajat(fisier_master, foloseste_cache=foloseste_cache, motor_citire=motor_citire)
+    if sursa != 'master':
+        index = None
+    elif index is None:
+        print("Se încarcă fișierul master (comun pentru toate hub-urile)...")
+        index = obtine_index_master(fisier_master, foloseste_cache, motor_citire)
+    
+    rezultate = {}
+    sarcini = []
+    for config in configuratii:
+        hub_nume = config['nume'].capitalize()
+        print(f"\n🏗️ Generez rapoarte pentru hub-ul {hub_nume}...")
+        try:
+            generator = UnifiedHubReportGenerator(
+                fisier_master, data_raport, base_url, config,
+                foloseste_cache=foloseste_cache, sursa=sursa, index=index, motor_citire=motor_citire,
+                politica_duplicate=politica_duplicate, mod_user=mod_user,
+                motor_excel=motor_excel, formate_iesire=formate_iesire
+            )
+            if procese and procese > 1:
+                sarcini.extend(generator.sarcini_raport())
+            else:
+                sumare_hub = generator.genereaza_rapoarte()
+                if sumare is not None:
+                    sumare[config['nume']] = sumare_hub
+            rezultate[config['nume']] = True
+        except Exception as e:
+            print(f"❌ Eroare la generarea rapoartelor pentru {hub_nume}: {str(e)}")
+            rezultate[config['nume']] = False
+    
+    if sarcini:
+        sumare_paralele = {}
+        for rezultat in executa_sarcini(sarcini, procese, executor):
+            if rezultat.eroare is not None:
+                rezultate[rezultat.hub] = False
+            sumare_paralele.setdefault(rezultat.hub, {})[rezultat.directie] = rezultat.sumar
+        if sumare is not None:
+            sumare.update({hub: s for hub, s in sumare_paralele.items() if rezultate[hub]})
+    
+    return rezultate
+
+def genereaza_rapoarte_interval(fisier_master, data_start, data_end, base_url, configuratii=None,
+                                foloseste_cache=True, sari_weekend=False, motor_citire='pandas',
+                                politica_duplicate=None, mod_user='formula', procese=None, sursa='master',
+                                motor_excel=MOTOR_EXCEL_IMPLICIT, formate_iesire=None):
+    """Generează rapoartele pentru toate datele dintre data_start și data_end (inclusiv, format YYYY-MM-DD)
+    
+    Fișierul master este încărcat și sortat o singură dată; ferestrele fiecărei date (inclusiv
+    regula vineri -> weekend) sunt extrase din același index. Util pentru refacerea rapoartelor
+    pe o lună după o modificare de configurație.
+    Returnează un dicționar {data: {nume_hub: True/False}}.
+    """
+    start = datetime.strptime(data_start, "%Y-%m-%d")
+    end = datetime.strptime(data_end, "%Y-%m-%d")
+    if end < start:
+        raise ValueError(f"Intervalul este invalid: {data_start} > {data_end}")
+    
+    print(f"🗓️ Generez rapoarte pentru intervalul {data_start} - {data_end}...")
+    index = None
+    if sursa == 'partajat':
+        publica_master_partajat(fisier_master, foloseste_cache=foloseste_cache, motor_citire=motor_citire)
+    elif sursa == 'master':
+        print("Se încarcă fișierul master (comun pentru tot intervalul)...")
+        index = obtine_index_master(fisier_master, foloseste_cache, motor_citire)
+    
+    # Procesele worker sunt pornite o singură dată pentru tot intervalul (nu pentru fiecare dată)
+    executor = ProcessPoolExecutor(max_workers=procese) if procese and procese > 1 else None
+    rezultate = {}
+    data = start
+    try:
+        while data <= end:
+            # Vinerea acoperă deja weekendul (intrare centru până luni 16:59)
+            if not (sari_weekend and data.weekday() >= 5):
+                data_raport = data.strftime("%Y-%m-%d")
+                print(f"\n📅 Data raport: {data_raport}")
+                rezultate[data_raport] = genereaza_rapoarte_hub_uri(
+                    fisier_master, data_raport, base_url, configuratii,
+                    foloseste_cache=foloseste_cache, index=index, motor_citire=motor_citire,
+                    politica_duplicate=politica_duplicate, mod_user=mod_user, procese=procese, sursa=sursa,
+                    motor_excel=motor_excel, formate_iesire=formate_iesire, executor=executor
+                )
+            data += timedelta(days=1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    total = sum(len(r) for r in rezultate.values())
+    reusite = sum(sum(r.values()) for r in rezultate.values())
+    print(f"\n✅ Interval finalizat: {reusite}/{total} generări hub-dată reușite")
+    return rezultate
+
+def generate_all_hub_reports(data_raport, base_url=None, procese=None, motor_excel=MOTOR_EXCEL_IMPLICIT,
+                             formate_iesire=None):
+    """Generează rapoarte pentru toate hub-urile (procese > 1: rapoartele sunt construite în paralel)"""
+    if base_url is None:
+        base_url = '/Users/telermarius/Library/CloudStorage/Dropbox/DSC/Rapoarte/HUB Brasov/'
+    
     print(f"🏗️ Generez rapoarte pentru toate hub-urile...")
     
-    brasov_success = generate_brasov_reports(data_raport, base_url)
-    sibiu_success = generate_sibiu_reports(data_raport, base_url)
+    fisier_master = f"{base_url}master_data.csv"
+    
+    if not os.path.exists(fisier_master):
+        print(f"❌ Fișierul master nu există: {fisier_master}")
+        print(f"❌ Nu s-au putut genera rapoarte.")
+        return
+    
+    rezultate = genereaza_rapoarte_hub_uri(
+        fisier_master, data_raport, base_url, procese=procese,
+        motor_excel=motor_excel, formate_iesire=formate_iesire
+    )
+    reusite = [nume.capitalize() for nume, succes in rezultate.items() if succes]
     
-    if brasov_success and sibiu_success:
+    if len(reusite) == len(rezultate):
         print(f"✅ Toate rapoartele au fost generate cu succes!")
-    elif brasov_success:
-        print(f"⚠️ Doar rapoartele pentru Brașov au fost generate.")
-    elif sibiu_success:
-        print(f"⚠️ Doar rapoartele pentru Sibiu au fost generate.")
+    elif reusite:
+        print(f"⚠️ Doar rapoartele pentru {', '.join(reusite)} au fost generate.")
     else:
         print(f"❌ Nu s-au putut genera rapoarte.")
 